@@ -2,25 +2,48 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+import copy
+import functools
+import importlib
+import json
+import os
+import re
+import string
+import threading
+import time
+import types
+from moteur_inde import (
+    ANNEE_DEBUT, ANNEE_FIN, ANNEE_PROJECTION, PARAMETRES_DEFAUT, PLAGE_SENSIBILITE, RESOLUTIONS, SCENARIOS, CalculIncremental, CataloguesPartages,
+    DatasetSimulations, ModelePrevision, MoteurSimulationInde, creer_pool_calcul, generer_axe_temporel, rapport_memoire,
+    taille_profonde
+)
+from export_rapport import ExportRapport, png_disponible
+from sources_donnees import TABLES_REFERENCE, catalogue_depuis_table, ouvrir_source, precharger
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configuration de la page
-st.set_page_config(
-    page_title="Analyse Stratégique Avancée - Inde",
-    page_icon="🐘",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+class ModuleDiffere:
+    """Module importé au premier accès à l'un de ses attributs (démarrage à froid plus rapide)"""
+    
+    def __init__(self, nom):
+        self._nom = nom
+        self._module = None
+    
+    def __getattr__(self, attribut):
+        if self._module is None:
+            self._module = importlib.import_module(self._nom)
+        return getattr(self._module, attribut)
+
+# Plotly n'est chargé qu'au rendu de la première section qui construit une figure
+px = ModuleDiffere('plotly.express')
+go = ModuleDiffere('plotly.graph_objects')
 
 # CSS personnalisé avancé
-st.markdown("""
+CSS_PERSONNALISE = """
 <style>
     .main-header {
         font-size: 2.8rem;
@@ -91,339 +114,559 @@ st.markdown("""
         border-radius: 10px;
         margin: 0.5rem 0;
     }
+    .grille-cartes {
+        display: grid;
+        gap: 1rem;
+        align-items: start;
+    }
+    .header-box {
+        text-align: center;
+        background: linear-gradient(135deg, #FF9933, #138808);
+        padding: 1rem;
+        border-radius: 10px;
+        color: white;
+        margin: 1rem auto;
+        max-width: 50%;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-class DefenseIndeDashboardAvance:
-    def __init__(self):
-        self.branches_options = self.define_branches_options()
-        self.programmes_options = self.define_programmes_options()
-        self.missile_systems = self.define_missile_systems()
-        self.naval_assets = self.define_naval_assets()
-        
-    def define_branches_options(self):
-        return [
-            "Forces Armées Indiennes", "Armée de Terre Indienne", "Marine Indienne", 
-            "Force Aérienne Indienne", "Forces Stratégiques", "Garde Côtière Indienne",
-            "Forces Spéciales", "Commandement des Forces Intégrées"
-        ]
+# CSS compacté une fois par processus : Streamlit retire au rerun tout élément non ré-émis,
+# la feuille de style est donc renvoyée à chaque exécution, au plus petit volume possible
+CSS_COMPACT = re.sub(r'\s*([{}:;,])\s*', r'\1', re.sub(r'\s+', ' ', CSS_PERSONNALISE)).strip()
+
+def configurer_page():
+    """Configuration de la page et CSS ; appelée uniquement par l'application Streamlit"""
+    st.set_page_config(
+        page_title="Analyse Stratégique Avancée - Inde",
+        page_icon="🐘",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(CSS_COMPACT, unsafe_allow_html=True)
+
+class RenduCartes:
+    """Composition des cartes HTML à partir de gabarits compilés une fois.
     
-    def define_programmes_options(self):
-        return [
-            "Programme Nucléaire Stratégique", "Modernisation des Forces", 
-            "Make in India - Défense", "Défense Aérienne Intégrée",
-            "Maritime Domain Awareness", "Cybersécurité", "Espace Militaire"
-        ]
+    Une section entière (grille de cartes comprise) est émise en un seul élément
+    Markdown au lieu d'un appel par carte et par colonne.
+    """
     
-    def define_missile_systems(self):
-        return {
-            "Agni-V": {"type": "ICBM", "portee": 5000, "ogives": 3, "statut": "Opérationnel"},
-            "Agni-IV": {"type": "IRBM", "portee": 4000, "ogives": 1, "statut": "Opérationnel"},
-            "Agni-III": {"type": "IRBM", "portee": 3000, "ogives": 1, "statut": "Opérationnel"},
-            "Prithvi-II": {"type": "MRBM", "portee": 350, "ogives": "Conventionnelle/Nucléaire", "statut": "Opérationnel"},
-            "BrahMos": {"type": "Missile de Croisière", "portee": 450, "vitesse": "Mach 2.8", "statut": "Opérationnel"}
-        }
+    CARTE = string.Template('<div class="$classe"><h4>$titre</h4>$corps</div>')
+    METRIQUE = string.Template('<div class="$classe"><h4>$titre</h4><h2>$valeur</h2><p>$legende</p></div>')
+    LIGNE = string.Template('<p><strong>$libelle:</strong> $texte</p>')
+    POINT = string.Template('<div><strong>• $libelle:</strong> $texte</div>')
+    BLOC = string.Template('<div><h5>$titre</h5><p>$elements</p></div>')
+    SOUS_CARTE = string.Template('<div class="$classe" style="margin: 0.5rem 0;"><strong>$titre</strong><p>$texte</p></div>')
+    GRILLE = string.Template('<div class="grille-cartes" style="grid-template-columns: repeat($colonnes, 1fr);$style">$contenu</div>')
     
-    def define_naval_assets(self):
-        return {
-            "INS Vikramaditya": {"type": "Porte-avions", "deplacement": 45000, "avions": 36, "statut": "Opérationnel"},
-            "INS Vikrant": {"type": "Porte-avions", "deplacement": 40000, "avions": 30, "statut": "Opérationnel"},
-            "INS Kolkata": {"type": "Destroyer", "deplacement": 7500, "armement": "Brahmos", "statut": "Opérationnel"},
-            "INS Arihant": {"type": "Sous-marin Nucléaire", "deplacement": 6000, "missiles": "K-15", "statut": "Opérationnel"},
-            "INS Chakra": {"type": "Sous-marin Nucléaire", "deplacement": 8000, "torpilles": "Type 53", "statut": "Opérationnel"}
-        }
+    @classmethod
+    def carte(cls, classe, titre, corps):
+        return cls.CARTE.substitute(classe=classe, titre=titre, corps=corps)
     
-    def generate_advanced_data(self, selection):
-        """Génère des données avancées et détaillées pour l'Inde"""
-        annees = list(range(2000, 2028))
-        
-        config = self.get_advanced_config(selection)
-        
-        data = {
-            'Annee': annees,
-            'Budget_Defense_Mds': self.simulate_advanced_budget(annees, config),
-            'Personnel_Milliers': self.simulate_advanced_personnel(annees, config),
-            'PIB_Militaire_Pourcent': self.simulate_military_gdp_percentage(annees),
-            'Exercices_Militaires': self.simulate_advanced_exercises(annees, config),
-            'Readiness_Operative': self.simulate_advanced_readiness(annees),
-            'Capacite_Dissuasion': self.simulate_advanced_deterrence(annees),
-            'Temps_Mobilisation_Jours': self.simulate_advanced_mobilization(annees),
-            'Tests_Missiles': self.simulate_missile_tests(annees),
-            'Developpement_Technologique': self.simulate_tech_development(annees),
-            'Capacite_Artillerie': self.simulate_artillery_capacity(annees),
-            'Couverture_AD': self.simulate_air_defense_coverage(annees),
-            'Resilience_Logistique': self.simulate_logistical_resilience(annees),
-            'Cyber_Capabilities': self.simulate_cyber_capabilities(annees),
-            'Production_Armements': self.simulate_weapon_production(annees)
-        }
-        
-        # Données spécifiques aux programmes
-        if 'nucleaire' in config.get('priorites', []):
-            data.update({
-                'Stock_Ogives_Nucleaires': self.simulate_nuclear_arsenal_size(annees),
-                'Portee_Max_Missiles_Km': self.simulate_missile_range_evolution(annees),
-                'Capacite_Sous_Marine': self.simulate_submarine_capability(annees),
-                'Essais_Souterrains': self.simulate_underground_tests(annees)
-            })
-        
-        if 'modernisation' in config.get('priorites', []):
-            data.update({
-                'Nouveaux_Systemes': self.simulate_new_systems(annees),
-                'Taux_Modernisation': self.simulate_modernization_rate(annees),
-                'Exportations_Armes': self.simulate_weapon_exports(annees)
-            })
-        
-        if 'maritime' in config.get('priorites', []):
-            data.update({
-                'Navires_Combat': self.simulate_naval_fleet(annees),
-                'Portee_Projection_Nm': self.simulate_naval_range(annees),
-                'Exercices_Combines': self.simulate_joint_exercises(annees)
-            })
-        
-        if 'cyber' in config.get('priorites', []):
-            data.update({
-                'Attaques_Cyber_Reussies': self.simulate_cyber_attacks(annees),
-                'Reseau_Commandement_Cyber': self.simulate_cyber_command(annees),
-                'Cyber_Defense_Niveau': self.simulate_cyber_defense(annees)
-            })
-        
-        return pd.DataFrame(data), config
-    
-    def get_advanced_config(self, selection):
-        """Configuration avancée avec plus de détails pour l'Inde"""
-        configs = {
-            "Forces Armées Indiennes": {
-                "type": "armee_totale",
-                "budget_base": 70.0,
-                "personnel_base": 1400,
-                "exercices_base": 120,
-                "priorites": ["nucleaire", "modernisation", "maritime", "cyber", "conventionnel"],
-                "doctrines": ["Dissuasion Crédible", "Défense Active", "Riposte Massive"],
-                "capacites_speciales": ["Forces Rapides", "Guerre Montagne", "Projection Maritime"]
-            },
-            "Forces Stratégiques": {
-                "type": "branche_strategique",
-                "personnel_base": 8,
-                "exercices_base": 15,
-                "priorites": ["triade_nucleaire", "missiles_balistiques", "sous_marins"],
-                "systemes_deployes": ["Agni-V", "Agni-IV", "Arihant", "Rafale"],
-                "commandement": "Commandement des Forces Stratégiques"
-            },
-            "Marine Indienne": {
-                "type": "branche_navale",
-                "personnel_base": 67,
-                "exercices_base": 40,
-                "priorites": ["porte_avions", "sous_marins", "lutte_anti_sous_marine", "projection"],
-                "flottes_principales": ["Flotte Orientale", "Flotte Occidentale", "Flotte du Sud"],
-                "navires_cles": ["Vikramaditya", "Vikrant", "Kolkata", "Arihant"]
-            },
-            "Programme Nucléaire Stratégique": {
-                "type": "programme_strategique",
-                "budget_base": 2.5,
-                "priorites": ["triade_nucleaire", "missiles_intercontinentaux", "sous_marins"],
-                "composantes": ["Forces Terrestres", "Forces Aériennes", "Forces Navales"],
-                "doctrine": "No First Use - Riposte Massive"
+    @classmethod
+    def metrique(cls, classe, titre, valeur, legende):
+        return cls.METRIQUE.substitute(classe=classe, titre=titre, valeur=valeur, legende=legende)
+    
+    @classmethod
+    def grille(cls, elements, colonnes, style=''):
+        return cls.GRILLE.substitute(colonnes=colonnes, style=style, contenu=''.join(elements))
+    
+    @classmethod
+    def lignes(cls, paires):
+        """Paragraphes « libellé : texte »"""
+        return ''.join(cls.LIGNE.substitute(libelle=libelle, texte=texte) for libelle, texte in paires)
+    
+    @classmethod
+    def points(cls, paires, colonnes=2):
+        """Puces « libellé : texte » sur une grille"""
+        return cls.grille([cls.POINT.substitute(libelle=libelle, texte=texte) for libelle, texte in paires],
+                          colonnes, ' margin-top: 1rem;')
+    
+    @classmethod
+    def blocs(cls, blocs, colonnes):
+        """Blocs titrés contenant une liste à puces, sur une grille"""
+        return cls.grille([cls.BLOC.substitute(titre=titre, elements='<br>'.join(f'• {e}' for e in elements))
+                           for titre, elements in blocs], colonnes, ' margin-top: 1rem;')
+    
+    @classmethod
+    def sous_cartes(cls, cartes):
+        return '<div style="margin-top: 1rem;">' + ''.join(
+            cls.SOUS_CARTE.substitute(classe=classe, titre=titre, texte=texte) for classe, titre, texte in cartes
+        ) + '</div>'
+    
+    @staticmethod
+    def emettre(html):
+        """Un seul élément Streamlit pour tout le HTML d'une section"""
+        st.markdown(html, unsafe_allow_html=True)
+
+# Contenu des sections statiques : (classe de carte, titre, contenu)
+CARTES_GEOPOLITIQUE = [
+    ("nuclear-card", "🎯 ENJEUX STRATÉGIQUES RÉGIONAUX", [
+        ("Frontière Chine", "LAC - Line of Actual Control"), ("Frontière Pakistan", "LoC - Line of Control"),
+        ("Océan Indien", "Zone d'influence maritime"), ("Détroit de Malacca", "Route commerciale vitale"),
+    ]),
+    ("strategic-card", "🤝 RELATIONS INTERNATIONALES", [
+        ("États-Unis", "Partenariat stratégique (QUAD)"), ("Russie", "Partenaire militaire traditionnel"),
+        ("France", "Coopération technologique avancée"), ("Japon/Australie", "Coopération indo-pacifique"),
+    ]),
+]
+CARTES_DOCTRINE = [
+    ("nuclear-card", "🎯 DOCTRINE NUCLÉAIRE", [
+        ("No First Use", "Non-emploi en premier"), ("Dissuasion crédible", "Riposte massive"),
+        ("Triade nucléaire", "Terre, air, mer"), ("Contrôle civil", "Autorité politique"),
+    ]),
+    ("strategic-card", "⚡ DOCTRINE DE DÉFENSE ACTIVE", [
+        ("Cold Start", "Réponse rapide limitée"), ("Défense en profondeur", "Défense échelonnée"),
+        ("Mobilité stratégique", "Rapidité de déploiement"), ("Coordination interarmes", "Synergie des forces"),
+    ]),
+    ("air-force-card", "🌊 DOCTRINE MARITIME", [
+        ("Sea Control", "Contrôle des voies maritimes"), ("Sea Denial", "Déni d'accès à l'adversaire"),
+        ("Projection de puissance", "Force expéditionnaire"), ("Coopération régionale", "Sécurité collective"),
+    ]),
+]
+PRINCIPES_OPERATIONNELS = ("navy-card", "🎖️ PRINCIPES OPÉRATIONNELS DES FORCES ARMÉES INDIENNES", [
+    ("Unité de commandement", "Coordination centralisée"), ("Mobilité et surprise", "Opérations rapides"),
+    ("Utilisation du terrain", "Avantage montagneux"), ("Guerre intégrée", "Coordination interarmes"),
+    ("Soutien logistique", "Chaîne d'approvisionnement"), ("Préparation permanente", "État d'alerte"),
+])
+RECOMMANDATIONS_MENACES = ("nuclear-card", "🎯 RECOMMANDATIONS STRATÉGIQUES", [
+    ("Renforcement nucléaire", "Compléter la triade"), ("Modernisation conventionnelle", "Equipements avancés"),
+    ("Défense aérienne", "Systèmes intégrés"), ("Puissance navale", "Projection dans l'océan Indien"),
+    ("Cyber défense", "Protection des infrastructures"), ("Autosuffisance", "Programme Make in India"),
+])
+SYNTHESE_POINTS_FORTS = ("nuclear-card", "🏆 POINTS FORTS STRATÉGIQUES", [
+    ("strategic-card", "☢️ Statut de Puissance Nucléaire",
+     "Triade nucléaire en développement avec doctrine de non-emploi en premier"),
+    ("navy-card", "🌊 Puissance Navale Croissante",
+     "Deux porte-avions opérationnels et flotte en modernisation accélérée"),
+    ("air-force-card", "✈️ Force Aérienne Moderne",
+     "Mix d'avions occidentaux et russes avec développement de capacités indigènes"),
+    ("army-card", "🏔️ Expertise en Guerre de Montagne",
+     "Forces spécialisées dans le combat en haute altitude et conditions extrêmes"),
+])
+SYNTHESE_DEFIS = ("strategic-card", "🎯 DÉFIS ET VULNÉRABILITÉS", [
+    ("strategic-card", "💸 Dépendance aux Importations",
+     "70% des équipements militaires encore importés malgré Make in India"),
+    ("strategic-card", "🔧 Retards Technologiques", "Certains programmes indigènes connaissent des retards importants"),
+    ("strategic-card", "🌐 Défis Logistiques", "Approvisionnement des forces dans les régions frontalières reculées"),
+    ("strategic-card", "⚡ Menaces Asymétriques", "Terrorisme transfrontalier et guerre hybride avec le Pakistan"),
+])
+SYNTHESE_PERSPECTIVES = ("metric-card", "🔮 PERSPECTIVES STRATÉGIQUES 2027-2035", [
+    ("🚀 DOMAINE NUCLÉAIRE", ["Triade nucléaire complète", "Missiles Agni-VI", "Sous-marins Arihant avancés",
+                             "Bombardiers stratégiques"]),
+    ("🌊 PUISSANCE NAVALE", ["3ème porte-avions indigène", "6 sous-marins nucléaires",
+                            "Destroyers de nouvelle génération", "Base aéronavale dans les Andaman"]),
+    ("💻 TECHNOLOGIES AVANCÉES", ["AMCA 5ème génération", "Drones de combat indigènes", "Guerre cyber avancée",
+                                 "Systèmes hypersoniques"]),
+])
+SYNTHESE_RECOMMANDATIONS = ("nuclear-card", "🎖️ RECOMMANDATIONS STRATÉGIQUES FINALES", [
+    ("🛡️ DÉFENSE ACTIVE", ["Accélérer Make in India Défense", "Renforcer la triade nucléaire",
+                           "Développer les capacités cyber", "Moderniser les forces conventionnelles"]),
+    ("🤝 COOPÉRATION STRATÉGIQUE", ["Approfondir le partenariat QUAD", "Renforcer les relations avec la France",
+                                   "Développer la coopération indo-pacifique", "Maintenir le partenariat avec la Russie"]),
+])
+
+@functools.lru_cache(maxsize=None)
+def html_section_statique(nom):
+    """HTML d'une section au contenu fixe, composé une seule fois par processus"""
+    r = RenduCartes
+    if nom == 'geopolitique':
+        return ''.join(r.carte(classe, titre, r.lignes(paires)) for classe, titre, paires in CARTES_GEOPOLITIQUE)
+    if nom == 'doctrine':
+        classe, titre, paires = PRINCIPES_OPERATIONNELS
+        return (r.grille([r.carte(c, t, r.lignes(p)) for c, t, p in CARTES_DOCTRINE], 3)
+                + r.carte(classe, titre, r.points(paires)))
+    if nom == 'menaces':
+        classe, titre, paires = RECOMMANDATIONS_MENACES
+        return r.carte(classe, titre, r.points(paires))
+    if nom == 'synthese':
+        cartes = [r.carte(classe, titre, r.sous_cartes(sous)) for classe, titre, sous in (SYNTHESE_POINTS_FORTS, SYNTHESE_DEFIS)]
+        (classe_p, titre_p, blocs_p), (classe_r, titre_r, blocs_r) = SYNTHESE_PERSPECTIVES, SYNTHESE_RECOMMANDATIONS
+        return (r.grille(cartes, 2) + r.carte(classe_p, titre_p, r.blocs(blocs_p, 3))
+                + r.carte(classe_r, titre_r, r.blocs(blocs_r, 2)))
+    raise KeyError(nom)
+
+# Paramètres exposés dans le sidebar : (clé de configuration, libellé, pas de saisie)
+PARAMETRES_AJUSTABLES = [
+    ('budget_base', "Budget de base (Md$)", 1.0),
+    ('croissance_budget', "Croissance budgétaire annuelle", 0.005),
+    ('personnel_base', "Effectifs de base (milliers)", 10.0),
+    ('croissance_personnel', "Croissance annuelle des effectifs", 0.001),
+    ('exercices_base', "Exercices de base", 5.0),
+]
+
+# Sections du dashboard : libellé de navigation -> méthode de rendu
+ONGLETS = {
+    "📊 Tableau de Bord": "onglet_tableau_de_bord",
+    "🔬 Analyse Technique": "onglet_analyse_technique",
+    "🌍 Contexte Géopolitique": "onglet_contexte_geopolitique",
+    "📚 Doctrine Militaire": "onglet_doctrine",
+    "⚠️ Évaluation Menaces": "onglet_menaces",
+    "🚀 Systèmes de Missiles": "onglet_missiles",
+    "⚓ Flotte Navale": "onglet_flotte",
+    "⚖️ Comparaison": "onglet_comparaison",
+    "🎚️ Sensibilité": "onglet_sensibilite",
+    "💎 Synthèse Stratégique": "onglet_synthese",
+}
+
+class CacheDonnees:
+    """Cache LRU/TTL des données simulées, partagé par toutes les sessions du processus"""
+    
+    def __init__(self, max_entrees=64, ttl_secondes=3600):
+        self.max_entrees = max_entrees
+        self.ttl_secondes = ttl_secondes
+        self._entrees = OrderedDict()
+        self._verrou = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def obtenir(self, cle, calcul, ttl_secondes=None):
+        """Retourne la valeur de la clé, en la calculant via `calcul()` si absente ou expirée.
+        
+        `ttl_secondes` remplace la durée de vie par défaut pour cette entrée.
+        """
+        maintenant = time.monotonic()
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None and maintenant - entree[0] < entree[2]:
+                self._entrees.move_to_end(cle)
+                self.hits += 1
+                return self._copie_protegee(entree[1])
+            if entree is not None:  # Entrée expirée
+                del self._entrees[cle]
+                self.evictions += 1
+            self.misses += 1
+        
+        # Calcul hors verrou : les autres sessions ne sont pas bloquées
+        valeur = calcul()
+        with self._verrou:
+            self._entrees[cle] = (maintenant, valeur, ttl_secondes or self.ttl_secondes)
+            self._entrees.move_to_end(cle)
+            while len(self._entrees) > self.max_entrees:
+                self._entrees.popitem(last=False)
+                self.evictions += 1
+        return self._copie_protegee(valeur)
+    
+    @staticmethod
+    def _copie_protegee(valeur):
+        """Copie que l'appelant peut modifier sans altérer l'entrée en cache"""
+        if isinstance(valeur, tuple):
+            return tuple(CacheDonnees._copie_protegee(element) for element in valeur)
+        if isinstance(valeur, types.MappingProxyType):
+            # Dictionnaire figé de tables : figé de nouveau, autour de copies des tables
+            return types.MappingProxyType({cle: CacheDonnees._copie_protegee(v) for cle, v in valeur.items()})
+        if isinstance(valeur, pd.DataFrame):
+            # Avec le copy-on-write de pandas >= 3, une copie superficielle suffit
+            return valeur.copy(deep=int(pd.__version__.split('.')[0]) < 3)
+        if isinstance(valeur, (dict, list)):
+            return copy.deepcopy(valeur)
+        # Objets en lecture seule (cubes de scénarios) : partagés tels quels
+        return valeur
+    
+    def octets(self):
+        """Mémoire occupée par les valeurs en cache"""
+        with self._verrou:
+            valeurs = [entree[1] for entree in self._entrees.values()]
+        return taille_profonde(valeurs)
+    
+    def statistiques(self):
+        """Compteurs du cache"""
+        with self._verrou:
+            total = self.hits + self.misses
+            return {
+                'entrees': len(self._entrees),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'taux_hit': self.hits / total if total else 0.0
             }
-        }
-        
-        return configs.get(selection, {
-            "type": "branche",
-            "personnel_base": 100,
-            "exercices_base": 25,
-            "priorites": ["defense_generique"]
-        })
-    
-    def simulate_advanced_budget(self, annees, config):
-        """Simulation avancée du budget avec variations géopolitiques"""
-        budget_base = config.get('budget_base', 60.0)
-        budgets = []
-        for annee in annees:
-            base = budget_base * (1 + 0.065 * (annee - 2000))
-            # Variations selon événements géopolitiques
-            if 2002 <= annee <= 2004:  # Tensions avec le Pakistan
-                base *= 1.1
-            elif 2008 <= annee <= 2010:  # Modernisation accélérée
-                base *= 1.15
-            elif annee >= 2016:  # Make in India
-                base *= 1.2
-            elif annee >= 2020:  # Tensions avec la Chine
-                base *= 1.25
-            budgets.append(base)
-        return budgets
-    
-    def simulate_advanced_personnel(self, annees, config):
-        """Simulation avancée des effectifs"""
-        personnel_base = config.get('personnel_base', 1300)
-        return [personnel_base * (1 + 0.008 * (annee - 2000)) for annee in annees]
-    
-    def simulate_military_gdp_percentage(self, annees):
-        """Pourcentage du PIB consacré à la défense"""
-        return [2.5 + 0.1 * (annee - 2000) for annee in annees]
-    
-    def simulate_advanced_exercises(self, annees, config):
-        """Exercices militaires avec saisonnalité"""
-        base = config.get('exercices_base', 80)
-        return [base + 4 * (annee - 2000) + 8 * np.sin(2 * np.pi * (annee - 2000)/4) for annee in annees]
-    
-    def simulate_advanced_readiness(self, annees):
-        """Préparation opérationnelle avancée"""
-        readiness = []
-        for annee in annees:
-            base = 65 + 1.5 * (annee - 2000)
-            if annee >= 2008:  # Réformes post-26/11
-                base += 8
-            if annee >= 2014:  # Modernisation
-                base += 7
-            if annee >= 2020:  # Expérience opérationnelle
-                base += 5
-            readiness.append(min(base, 90))
-        return readiness
-    
-    def simulate_advanced_deterrence(self, annees):
-        """Capacité de dissuasion avancée"""
-        deterrence = []
-        for annee in annees:
-            if annee < 1998:
-                base = 0  # Pré-nucléaire
-            elif annee < 2003:
-                base = 40  # Capacité nucléaire basique
-            elif annee < 2012:
-                base = 60  # Missiles balistiques
-            elif annee < 2018:
-                base = 75  # Triade en développement
-            else:
-                base = 85 + 1 * (annee - 2018)  # Triade opérationnelle
-            deterrence.append(min(base, 95))
-        return deterrence
-    
-    def simulate_advanced_mobilization(self, annees):
-        """Temps de mobilisation avancé"""
-        return [max(45 - 1 * (annee - 2000), 15) for annee in annees]
-    
-    def simulate_missile_tests(self, annees):
-        """Tests de missiles"""
-        tests = []
-        for annee in annees:
-            if annee < 2006:
-                tests.append(2)
-            elif annee < 2012:
-                tests.append(4 + (annee - 2006))
-            else:
-                tests.append(10 + 2 * (annee - 2012))
-        return tests
-    
-    def simulate_tech_development(self, annees):
-        """Développement technologique global"""
-        return [min(50 + 2.5 * (annee - 2000), 85) for annee in annees]
-    
-    def simulate_artillery_capacity(self, annees):
-        """Capacité d'artillerie"""
-        return [min(70 + 1.8 * (annee - 2000), 90) for annee in annees]
-    
-    def simulate_air_defense_coverage(self, annees):
-        """Couverture de défense anti-aérienne"""
-        return [min(55 + 2.2 * (annee - 2000), 88) for annee in annees]
-    
-    def simulate_logistical_resilience(self, annees):
-        """Résilience logistique"""
-        return [min(60 + 2 * (annee - 2000), 87) for annee in annees]
-    
-    def simulate_cyber_capabilities(self, annees):
-        """Capacités cybernétiques"""
-        return [min(45 + 3 * (annee - 2000), 82) for annee in annees]
-    
-    def simulate_weapon_production(self, annees):
-        """Production d'armements (indice)"""
-        return [min(55 + 2.8 * (annee - 2000), 89) for annee in annees]
-    
-    def simulate_nuclear_arsenal_size(self, annees):
-        """Évolution du stock d'ogives nucléaires"""
-        stock = []
-        for annee in annees:
-            if annee < 1998:
-                stock.append(0)
-            elif annee < 2005:
-                stock.append(50 + 5 * (annee - 1998))
-            elif annee < 2015:
-                stock.append(80 + 8 * (annee - 2005))
-            else:
-                stock.append(150 + 10 * (annee - 2015))
-        return [min(s, 300) for s in stock]
-    
-    def simulate_missile_range_evolution(self, annees):
-        """Évolution de la portée maximale des missiles"""
-        portee = []
-        for annee in annees:
-            if annee < 2002:
-                portee.append(250)  # Prithvi
-            elif annee < 2007:
-                portee.append(700 + 200 * (annee - 2002))  # Agni-I/II
-            elif annee < 2012:
-                portee.append(2000 + 500 * (annee - 2007))  # Agni-III
-            elif annee < 2018:
-                portee.append(3500 + 500 * (annee - 2012))  # Agni-IV
-            else:
-                portee.append(5000)  # Agni-V
-        return portee
+
+@st.cache_resource
+def obtenir_cache_donnees():
+    """Instance unique du cache de données pour le processus"""
+    return CacheDonnees()
+
+# Durée de vie du handle du dataset précalculé (fichiers relistés ensuite, après une régénération)
+TTL_DATASET_SECONDES = 600
+
+@st.cache_resource(ttl=TTL_DATASET_SECONDES)
+def obtenir_dataset():
+    """Dataset Parquet précalculé désigné par DASHBOARD_INDE_DATASET (None si absent)"""
+    racine = os.environ.get('DASHBOARD_INDE_DATASET')
+    if not racine or not os.path.isdir(racine):
+        return None
+    return DatasetSimulations(racine)
+
+# Durée de vie des tables de référence en cache (relues ensuite depuis la source)
+TTL_REFERENCES_SECONDES = 300
+
+@st.cache_resource
+def obtenir_source():
+    """Source des tables de référence désignée par DASHBOARD_INDE_SOURCE (SQLite embarqué par défaut)"""
+    return ouvrir_source(os.environ.get('DASHBOARD_INDE_SOURCE'))
+
+def charger_references(tables=tuple(TABLES_REFERENCE)):
+    """Tables de référence, lues en parallèle depuis la source puis mémorisées avec un TTL.
+    
+    Le dictionnaire est figé et chaque table remise est une copie protégée (voir CacheDonnees) :
+    une écriture d'une session n'altère pas les tables des autres sessions.
+    """
+    return obtenir_cache_donnees().obtenir(
+        ('references', tables), lambda: types.MappingProxyType(precharger(obtenir_source(), tables)),
+        ttl_secondes=TTL_REFERENCES_SECONDES
+    )
+
+@st.cache_resource(max_entries=2)
+def obtenir_catalogues(_moteur, empreinte):
+    """Catalogues figés, construits une fois par processus et par version des tables de référence"""
+    return CataloguesPartages.depuis_moteur(_moteur)
+
+# Export de rapport : threads de rendu des figures, partagés par toutes les sessions
+WORKERS_EXPORT = 4
+
+@st.cache_resource
+def obtenir_pool_export():
+    """Pool de rendu des exports, hors du thread d'exécution du script"""
+    return ThreadPoolExecutor(max_workers=WORKERS_EXPORT, thread_name_prefix='export')
+
+@st.cache_resource
+def obtenir_pool_calcul():
+    """Pool de processus Monte Carlo et sensibilité, démarré une fois et partagé par toutes les sessions"""
+    return creer_pool_calcul()
+
+def sur_pool_calcul(calcul):
+    """Exécute `calcul(pool)` sur le pool partagé ; un pool cassé (worker tué) est recréé une fois"""
+    try:
+        return calcul(obtenir_pool_calcul())
+    except BrokenProcessPool:
+        obtenir_pool_calcul.clear()
+        return calcul(obtenir_pool_calcul())
+
+class CacheFigures:
+    """Cache LRU des figures Plotly ; les figures dépendant des données sont indexées par l'empreinte du DataFrame"""
+    
+    def __init__(self, max_entrees=128):
+        self.max_entrees = max_entrees
+        self._figures = OrderedDict()
+        self._verrou = threading.Lock()
+    
+    def __len__(self):
+        return len(self._figures)
+    
+    @staticmethod
+    def empreinte(df):
+        """Empreinte du contenu d'un DataFrame (colonnes et valeurs)"""
+        valeurs = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        return hash((tuple(df.columns), valeurs.tobytes()))
     
-    def simulate_submarine_capability(self, annees):
-        """Capacité sous-marine stratégique"""
-        return [min(20 + 4 * (annee - 2009), 85) for annee in annees if annee >= 2009] + [0] * (2009 - min(annees))
+    def contient(self, nom, df=None):
+        with self._verrou:
+            return (nom, None if df is None else self.empreinte(df)) in self._figures
     
-    def simulate_underground_tests(self, annees):
-        """Essais souterrains et préparation"""
-        return [min(60 + 2 * (annee - 2000), 90) for annee in annees]
+    def obtenir(self, nom, construire, df=None):
+        """Figure en cache ; reconstruite si absente ou si les données source ont changé"""
+        cle = (nom, None if df is None else self.empreinte(df))
+        with self._verrou:
+            fig = self._figures.get(cle)
+            if fig is not None:
+                self._figures.move_to_end(cle)
+                return fig
+        
+        fig = construire()
+        with self._verrou:
+            self._figures[cle] = fig
+            while len(self._figures) > self.max_entrees:
+                self._figures.popitem(last=False)
+        return fig
+
+@st.cache_resource
+def obtenir_cache_figures():
+    """Instance unique du cache de figures pour le processus"""
+    return CacheFigures()
+
+# Séries longues : budget de points par courbe (≈ largeur en pixels d'un graphique)
+# et nombre de points d'origine au-delà duquel la trace passe en WebGL
+POINTS_MAX_COURBE = 1000
+SEUIL_WEBGL = 5000
+
+# Mode comparaison : indicateurs affichés par défaut
+INDICATEURS_COMPARAISON = ['Budget_Defense_Mds', 'Personnel_Milliers', 'Readiness_Operative', 'Capacite_Dissuasion']
+
+# Inventaire des missiles : lignes par page de la table
+LIGNES_PAR_PAGE_INVENTAIRE = 100
+
+# Projections de la synthèse : libellés des modèles de prévision
+MODELES_PREVISION = {'holt': "Lissage de Holt", 'tendance': "Tendance linéaire"}
+
+# Horizon temporel sélectionnable
+ANNEE_MIN_HORIZON = 1947
+ANNEE_MAX_HORIZON = 2100
+
+def lttb(x, y, n_sortie):
+    """Indices retenus par Largest-Triangle-Three-Buckets pour réduire une série à n_sortie points"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_sortie >= n or n_sortie < 3:
+        return np.arange(n)
     
-    def simulate_new_systems(self, annees):
-        """Nouveaux systèmes déployés"""
-        return [min(3 + 1.5 * (annee - 2000), 40) for annee in annees]
+    # Premier et dernier points conservés ; n_sortie - 2 seaux entre les deux
+    bords = np.linspace(1, n - 1, n_sortie - 1).astype(np.int64)
+    indices = np.empty(n_sortie, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    precedent = 0
+    for i in range(n_sortie - 2):
+        debut, fin = bords[i], bords[i + 1]
+        # Sommet du triangle côté suivant : moyenne du seau suivant (ou dernier point)
+        suivant = slice(fin, bords[i + 2]) if i + 2 < len(bords) else slice(n - 1, n)
+        x_moyen, y_moyen = x[suivant].mean(), y[suivant].mean()
+        aires = np.abs((x[precedent] - x_moyen) * (y[debut:fin] - y[precedent])
+                       - (x[precedent] - x[debut:fin]) * (y_moyen - y[precedent]))
+        precedent = debut + int(np.argmax(aires))
+        indices[i + 1] = precedent
+    return indices
+
+class Instrumentation:
+    """Chronométrage optionnel d'un rerun (sections, figures, taille des payloads) au format Chrome trace"""
     
-    def simulate_modernization_rate(self, annees):
-        """Taux de modernisation des équipements"""
-        return [min(25 + 3.5 * (annee - 2000), 80) for annee in annees]
+    def __init__(self, actif=False):
+        self.actif = actif
+        self.evenements = []
+        self._origine = time.perf_counter()
     
-    def simulate_weapon_exports(self, annees):
-        """Exportations d'armes (milliards USD)"""
-        return [min(0.1 + 0.3 * (annee - 2000), 3) for annee in annees]
+    @contextlib.contextmanager
+    def mesurer(self, nom, categorie, **details):
+        """Enregistre la durée du bloc ; `details` est complété par le bloc (ex. taille du payload)"""
+        if not self.actif:
+            yield details
+            return
+        debut = time.perf_counter()
+        try:
+            yield details
+        finally:
+            self.evenements.append({
+                'name': nom, 'cat': categorie, 'ph': 'X',
+                'ts': (debut - self._origine) * 1e6,
+                'dur': (time.perf_counter() - debut) * 1e6,
+                'pid': os.getpid(), 'tid': threading.get_ident(),
+                'args': details
+            })
     
-    def simulate_naval_fleet(self, annees):
-        """Flotte navale de combat"""
-        return [min(25 + 2 * (annee - 2000), 70) for annee in annees]
+    def trace_chrome(self):
+        """Trace JSON chargeable dans chrome://tracing ou Perfetto"""
+        return json.dumps({'traceEvents': self.evenements, 'displayTimeUnit': 'ms'}, default=str)
     
-    def simulate_naval_range(self, annees):
-        """Portée de projection navale"""
-        return [min(500 + 50 * (annee - 2000), 2000) for annee in annees]
+    def tableau(self):
+        """Événements sous forme de tableau, du plus lent au plus rapide"""
+        return pd.DataFrame([{
+            'Élément': e['name'], 'Catégorie': e['cat'], 'Durée (ms)': round(e['dur'] / 1000, 2),
+            'Payload (Ko)': round(e['args']['octets'] / 1024, 1) if 'octets' in e['args'] else None
+        } for e in self.evenements]).sort_values('Durée (ms)', ascending=False)
+
+def section_instrumentee(methode):
+    """Chronomètre une méthode de section lorsque l'instrumentation est active"""
+    @functools.wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        with self.instrumentation.mesurer(methode.__name__, 'section'):
+            return methode(self, *args, **kwargs)
+    return enveloppe
+
+@st.cache_data(max_entries=32, show_spinner="🎲 Simulation Monte Carlo en cours...")
+def calculer_bandes_incertitude(selection, scenario, n_tirages, surcharges=(), horizon=(ANNEE_DEBUT, ANNEE_FIN, "annuelle")):
+    """Percentiles P5/P50/P95 Monte Carlo, mémorisés par sélection, scénario, tirages, surcharges et horizon"""
+    annee_debut, annee_fin, resolution = horizon
+    return sur_pool_calcul(lambda pool: MoteurSimulationInde().monte_carlo(
+        selection, scenario, n_tirages, annee_debut=annee_debut, annee_fin=annee_fin, resolution=resolution,
+        surcharges=dict(surcharges), executeur=pool
+    ))
+
+@st.cache_data(max_entries=32, show_spinner="🎚️ Analyse de sensibilité en cours...")
+def calculer_sensibilite(selection, scenario, surcharges=(), horizon=(ANNEE_DEBUT, ANNEE_FIN, "annuelle")):
+    """Analyse de sensibilité mémorisée par sélection, scénario, surcharges et horizon"""
+    annee_debut, annee_fin, resolution = horizon
+    return sur_pool_calcul(lambda pool: MoteurSimulationInde().analyse_sensibilite(
+        selection, scenario, annee_debut, annee_fin, resolution, surcharges=dict(surcharges), executeur=pool
+    ))
+
+class DefenseIndeDashboardAvance(MoteurSimulationInde):
+    # Remplacée à chaque rerun ; inactive par défaut
+    instrumentation = Instrumentation()
+    # Réglages de rendu des séries longues (modifiables dans le sidebar)
+    points_max_courbe = POINTS_MAX_COURBE
+    seuil_webgl = SEUIL_WEBGL
+    # Origine des dernières données servies par obtenir_donnees : 'dataset', 'incremental' ou 'cube'
+    source_donnees = 'cube'
     
-    def simulate_joint_exercises(self, annees):
-        """Exercices combinés avec partenaires"""
-        return [min(5 + 2 * (annee - 2000), 35) for annee in annees]
+    def __init__(self):
+        # Toutes les tables de référence sont préchargées ensemble, avant le moindre rendu
+        self.references = charger_references()
+        # Catalogues partagés par toutes les sessions : l'instance de chaque rerun ne fait que les référencer
+        empreinte = tuple(CacheFigures.empreinte(self.references[table]) for table in ('missiles', 'flotte'))
+        super().__init__(obtenir_catalogues(self, empreinte))
     
-    def simulate_cyber_attacks(self, annees):
-        """Attaques cyber réussies (estimation)"""
-        return [min(10 + 2 * (annee - 2000), 60) for annee in annees]
+    def define_missile_systems(self):
+        return catalogue_depuis_table(self.references['missiles'])
     
-    def simulate_cyber_command(self, annees):
-        """Réseau de commandement cyber"""
-        return [min(40 + 3 * (annee - 2000), 85) for annee in annees]
+    def define_naval_assets(self):
+        return catalogue_depuis_table(self.references['flotte'])
     
-    def simulate_cyber_defense(self, annees):
-        """Capacités de cyber défense"""
-        return [min(45 + 2.8 * (annee - 2000), 83) for annee in annees]
+    def obtenir_donnees(self, selection, scenario, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN,
+                        resolution="annuelle", surcharges=None):
+        """Données d'une sélection et d'un scénario : dataset précalculé si disponible, sinon cube mémorisé.
+        
+        La source effectivement utilisée est notée dans `source_donnees`.
+        """
+        dataset = obtenir_dataset()
+        if dataset is not None and not surcharges and dataset.pas_par_an == RESOLUTIONS[resolution]:
+            cle = ('dataset', dataset.racine, selection, scenario, annee_debut, annee_fin)
+            df = obtenir_cache_donnees().obtenir(
+                cle, lambda: dataset.charger(selection, scenario, annee_debut, annee_fin)
+            )
+            # Horizon partiellement couvert (ou fichiers régénérés à un autre pas) : calcul à la volée
+            if len(df) == (annee_fin - annee_debut + 1) * RESOLUTIONS[resolution] and df['Annee'].iloc[0] == annee_debut:
+                self.source_donnees = 'dataset'
+                return df, self.get_advanced_config(selection)
+        
+        if surcharges:
+            # Paramètres propres à la session : recalcul incrémental des seules colonnes invalidées
+            if 'calcul_incremental' not in st.session_state:
+                # Moteur léger adossé aux catalogues partagés : la session ne garde que ses colonnes
+                st.session_state['calcul_incremental'] = CalculIncremental(MoteurSimulationInde(self.catalogues))
+            self.source_donnees = 'incremental'
+            return st.session_state['calcul_incremental'].generer(
+                selection, scenario, annee_debut, annee_fin, resolution, surcharges
+            )
+        
+        self.source_donnees = 'cube'
+        cube = self.obtenir_cube([selection], annee_debut, annee_fin, resolution)
+        return cube.frame(selection, scenario)
     
-    def display_advanced_header(self):
+    def obtenir_cube(self, selections, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN,
+                     resolution="annuelle", surcharges=None):
+        """Cube sélections × scénarios × temps mémorisé par (sélections, horizon, surcharges).
+        
+        Tous les scénarios sont calculés ensemble : changer de scénario est une simple indexation.
+        """
+        surcharges = surcharges or {}
+        cle = ('cube', tuple(selections), annee_debut, annee_fin, resolution,
+               tuple(sorted(surcharges.items())))
+        return obtenir_cache_donnees().obtenir(
+            cle, lambda: self.calculer_cube_scenarios(selections, annee_debut, annee_fin,
+                                                      resolution, surcharges)
+        )
+    
+    def display_advanced_header(self, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN):
         """En-tête avancé avec plus d'informations"""
-        st.markdown('<h1 class="main-header">🐘 ANALYSE STRATÉGIQUE AVANCÉE - RÉPUBLIQUE DE L\'INDE</h1>', 
-                   unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.markdown("""
-            <div style='text-align: center; background: linear-gradient(135deg, #FF9933, #138808); 
-            padding: 1rem; border-radius: 10px; color: white; margin: 1rem 0;'>
-            <h3>🛡️ SYSTÈME DE DÉFENSE INTÉGRÉ DE LA RÉPUBLIQUE DE L'INDE</h3>
-            <p><strong>Analyse multidimensionnelle des capacités militaires et stratégiques (2000-2027)</strong></p>
-            </div>
-            """, unsafe_allow_html=True)
+        RenduCartes.emettre(
+            '<h1 class="main-header">🐘 ANALYSE STRATÉGIQUE AVANCÉE - RÉPUBLIQUE DE L\'INDE</h1>'
+            '<div class="header-box">'
+            '<h3>🛡️ SYSTÈME DE DÉFENSE INTÉGRÉ DE LA RÉPUBLIQUE DE L\'INDE</h3>'
+            '<p><strong>Analyse multidimensionnelle des capacités militaires et stratégiques '
+            f'({annee_debut}-{annee_fin})</strong></p>'
+            '</div>'
+        )
     
     def create_advanced_sidebar(self):
         """Sidebar avancé avec plus d'options"""
@@ -432,133 +675,176 @@ class DefenseIndeDashboardAvance:
         # Sélection du type d'analyse
         type_analyse = st.sidebar.radio(
             "Mode d'analyse:",
-            ["Analyse Branche Militaire", "Programmes Stratégiques", "Vue Systémique", "Scénarios Géopolitiques"]
+            ["Analyse Branche Militaire", "Programmes Stratégiques", "Vue Systémique", "Scénarios Géopolitiques"],
+            key='type_analyse'
         )
         
         if type_analyse == "Analyse Branche Militaire":
-            selection = st.sidebar.selectbox("Branche militaire:", self.branches_options)
+            selection = st.sidebar.selectbox("Branche militaire:", self.branches_options, key='selection_branche')
         elif type_analyse == "Programmes Stratégiques":
-            selection = st.sidebar.selectbox("Programme stratégique:", self.programmes_options)
+            selection = st.sidebar.selectbox("Programme stratégique:", self.programmes_options,
+                                         key='selection_programme')
         elif type_analyse == "Vue Systémique":
             selection = "Forces Armées Indiennes"
         else:
             selection = "Scénarios Géopolitiques"
         
+        # Mode comparaison : plusieurs sélections calculées ensemble
+        st.sidebar.markdown("### ⚖️ MODE COMPARAISON")
+        selections_comparaison = st.sidebar.multiselect(
+            "Sélections à comparer:", self.branches_options + self.programmes_options,
+            key='selections_comparaison'
+        )
+        
         # Options avancées
         st.sidebar.markdown("### 🔧 OPTIONS AVANCÉES")
-        show_geopolitical = st.sidebar.checkbox("Contexte géopolitique", value=True)
-        show_doctrinal = st.sidebar.checkbox("Analyse doctrinale", value=True)
-        show_technical = st.sidebar.checkbox("Détails techniques", value=True)
-        threat_assessment = st.sidebar.checkbox("Évaluation des menaces", value=True)
+        show_geopolitical = st.sidebar.checkbox("Contexte géopolitique", value=True, key='show_geopolitical')
+        show_doctrinal = st.sidebar.checkbox("Analyse doctrinale", value=True, key='show_doctrinal')
+        show_technical = st.sidebar.checkbox("Détails techniques", value=True, key='show_technical')
+        threat_assessment = st.sidebar.checkbox("Évaluation des menaces", value=True, key='threat_assessment')
         
         # Paramètres de simulation
         st.sidebar.markdown("### ⚙️ PARAMÈTRES DE SIMULATION")
-        scenario = st.sidebar.selectbox("Scénario:", ["Statut Quo", "Tensions Chine", "Modernisation Accélérée", "Conflit Régional"])
+        scenario = st.sidebar.selectbox("Scénario:", SCENARIOS, key='scenario')
+        annee_debut, annee_fin = st.sidebar.slider("Horizon:", ANNEE_MIN_HORIZON, ANNEE_MAX_HORIZON,
+                                                   (ANNEE_DEBUT, ANNEE_FIN), key='horizon')
+        resolution = st.sidebar.selectbox("Résolution:", list(RESOLUTIONS), format_func=str.capitalize,
+                                          key='resolution')
+        monte_carlo = st.sidebar.checkbox("Bandes d'incertitude (Monte Carlo)", value=False)
+        n_tirages = st.sidebar.select_slider("Tirages Monte Carlo:", [10_000, 100_000, 500_000, 1_000_000],
+                                             value=100_000, disabled=not monte_carlo)
+        surcharges = self.create_parameter_overrides(selection)
+        
+        # Rendu des séries longues
+        with st.sidebar.expander("📉 RENDU DES SÉRIES LONGUES"):
+            points_max_courbe = st.number_input("Points max par courbe (LTTB)", min_value=100,
+                                                max_value=20_000, value=POINTS_MAX_COURBE, step=100)
+            seuil_webgl = st.number_input("Seuil WebGL (points d'origine)", min_value=100,
+                                          max_value=1_000_000, value=SEUIL_WEBGL, step=500)
+        
+        # Diagnostic de performance
+        instrumentation = st.sidebar.checkbox("Instrumentation (minutage et trace)", value=False)
         
         return {
             'selection': selection,
+            'selections_comparaison': selections_comparaison,
             'type_analyse': type_analyse,
             'show_geopolitical': show_geopolitical,
             'show_doctrinal': show_doctrinal,
             'show_technical': show_technical,
             'threat_assessment': threat_assessment,
-            'scenario': scenario
+            'scenario': scenario,
+            'horizon': (annee_debut, annee_fin, resolution),
+            'monte_carlo': monte_carlo,
+            'n_tirages': n_tirages,
+            'surcharges': surcharges,
+            'instrumentation': instrumentation,
+            'points_max_courbe': int(points_max_courbe),
+            'seuil_webgl': int(seuil_webgl)
         }
     
+    def create_parameter_overrides(self, selection):
+        """Surcharges des paramètres du modèle ; seules les valeurs modifiées sont retournées"""
+        config = self.config_partagee(selection)
+        surcharges = {}
+        with st.sidebar.expander("🧮 PARAMÈTRES DU MODÈLE"):
+            for cle, libelle, pas in PARAMETRES_AJUSTABLES:
+                defaut = float(config.get(cle, PARAMETRES_DEFAUT[cle]))
+                valeur = st.number_input(libelle, value=defaut, step=pas, format="%.3f" if pas < 1 else "%.1f",
+                                         key=f"parametre_{cle}_{selection}")
+                if valeur != defaut:
+                    surcharges[cle] = valeur
+        return surcharges
+    
+    def afficher_statistiques_cache(self):
+        """Compteurs du cache de données dans le sidebar"""
+        stats = obtenir_cache_donnees().statistiques()
+        with st.sidebar.expander("🗄️ CACHE DE DONNÉES"):
+            col1, col2 = st.columns(2)
+            col1.metric("Hits", stats['hits'])
+            col2.metric("Misses", stats['misses'])
+            col1.metric("Évictions", stats['evictions'])
+            col2.metric("Entrées", stats['entrees'])
+            st.progress(stats['taux_hit'], text=f"Taux de hit : {stats['taux_hit']:.0%}")
+            calcul = st.session_state.get('calcul_incremental')
+            if calcul is not None:
+                recalculees, reutilisees = calcul.dernier_appel
+                st.caption(f"Recalcul incrémental : {recalculees} colonne(s) recalculée(s), "
+                           f"{reutilisees} réutilisée(s) (cumul {calcul.recalculees} / {calcul.reutilisees})")
+    
+    def afficher_rapport_memoire(self, df, controls):
+        """Empreinte mémoire du DataFrame affiché et de la structure dont il est extrait"""
+        with st.sidebar.expander("💾 MÉMOIRE DES DONNÉES"):
+            rapport = rapport_memoire(df)
+            st.dataframe(rapport, hide_index=True, use_container_width=True)
+            if self.source_donnees == 'incremental':
+                # Paramètres surchargés : les données viennent des colonnes de la session, pas du cube
+                calcul = st.session_state['calcul_incremental']
+                st.caption(f"Calcul incrémental de la session : {len(calcul)} colonnes mémorisées, "
+                           f"{calcul.octets() / 1024:.1f} Ko")
+                return
+            if self.source_donnees == 'dataset':
+                st.caption(f"Source : dataset Parquet {obtenir_dataset().racine}")
+                return
+            cube = self.obtenir_cube([controls['selection']], *controls['horizon'])
+            st.caption(f"Cube {len(cube.selections)} sélection(s) × {len(cube.scenarios)} scénarios × "
+                       f"{len(cube.annees)} pas : {cube.octets() / 1024:.1f} Ko")
+    
+    @section_instrumentee
     def display_strategic_metrics(self, df, config):
         """Métriques stratégiques avancées"""
-        st.markdown('<h3 class="section-header">🎯 TABLEAU DE BORD STRATÉGIQUE</h3>', 
-                   unsafe_allow_html=True)
-        
-        derniere_annee = df['Annee'].max()
-        data_actuelle = df[df['Annee'] == derniere_annee].iloc[0]
-        data_2000 = df[df['Annee'] == 2000].iloc[0]
-        
-        # Première ligne de métriques
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown("""
-            <div class="metric-card">
-                <h4>💰 BUDGET DÉFENSE 2027</h4>
-                <h2>{:.1f} Md$</h2>
-                <p>📈 {:.1f}% du PIB</p>
-            </div>
-            """.format(data_actuelle['Budget_Defense_Mds'], data_actuelle['PIB_Militaire_Pourcent']), 
-            unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class="metric-card">
-                <h4>👥 EFFECTIFS TOTAUX</h4>
-                <h2>{:,.0f}K</h2>
-                <p>⚔️ +{:.1f}% depuis 2000</p>
-            </div>
-            """.format(data_actuelle['Personnel_Milliers'], 
-                     ((data_actuelle['Personnel_Milliers'] - data_2000['Personnel_Milliers']) / data_2000['Personnel_Milliers']) * 100), 
-            unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div class="nuclear-card">
-                <h4>☢️ TRIADE NUCLÉAIRE</h4>
-                <h2>{:.0f}%</h2>
-                <p>🚀 {} ogives stratégiques</p>
-            </div>
-            """.format(data_actuelle['Capacite_Dissuasion'], 
-                     int(data_actuelle.get('Stock_Ogives_Nucleaires', 0))), 
-            unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown("""
-            <div class="strategic-card">
-                <h4>🌊 PUISSANCE NAVALE</h4>
-                <h2>{:.0f}%</h2>
-                <p>⚓ {} navires majeurs</p>
-            </div>
-            """.format(data_actuelle.get('Portee_Projection_Nm', 0)/20, 
-                     int(data_actuelle.get('Navires_Combat', 0))), 
-            unsafe_allow_html=True)
+        RenduCartes.emettre('<h3 class="section-header">🎯 TABLEAU DE BORD STRATÉGIQUE</h3>' + self.html_metriques(df))
+    
+    def html_metriques(self, df):
+        """Grille des huit cartes de métriques (un seul bloc HTML)"""
+        # Première et dernière période de l'horizon affiché
+        data_initiale = df.iloc[0]
+        data_actuelle = df.iloc[-1]
+        annee_initiale, derniere_annee = int(data_initiale['Annee']), int(data_actuelle['Annee'])
+        
+        def variation(depart, arrivee):
+            # Indicateurs nuls en début d'horizon long (avant 2000) : variation relative non définie
+            return f"{(arrivee - depart) / depart * 100:+.1f}%" if depart else "n.d."
+        
+        # Les huit cartes sont composées en un seul bloc
+        r = RenduCartes
+        cartes = [
+            r.metrique("metric-card", f"💰 BUDGET DÉFENSE {derniere_annee}", f"{data_actuelle['Budget_Defense_Mds']:.1f} Md$",
+                       f"📈 {data_actuelle['PIB_Militaire_Pourcent']:.1f}% du PIB"),
+            r.metrique("metric-card", "👥 EFFECTIFS TOTAUX", f"{data_actuelle['Personnel_Milliers']:,.0f}K",
+                       f"⚔️ {variation(data_initiale['Personnel_Milliers'], data_actuelle['Personnel_Milliers'])}"
+                       f" depuis {annee_initiale}"),
+            r.metrique("nuclear-card", "☢️ TRIADE NUCLÉAIRE", f"{data_actuelle['Capacite_Dissuasion']:.0f}%",
+                       f"🚀 {int(data_actuelle.get('Stock_Ogives_Nucleaires', 0))} ogives stratégiques"),
+            r.metrique("strategic-card", "🌊 PUISSANCE NAVALE", f"{data_actuelle.get('Portee_Projection_Nm', 0)/20:.0f}%",
+                       f"⚓ {int(data_actuelle.get('Navires_Combat', 0))} navires majeurs"),
+        ]
         
         # Deuxième ligne de métriques
-        col5, col6, col7, col8 = st.columns(4)
-        
-        with col5:
-            reduction_temps = ((data_2000['Temps_Mobilisation_Jours'] - data_actuelle['Temps_Mobilisation_Jours']) / 
-                             data_2000['Temps_Mobilisation_Jours']) * 100
-            st.metric(
-                "⏱️ Temps Mobilisation",
-                f"{data_actuelle['Temps_Mobilisation_Jours']:.1f} jours",
-                f"{reduction_temps:+.1f}%"
-            )
-        
-        with col6:
-            croissance_ad = ((data_actuelle['Couverture_AD'] - data_2000['Couverture_AD']) / 
-                           data_2000['Couverture_AD']) * 100
-            st.metric(
-                "🛡️ Défense Anti-Aérienne",
-                f"{data_actuelle['Couverture_AD']:.1f}%",
-                f"{croissance_ad:+.1f}%"
-            )
-        
-        with col7:
-            if 'Portee_Max_Missiles_Km' in df.columns:
-                croissance_portee = ((data_actuelle['Portee_Max_Missiles_Km'] - data_2000.get('Portee_Max_Missiles_Km', 250)) / 
-                                   data_2000.get('Portee_Max_Missiles_Km', 250)) * 100
-                st.metric(
-                    "🎯 Portée Missiles Max",
-                    f"{data_actuelle['Portee_Max_Missiles_Km']:,.0f} km",
-                    f"{croissance_portee:+.1f}%"
-                )
+        reduction_temps = ((data_initiale['Temps_Mobilisation_Jours'] - data_actuelle['Temps_Mobilisation_Jours']) / 
+                         data_initiale['Temps_Mobilisation_Jours']) * 100
+        cartes.append(r.metrique("cyber-card", "⏱️ Temps Mobilisation",
+                                 f"{data_actuelle['Temps_Mobilisation_Jours']:.1f} jours", f"{reduction_temps:+.1f}%"))
+        
+        cartes.append(r.metrique("cyber-card", "🛡️ Défense Anti-Aérienne",
+                                 f"{data_actuelle['Couverture_AD']:.1f}%",
+                                 variation(data_initiale['Couverture_AD'], data_actuelle['Couverture_AD'])))
+        
+        if 'Portee_Max_Missiles_Km' in df.columns:
+            cartes.append(r.metrique("cyber-card", "🎯 Portée Missiles Max",
+                                     f"{data_actuelle['Portee_Max_Missiles_Km']:,.0f} km",
+                                     variation(data_initiale.get('Portee_Max_Missiles_Km', 250),
+                                               data_actuelle['Portee_Max_Missiles_Km'])))
+        else:
+            cartes.append('<div></div>')
         
-        with col8:
-            st.metric(
-                "📊 Préparation Opérationnelle",
-                f"{data_actuelle['Readiness_Operative']:.1f}%",
-                f"+{(data_actuelle['Readiness_Operative'] - data_2000['Readiness_Operative']):.1f}%"
-            )
+        cartes.append(r.metrique("cyber-card", "📊 Préparation Opérationnelle",
+                                 f"{data_actuelle['Readiness_Operative']:.1f}%",
+                                 f"{(data_actuelle['Readiness_Operative'] - data_initiale['Readiness_Operative']):+.1f}%"))
+        return r.grille(cartes, 4)
     
-    def create_comprehensive_analysis(self, df, config):
+    @section_instrumentee
+    def create_comprehensive_analysis(self, df, config, controls=None):
         """Analyse complète multidimensionnelle"""
         st.markdown('<h3 class="section-header">📊 ANALYSE MULTIDIMENSIONNELLE</h3>', 
                    unsafe_allow_html=True)
@@ -568,65 +854,114 @@ class DefenseIndeDashboardAvance:
         
         with col1:
             # Évolution des capacités principales
-            fig = go.Figure()
-            
-            capacites = ['Readiness_Operative', 'Capacite_Dissuasion', 'Cyber_Capabilities', 'Couverture_AD']
-            noms = ['Préparation Opér.', 'Dissuasion Strat.', 'Capacités Cyber', 'Défense Anti-Aérienne']
-            couleurs = ['#FF9933', '#138808', '#2d3436', '#4B0082']
-            
-            for i, (cap, nom, couleur) in enumerate(zip(capacites, noms, couleurs)):
-                if cap in df.columns:
-                    fig.add_trace(go.Scatter(
-                        x=df['Annee'], y=df[cap],
-                        mode='lines', name=nom,
-                        line=dict(color=couleur, width=4),
-                        hovertemplate=f"{nom}: %{{y:.1f}}%<extra></extra>"
-                    ))
-            
-            fig.update_layout(
-                title="📈 ÉVOLUTION DES CAPACITÉS STRATÉGIQUES (2000-2027)",
-                xaxis_title="Année",
-                yaxis_title="Niveau de Capacité (%)",
-                height=500,
-                template="plotly_white",
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_serie_progressive('capacites_strategiques', self.figure_capacites_strategiques, df)
         
         with col2:
             # Analyse des programmes stratégiques
-            strategic_data = []
-            strategic_names = []
-            
-            if 'Stock_Ogives_Nucleaires' in df.columns:
-                strategic_data.append(df['Stock_Ogives_Nucleaires'])
-                strategic_names.append('Stock Ogives Nucléaires')
-            
-            if 'Tests_Missiles' in df.columns:
-                strategic_data.append(df['Tests_Missiles'])
-                strategic_names.append('Tests de Missiles')
-            
-            if 'Navires_Combat' in df.columns:
-                strategic_data.append(df['Navires_Combat'])
-                strategic_names.append('Navires de Combat')
-            
-            if strategic_data:
-                fig = make_subplots(specs=[[{"secondary_y": True}]])
-                
-                for i, (data, nom) in enumerate(zip(strategic_data, strategic_names)):
-                    fig.add_trace(
-                        go.Scatter(x=df['Annee'], y=data, name=nom,
+            if any(col in df.columns for col in ('Stock_Ogives_Nucleaires', 'Tests_Missiles', 'Navires_Combat')):
+                self.afficher_serie_progressive('programmes_strategiques', self.figure_programmes_strategiques, df)
+        
+        # Bandes d'incertitude P5/P50/P95
+        if controls and controls['monte_carlo']:
+            self.afficher_bandes_incertitude(df, controls)
+    
+    def afficher_bandes_incertitude(self, df, controls):
+        """Bandes Monte Carlo des indicateurs échantillonnés, autour de la trajectoire déterministe"""
+        annees, bandes = calculer_bandes_incertitude(controls['selection'], controls['scenario'],
+                                                     controls['n_tirages'],
+                                                     tuple(sorted(controls['surcharges'].items())),
+                                                     controls['horizon'])
+        colonnes = st.columns(len(bandes))
+        for colonne, (indicateur, percentiles) in zip(colonnes, bandes.items()):
+            bandes_df = pd.DataFrame({'Annee': annees, 'P5': percentiles[0], 'P50': percentiles[1],
+                                      'P95': percentiles[2], 'Deterministe': df[indicateur].to_numpy()})
+            with colonne:
+                self.afficher_serie_progressive(
+                    f'bandes_{indicateur}',
+                    lambda tranche: self.figure_bandes_incertitude(tranche, indicateur, controls['n_tirages']),
+                    bandes_df)
+    
+    def figure_bandes_incertitude(self, bandes_df, indicateur, n_tirages):
+        """Intervalle P5-P95, médiane et trajectoire déterministe"""
+        # Mêmes points retenus pour toutes les courbes : le remplissage P5-P95 reste aligné
+        indices = self.indices_reduits(bandes_df['Annee'], bandes_df['P50'])
+        fig = go.Figure()
+        fig.add_trace(self.trace_serie(bandes_df['Annee'], bandes_df['P95'], indices, mode='lines',
+                                       line=dict(width=0), showlegend=False, hoverinfo='skip'))
+        fig.add_trace(self.trace_serie(bandes_df['Annee'], bandes_df['P5'], indices, mode='lines', name='P5 - P95',
+                                       line=dict(width=0), fill='tonexty', fillcolor='rgba(255, 153, 51, 0.3)'))
+        fig.add_trace(self.trace_serie(bandes_df['Annee'], bandes_df['P50'], indices, mode='lines',
+                                       name='Médiane (P50)', line=dict(color='#FF671F', width=3)))
+        fig.add_trace(self.trace_serie(bandes_df['Annee'], bandes_df['Deterministe'], indices, mode='lines',
+                                       name='Déterministe', line=dict(color='#138808', width=2, dash='dash')))
+        fig.update_layout(title=f"🎲 {indicateur.replace('_', ' ')} ({n_tirages:,} tirages)",
+                          height=400, template="plotly_white",
+                          legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+        return fig
+    
+    def figure_capacites_strategiques(self, df):
+        """Courbes des capacités principales"""
+        fig = go.Figure()
+        
+        capacites = ['Readiness_Operative', 'Capacite_Dissuasion', 'Cyber_Capabilities', 'Couverture_AD']
+        noms = ['Préparation Opér.', 'Dissuasion Strat.', 'Capacités Cyber', 'Défense Anti-Aérienne']
+        couleurs = ['#FF9933', '#138808', '#2d3436', '#4B0082']
+        
+        for i, (cap, nom, couleur) in enumerate(zip(capacites, noms, couleurs)):
+            if cap in df.columns:
+                fig.add_trace(self.trace_serie(
+                    df['Annee'], df[cap],
+                    mode='lines', name=nom,
+                    line=dict(color=couleur, width=4),
+                    hovertemplate=f"{nom}: %{{y:.1f}}%<extra></extra>"
+                ))
+        
+        fig.update_layout(
+            title=f"📈 ÉVOLUTION DES CAPACITÉS STRATÉGIQUES ({int(df['Annee'].iloc[0])}-{int(df['Annee'].iloc[-1])})",
+            xaxis_title="Année",
+            yaxis_title="Niveau de Capacité (%)",
+            height=500,
+            template="plotly_white",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        )
+        return fig
+    
+    def figure_programmes_strategiques(self, df):
+        """Programmes stratégiques sur double axe"""
+        strategic_data = []
+        strategic_names = []
+        
+        if 'Stock_Ogives_Nucleaires' in df.columns:
+            strategic_data.append(df['Stock_Ogives_Nucleaires'])
+            strategic_names.append('Stock Ogives Nucléaires')
+        
+        if 'Tests_Missiles' in df.columns:
+            strategic_data.append(df['Tests_Missiles'])
+            strategic_names.append('Tests de Missiles')
+        
+        if 'Navires_Combat' in df.columns:
+            strategic_data.append(df['Navires_Combat'])
+            strategic_names.append('Navires de Combat')
+        
+        from plotly.subplots import make_subplots
+        
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        
+        for i, (data, nom) in enumerate(zip(strategic_data, strategic_names)):
+            fig.add_trace(
+                self.trace_serie(df['Annee'], data, name=nom,
                                  line=dict(width=4)),
-                        secondary_y=(i > 0)
-                    )
-                
-                fig.update_layout(
-                    title="🚀 PROGRAMMES STRATÉGIQUES - ÉVOLUTION COMPARÉE",
-                    height=500,
-                    template="plotly_white"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                secondary_y=(i > 0)
+            )
+        
+        fig.update_layout(
+            title="🚀 PROGRAMMES STRATÉGIQUES - ÉVOLUTION COMPARÉE",
+            height=500,
+            template="plotly_white"
+        )
+        return fig
     
+    @section_instrumentee
     def create_geopolitical_analysis(self, df, config):
         """Analyse géopolitique avancée"""
         st.markdown('<h3 class="section-header">🌍 CONTEXTE GÉOPOLITIQUE</h3>', 
@@ -635,53 +970,37 @@ class DefenseIndeDashboardAvance:
         col1, col2 = st.columns(2)
         
         with col1:
-            # Cartes des zones stratégiques
-            st.markdown("""
-            <div class="nuclear-card">
-                <h4>🎯 ENJEUX STRATÉGIQUES RÉGIONAUX</h4>
-                <p><strong>Frontière Chine:</strong> LAC - Line of Actual Control</p>
-                <p><strong>Frontière Pakistan:</strong> LoC - Line of Control</p>
-                <p><strong>Océan Indien:</strong> Zone d'influence maritime</p>
-                <p><strong>Détroit de Malacca:</strong> Route commerciale vitale</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Analyse des relations internationales
-            st.markdown("""
-            <div class="strategic-card">
-                <h4>🤝 RELATIONS INTERNATIONALES</h4>
-                <p><strong>États-Unis:</strong> Partenariat stratégique (QUAD)</p>
-                <p><strong>Russie:</strong> Partenaire militaire traditionnel</p>
-                <p><strong>France:</strong> Coopération technologique avancée</p>
-                <p><strong>Japon/Australie:</strong> Coopération indo-pacifique</p>
-            </div>
-            """, unsafe_allow_html=True)
+            # Cartes des zones stratégiques et des relations internationales (un seul élément)
+            RenduCartes.emettre(html_section_statique('geopolitique'))
         
         with col2:
             # Analyse des tensions régionales
-            tensions_data = {
-                'Année': [1999, 2002, 2008, 2016, 2019, 2020, 2022],
-                'Niveau_Tension': [8, 7, 6, 5, 6, 8, 7],  # sur 10
-                'Conflit': ['Kargil', 'Parliament Attack', 'Mumbai', 'Uri', 'Pulwama', 'Galwan', 'LAC Skirmish']
-            }
-            tensions_df = pd.DataFrame(tensions_data)
-            
-            fig = px.line(tensions_df, x='Année', y='Niveau_Tension', 
-                         title="📉 ÉVOLUTION DES TENSIONS RÉGIONALES",
-                         labels={'Niveau_Tension': 'Niveau de Tension'},
-                         markers=True)
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_figure('tensions_regionales', lambda: self.figure_tensions_regionales(self.references['tensions']),
+                                 self.references['tensions'])
             
             # Indice de coopération internationale
-            cooperation = [min(40 + 3 * (annee - 2000), 85) for annee in df['Annee']]
-            fig = px.area(x=df['Annee'], y=cooperation,
-                         title="🕊️ COOPÉRATION INTERNATIONALE - PARTENARIATS STRATÉGIQUES",
-                         labels={'x': 'Année', 'y': 'Niveau de Coopération (%)'})
-            fig.update_traces(fillcolor='rgba(19, 136, 8, 0.3)', line_color='#138808')
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_serie_progressive('cooperation', self.figure_cooperation, df)
     
+    def figure_tensions_regionales(self, tensions_df):
+        """Niveau de tension par crise régionale"""
+        fig = px.line(tensions_df, x='Année', y='Niveau_Tension', 
+                     title="📉 ÉVOLUTION DES TENSIONS RÉGIONALES",
+                     labels={'Niveau_Tension': 'Niveau de Tension'},
+                     markers=True)
+        fig.update_layout(height=400)
+        return fig
+    
+    def figure_cooperation(self, df):
+        """Indice de coopération internationale"""
+        cooperation = np.minimum(40 + 3 * (df['Annee'].to_numpy() - 2000), 85)
+        fig = go.Figure(self.trace_serie(df['Annee'], cooperation, mode='lines', fill='tozeroy',
+                                         fillcolor='rgba(19, 136, 8, 0.3)', line_color='#138808'))
+        fig.update_layout(title="🕊️ COOPÉRATION INTERNATIONALE - PARTENARIATS STRATÉGIQUES",
+                          xaxis_title='Année', yaxis_title='Niveau de Coopération (%)',
+                          template="plotly_white", height=300)
+        return fig
+    
+    @section_instrumentee
     def create_technical_analysis(self, df, config):
         """Analyse technique détaillée"""
         st.markdown('<h3 class="section-header">🔬 ANALYSE TECHNIQUE AVANCÉE</h3>', 
@@ -691,42 +1010,13 @@ class DefenseIndeDashboardAvance:
         
         with col1:
             # Analyse des systèmes d'armes
-            systems_data = {
-                'Système': ['Rafale', 'Sukhoi Su-30MKI', 'Agni-V', 'INS Vikrant', 
-                           'BrahMos', 'Arjun MK-1A', 'Tejas MK-1A'],
-                'Portée (km)': [3700, 3000, 5000, 7500, 450, 500, 3000],
-                'Année Service': [2020, 2002, 2018, 2022, 2006, 2021, 2021],
-                'Statut': ['Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel']
-            }
-            systems_df = pd.DataFrame(systems_data)
-            
-            fig = px.scatter(systems_df, x='Portée (km)', y='Année Service', 
-                           size='Portée (km)', color='Statut',
-                           hover_name='Système', log_x=True,
-                           title="🎯 CARACTÉRISTIQUES DES SYSTÈMES D'ARMES",
-                           size_max=30)
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_figure('systemes_armes', lambda: self.figure_systemes_armes(self.references['systemes_armes']),
+                                 self.references['systemes_armes'])
         
         with col2:
             # Analyse de la modernisation
-            modernization_data = {
-                'Domaine': ['Forces Terrestres', 'Forces Stratégiques', 
-                          'Défense Aérienne', 'Marine', 'Force Aérienne'],
-                'Niveau 2000': [45, 30, 40, 35, 50],
-                'Niveau 2027': [80, 85, 82, 78, 85]
-            }
-            modern_df = pd.DataFrame(modernization_data)
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='2000', x=modern_df['Domaine'], y=modern_df['Niveau 2000'],
-                                marker_color='#FF9933'))
-            fig.add_trace(go.Bar(name='2027', x=modern_df['Domaine'], y=modern_df['Niveau 2027'],
-                                marker_color='#138808'))
-            
-            fig.update_layout(title="📈 MODERNISATION DES CAPACITÉS MILITAIRES",
-                             barmode='group', height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_figure('modernisation', lambda: self.figure_modernisation(self.references['modernisation']),
+                                 self.references['modernisation'])
             
             # Cartographie des installations
             st.markdown("""
@@ -739,61 +1029,36 @@ class DefenseIndeDashboardAvance:
             </div>
             """, unsafe_allow_html=True)
     
+    def figure_systemes_armes(self, systems_df):
+        """Portée et année de service des principaux systèmes d'armes"""
+        fig = px.scatter(systems_df, x='Portée (km)', y='Année Service', 
+                       size='Portée (km)', color='Statut',
+                       hover_name='Système', log_x=True,
+                       title="🎯 CARACTÉRISTIQUES DES SYSTÈMES D'ARMES",
+                       size_max=30)
+        fig.update_layout(height=500)
+        return fig
+    
+    def figure_modernisation(self, modern_df):
+        """Niveau de modernisation par domaine, 2000 vs 2027"""
+        fig = go.Figure()
+        fig.add_trace(go.Bar(name='2000', x=modern_df['Domaine'], y=modern_df['Niveau 2000'],
+                            marker_color='#FF9933'))
+        fig.add_trace(go.Bar(name='2027', x=modern_df['Domaine'], y=modern_df['Niveau 2027'],
+                            marker_color='#138808'))
+        
+        fig.update_layout(title="📈 MODERNISATION DES CAPACITÉS MILITAIRES",
+                         barmode='group', height=500)
+        return fig
+    
+    @section_instrumentee
     def create_doctrinal_analysis(self, config):
         """Analyse doctrinale avancée"""
-        st.markdown('<h3 class="section-header">📚 ANALYSE DOCTRINALE</h3>', 
-                   unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div class="nuclear-card">
-                <h4>🎯 DOCTRINE NUCLÉAIRE</h4>
-                <p><strong>No First Use:</strong> Non-emploi en premier</p>
-                <p><strong>Dissuasion crédible:</strong> Riposte massive</p>
-                <p><strong>Triade nucléaire:</strong> Terre, air, mer</p>
-                <p><strong>Contrôle civil:</strong> Autorité politique</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class="strategic-card">
-                <h4>⚡ DOCTRINE DE DÉFENSE ACTIVE</h4>
-                <p><strong>Cold Start:</strong> Réponse rapide limitée</p>
-                <p><strong>Défense en profondeur:</strong> Défense échelonnée</p>
-                <p><strong>Mobilité stratégique:</strong> Rapidité de déploiement</p>
-                <p><strong>Coordination interarmes:</strong> Synergie des forces</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div class="air-force-card">
-                <h4>🌊 DOCTRINE MARITIME</h4>
-                <p><strong>Sea Control:</strong> Contrôle des voies maritimes</p>
-                <p><strong>Sea Denial:</strong> Déni d'accès à l'adversaire</p>
-                <p><strong>Projection de puissance:</strong> Force expéditionnaire</p>
-                <p><strong>Coopération régionale:</strong> Sécurité collective</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Principes opérationnels
-        st.markdown("""
-        <div class="navy-card">
-            <h4>🎖️ PRINCIPES OPÉRATIONNELS DES FORCES ARMÉES INDIENNES</h4>
-            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-top: 1rem;">
-                <div><strong>• Unité de commandement:</strong> Coordination centralisée</div>
-                <div><strong>• Mobilité et surprise:</strong> Opérations rapides</div>
-                <div><strong>• Utilisation du terrain:</strong> Avantage montagneux</div>
-                <div><strong>• Guerre intégrée:</strong> Coordination interarmes</div>
-                <div><strong>• Soutien logistique:</strong> Chaîne d'approvisionnement</div>
-                <div><strong>• Préparation permanente:</strong> État d'alerte</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Doctrines et principes opérationnels : contenu fixe, composé une fois par processus
+        RenduCartes.emettre('<h3 class="section-header">📚 ANALYSE DOCTRINALE</h3>'
+                            + html_section_statique('doctrine'))
     
+    @section_instrumentee
     def create_threat_assessment(self, df, config):
         """Évaluation avancée des menaces"""
         st.markdown('<h3 class="section-header">⚠️ ÉVALUATION STRATÉGIQUE DES MENACES</h3>', 
@@ -803,254 +1068,554 @@ class DefenseIndeDashboardAvance:
         
         with col1:
             # Matrice des menaces
-            threats_data = {
-                'Type de Menace': ['Conflit Chine', 'Conflit Pakistan', 'Terrorisme Transfrontalier', 
-                                 'Guerre Cyber', 'Instabilité Maritime', 'Guerre de Montagne'],
-                'Probabilité': [0.6, 0.7, 0.8, 0.9, 0.5, 0.6],
-                'Impact': [0.8, 0.7, 0.6, 0.5, 0.6, 0.7],
-                'Niveau Préparation': [0.8, 0.9, 0.7, 0.6, 0.7, 0.8]
-            }
-            threats_df = pd.DataFrame(threats_data)
-            
-            fig = px.scatter(threats_df, x='Probabilité', y='Impact', 
-                           size='Niveau Préparation', color='Type de Menace',
-                           title="🎯 MATRICE RISQUES - PROBABILITÉ VS IMPACT",
-                           size_max=30)
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_figure('matrice_menaces', lambda: self.figure_matrice_menaces(self.references['menaces']),
+                                 self.references['menaces'])
         
         with col2:
             # Capacités de réponse
-            response_data = {
-                'Scénario': ['Conflit Frontière Chine', 'Conflit Pakistan', 'Attaque Terroriste', 
-                           'Crise Maritime', 'Guerre Cyber'],
-                'Dissuasion': [0.8, 0.7, 0.3, 0.6, 0.4],
-                'Défense': [0.7, 0.8, 0.6, 0.7, 0.5],
-                'Riposte': [0.9, 0.9, 0.8, 0.8, 0.7]
-            }
-            response_df = pd.DataFrame(response_data)
-            
-            fig = go.Figure(data=[
-                go.Bar(name='Dissuasion', x=response_df['Scénario'], y=response_df['Dissuasion']),
-                go.Bar(name='Défense', x=response_df['Scénario'], y=response_df['Défense']),
-                go.Bar(name='Riposte', x=response_df['Scénario'], y=response_df['Riposte'])
-            ])
-            fig.update_layout(title="🛡️ CAPACITÉS DE RÉPONSE PAR SCÉNARIO",
-                             barmode='group', height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_figure('capacites_reponse', lambda: self.figure_capacites_reponse(self.references['reponse']),
+                                 self.references['reponse'])
         
         # Recommandations stratégiques
-        st.markdown("""
-        <div class="nuclear-card">
-            <h4>🎯 RECOMMANDATIONS STRATÉGIQUES</h4>
-            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-top: 1rem;">
-                <div><strong>• Renforcement nucléaire:</strong> Compléter la triade</div>
-                <div><strong>• Modernisation conventionnelle:</strong> Equipements avancés</div>
-                <div><strong>• Défense aérienne:</strong> Systèmes intégrés</div>
-                <div><strong>• Puissance navale:</strong> Projection dans l'océan Indien</div>
-                <div><strong>• Cyber défense:</strong> Protection des infrastructures</div>
-                <div><strong>• Autosuffisance:</strong> Programme Make in India</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        RenduCartes.emettre(html_section_statique('menaces'))
     
+    def figure_matrice_menaces(self, threats_df):
+        """Matrice probabilité / impact des menaces"""
+        fig = px.scatter(threats_df, x='Probabilité', y='Impact', 
+                       size='Niveau Préparation', color='Type de Menace',
+                       title="🎯 MATRICE RISQUES - PROBABILITÉ VS IMPACT",
+                       size_max=30)
+        fig.update_layout(height=500)
+        return fig
+    
+    def figure_capacites_reponse(self, response_df):
+        """Capacités de réponse par scénario"""
+        fig = go.Figure(data=[
+            go.Bar(name='Dissuasion', x=response_df['Scénario'], y=response_df['Dissuasion']),
+            go.Bar(name='Défense', x=response_df['Scénario'], y=response_df['Défense']),
+            go.Bar(name='Riposte', x=response_df['Scénario'], y=response_df['Riposte'])
+        ])
+        fig.update_layout(title="🛡️ CAPACITÉS DE RÉPONSE PAR SCÉNARIO",
+                         barmode='group', height=500)
+        return fig
+    
+    @section_instrumentee
     def create_missile_database(self):
         """Base de données des systèmes de missiles"""
         st.markdown('<h3 class="section-header">🚀 BASE DE DONNÉES DES SYSTÈMES DE MISSILES</h3>', 
                    unsafe_allow_html=True)
         
-        missile_data = []
-        for nom, specs in self.missile_systems.items():
-            missile_data.append({
-                'Système': nom,
-                'Type': specs['type'],
-                'Portée (km)': specs['portee'],
-                'Ogives': specs.get('ogives', 'N/A'),
-                'Statut': specs['statut'],
-                'Vitesse': specs.get('vitesse', 'N/A')
-            })
+        catalogue = self.catalogue_missiles
+        if not len(catalogue):
+            st.info("Aucun système de missiles dans la source de données.")
+            return
+        
+        # Filtres résolus par dichotomie sur la portée puis par les index inversés type et statut
+        col_portee, col_types, col_statuts = st.columns([2, 2, 1])
+        with col_portee:
+            if catalogue.portees[0] == catalogue.portees[-1]:
+                # Une seule portée : aucun intervalle à choisir
+                portee_min = portee_max = None
+                st.caption(f"Portée : {int(catalogue.portees[0]):,} km")
+            else:
+                portee_min, portee_max = st.slider(
+                    "Portée (km)", int(catalogue.portees[0]), int(catalogue.portees[-1]),
+                    (int(catalogue.portees[0]), int(catalogue.portees[-1])), key='missiles_portee'
+                )
+        with col_types:
+            types = st.multiselect("Types", list(catalogue.types), key='missiles_types')
+        with col_statuts:
+            statuts = st.multiselect("Statuts", list(catalogue.statuts), key='missiles_statuts')
         
-        missile_df = pd.DataFrame(missile_data)
+        positions = catalogue.filtrer(portee_min, portee_max, types or None, statuts or None)
+        missile_df = catalogue.frame(positions)
         
         # Affichage interactif
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            fig = px.scatter(missile_df, x='Portée (km)', y='Ogives',
-                           size='Portée (km)', color='Type',
-                           hover_name='Système', log_x=True,
-                           title="🚀 CARACTÉRISTIQUES DES SYSTÈMES DE MISSILES",
-                           size_max=30)
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.afficher_figure('systemes_missiles', lambda: self.figure_systemes_missiles(missile_df), missile_df)
         
         with col2:
-            st.markdown("""
-            <div class="nuclear-card">
-                <h4>📋 INVENTAIRE MISSILISTIQUE</h4>
-            """, unsafe_allow_html=True)
-            
-            for missile in missile_data:
-                st.markdown(f"""
-                <div style="background: rgba(255,255,255,0.1); padding: 0.5rem; margin: 0.2rem 0; border-radius: 5px;">
-                    <strong>{missile['Système']}</strong><br>
-                    🎯 {missile['Type']} • 🚀 {missile['Portée (km)']:,} km<br>
-                    💣 {missile['Ogives']} • {missile['Statut']}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
+            # Inventaire : une seule table virtualisée, paginée, au lieu d'un bloc par système
+            st.markdown("#### 📋 INVENTAIRE MISSILISTIQUE")
+            n_pages = max(1, -(-len(positions) // LIGNES_PAR_PAGE_INVENTAIRE))
+            page = st.number_input(f"Page (sur {n_pages})", 1, n_pages, 1, key='missiles_page')
+            debut = (min(page, n_pages) - 1) * LIGNES_PAR_PAGE_INVENTAIRE
+            st.dataframe(missile_df.iloc[debut:debut + LIGNES_PAR_PAGE_INVENTAIRE],
+                         hide_index=True, use_container_width=True, height=400)
+            st.caption(f"{len(positions):,} système(s) sur {len(catalogue):,}")
     
-    def run_advanced_dashboard(self):
-        """Exécute le dashboard avancé complet"""
-        # Sidebar avancé
-        controls = self.create_advanced_sidebar()
-        
-        # Header avancé
-        self.display_advanced_header()
-        
-        # Génération des données avancées
-        df, config = self.generate_advanced_data(controls['selection'])
-        
-        # Navigation par onglets avancés
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-            "📊 Tableau de Bord", 
-            "🔬 Analyse Technique", 
-            "🌍 Contexte Géopolitique", 
-            "📚 Doctrine Militaire",
-            "⚠️ Évaluation Menaces",
-            "🚀 Systèmes de Missiles",
-            "💎 Synthèse Stratégique"
-        ])
+    @section_instrumentee
+    def create_naval_fleet(self):
+        """Registre de la flotte et agrégats précalculés"""
+        st.markdown('<h3 class="section-header">⚓ REGISTRE DE LA FLOTTE NAVALE</h3>', 
+                   unsafe_allow_html=True)
         
-        with tab1:
-            self.display_strategic_metrics(df, config)
-            self.create_comprehensive_analysis(df, config)
+        # Agrégats tenus à jour par le registre : aucun parcours des coques ici
+        agregats = self.flotte.agregats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("🚢 Coques", f"{agregats['coques']:,}")
+        with col2:
+            st.metric("⚖️ Tonnage total", f"{agregats['tonnage_total']:,.0f} t")
+        with col3:
+            st.metric("🛩️ Groupe aérien embarqué", f"{agregats['avions_embarques']:,} avions",
+                      f"{agregats['porte_avions']} porte-avions", delta_color="off")
+        with col4:
+            st.metric("✅ Opérationnels", f"{agregats['coques_par_statut'].get('Opérationnel', 0):,}")
+        
+        tonnage_df = self.tableau_tonnage(agregats)
+        col_graphique, col_statuts = st.columns([2, 1])
+        with col_graphique:
+            self.afficher_figure('tonnage_flotte', lambda: self.figure_tonnage_flotte(tonnage_df), tonnage_df)
+        with col_statuts:
+            st.markdown("#### 📋 COQUES PAR STATUT")
+            st.dataframe(pd.DataFrame({'Statut': list(agregats['coques_par_statut']),
+                                       'Coques': list(agregats['coques_par_statut'].values())}),
+                         hide_index=True, use_container_width=True)
+        
+        st.dataframe(self.flotte.frame(), hide_index=True, use_container_width=True, height=400)
+    
+    @staticmethod
+    def tableau_tonnage(agregats):
+        """Tonnage et nombre de coques par type, depuis les agrégats du registre"""
+        return pd.DataFrame({'Type': list(agregats['tonnage_par_type']),
+                             'Tonnage': list(agregats['tonnage_par_type'].values()),
+                             'Coques': list(agregats['coques_par_type'].values())})
+    
+    def figure_tonnage_flotte(self, tonnage_df):
+        """Tonnage et nombre de coques par type de bâtiment"""
+        fig = go.Figure(go.Bar(
+            x=tonnage_df['Type'], y=tonnage_df['Tonnage'],
+            text=[f"{n} coque(s)" for n in tonnage_df['Coques']],
+            marker_color='#000080'
+        ))
+        fig.update_layout(title="⚖️ TONNAGE PAR TYPE DE BÂTIMENT", yaxis_title="Déplacement (t)", height=400)
+        return fig
+    
+    @section_instrumentee
+    def create_comparison_analysis(self, controls):
+        """Comparaison de plusieurs sélections sur les mêmes indicateurs"""
+        st.markdown('<h3 class="section-header">⚖️ COMPARAISON DES SÉLECTIONS</h3>', 
+                   unsafe_allow_html=True)
         
-        with tab2:
-            self.create_technical_analysis(df, config)
+        selections = sorted(controls['selections_comparaison'])
+        if not selections:
+            st.info("Choisissez les sélections à comparer dans le panel de contrôle (⚖️ MODE COMPARAISON).")
+            return
         
-        with tab3:
-            if controls['show_geopolitical']:
-                self.create_geopolitical_analysis(df, config)
+        # Une seule passe vectorisée pour toutes les sélections : chacune n'est qu'une ligne de plus du cube
+        cube = self.obtenir_cube(selections, *controls['horizon'])
+        long_df = obtenir_cache_donnees().obtenir(
+            ('comparaison', tuple(selections), controls['scenario'], controls['horizon']),
+            lambda: cube.format_long(controls['scenario'])
+        )
         
-        with tab4:
-            if controls['show_doctrinal']:
-                self.create_doctrinal_analysis(config)
+        indicateurs = list(long_df['Indicateur'].cat.categories)
+        choix = st.multiselect("Indicateurs:", indicateurs, default=INDICATEURS_COMPARAISON,
+                               key='indicateurs_comparaison')
+        if not choix:
+            return
+        vue = long_df[long_df['Indicateur'].isin(choix)]
+        vue = vue.assign(Indicateur=vue['Indicateur'].cat.remove_unused_categories())
+        
+        self.afficher_figure('comparaison', lambda: self.figure_comparaison(vue), vue)
+        
+        # Dernière valeur de l'horizon : sélections en lignes, indicateurs en colonnes
+        derniere = vue[vue['Annee'] == vue['Annee'].max()]
+        tableau = derniere.pivot_table(index='Selection', columns='Indicateur', values='Valeur', observed=True)
+        tableau.index, tableau.columns = tableau.index.astype(str), tableau.columns.astype(str)
+        st.dataframe(tableau, use_container_width=True)
+        st.caption(f"Scénario « {controls['scenario']} », paramètres par défaut de chaque sélection")
+    
+    def figure_comparaison(self, long_df):
+        """Courbes superposées des sélections, un panneau par indicateur (séries sous-échantillonnées)"""
+        from plotly.subplots import make_subplots
+        
+        indicateurs = list(long_df['Indicateur'].cat.categories)
+        selections = list(long_df['Selection'].unique())
+        couleurs = px.colors.qualitative.Plotly
+        lignes = (len(indicateurs) + 1) // 2
+        fig = make_subplots(rows=lignes, cols=2, subplot_titles=indicateurs)
+        
+        for (indicateur, selection), serie in long_df.groupby(['Indicateur', 'Selection'], observed=True):
+            position = indicateurs.index(indicateur)
+            rang = selections.index(selection)
+            serie = serie.sort_values('Annee')
+            fig.add_trace(
+                self.trace_serie(serie['Annee'], serie['Valeur'], mode='lines', name=str(selection),
+                                 legendgroup=str(selection), showlegend=position == 0,
+                                 line=dict(color=couleurs[rang % len(couleurs)])),
+                row=position // 2 + 1, col=position % 2 + 1
+            )
         
-        with tab5:
-            if controls['threat_assessment']:
-                self.create_threat_assessment(df, config)
+        fig.update_layout(title="⚖️ COMPARAISON DES SÉLECTIONS", height=350 * lignes)
+        return fig
+    
+    def figure_systemes_missiles(self, missile_df):
+        """Portée et charge des systèmes de missiles"""
+        fig = px.scatter(missile_df, x='Portée (km)', y='Ogives',
+                       size='Portée (km)', color='Type',
+                       hover_name='Système', log_x=True,
+                       title="🚀 CARACTÉRISTIQUES DES SYSTÈMES DE MISSILES",
+                       size_max=30,
+                       render_mode='webgl' if len(missile_df) > self.seuil_webgl else 'auto')
+        fig.update_layout(height=500)
+        return fig
+    
+    def indices_reduits(self, x, y):
+        """Indices des points conservés pour le budget de points courant (LTTB)"""
+        return lttb(x, y, self.points_max_courbe)
+    
+    def trace_serie(self, x, y, indices=None, **proprietes):
+        """Trace d'une série longue : sous-échantillonnée (LTTB) puis en WebGL au-delà du seuil"""
+        x, y = np.asarray(x), np.asarray(y)
+        trace = go.Scattergl if len(x) > self.seuil_webgl else go.Scatter
+        if indices is None:
+            indices = self.indices_reduits(x, y)
+        return trace(x=x[indices], y=y[indices], **proprietes)
+    
+    def nom_figure(self, nom, df=None):
+        # Le rendu des séries dépend aussi des réglages de sous-échantillonnage
+        return nom if df is None else f"{nom}@{self.points_max_courbe}/{self.seuil_webgl}"
+    
+    def obtenir_figure(self, nom, construire, df=None):
+        """Figure construite une seule fois par processus (ou par version de `df`)"""
+        return obtenir_cache_figures().obtenir(self.nom_figure(nom, df), construire, df)
+    
+    def afficher_figure(self, nom, construire, df=None):
+        """Affiche une figure du cache de figures"""
+        with self.instrumentation.mesurer(f"figure:{nom}", 'figure'):
+            fig = self.obtenir_figure(nom, construire, df)
+        if self.instrumentation.actif:
+            # Sérialisation supplémentaire, chronométrée à part pour ne pas gonfler la durée de la figure
+            with self.instrumentation.mesurer(f"payload:{nom}", 'payload') as details:
+                details['octets'] = len(fig.to_json().encode())
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def afficher_serie_progressive(self, nom, construire, df):
+        """Série temporelle longue peinte par tranches de `points_max_courbe` points dans un même emplacement.
+        
+        `construire(df)` produit la figure d'un DataFrame indexé par 'Annee'. Une série qui tient
+        dans le budget de points est affichée d'un bloc ; sinon la première tranche s'affiche
+        aussitôt. Seule la figure complète entre dans le cache de figures.
+        """
+        if len(df) <= self.points_max_courbe or obtenir_cache_figures().contient(self.nom_figure(nom, df), df):
+            self.afficher_figure(nom, lambda: construire(df), df)
+            return
+        annees = df['Annee'].to_numpy()
+        emplacement = st.empty()
+        for fin in range(self.points_max_courbe, len(df), self.points_max_courbe):
+            fig = construire(df.iloc[:fin])
+            # Axe fixé sur l'horizon complet : la courbe s'allonge sans changement d'échelle
+            fig.update_xaxes(range=[annees[0], annees[-1]])
+            emplacement.plotly_chart(fig, use_container_width=True)
+        with emplacement.container():
+            self.afficher_figure(nom, lambda: construire(df), df)
+    
+    def sections_rapport(self, df, controls):
+        """Contenu du rapport exporté : (titre, HTML fixe, [(nom, figure)]) par section, figures du cache"""
+        def figure(nom, construire, donnees=None):
+            return nom, self.obtenir_figure(nom, construire, donnees)
+        
+        refs = self.references
+        missile_df = self.catalogue_missiles.frame()
+        tonnage_df = self.tableau_tonnage(self.flotte.agregats())
+        figures_tableau = [figure('capacites_strategiques', lambda: self.figure_capacites_strategiques(df), df)]
+        if any(col in df.columns for col in ('Stock_Ogives_Nucleaires', 'Tests_Missiles', 'Navires_Combat')):
+            figures_tableau.append(figure('programmes_strategiques', lambda: self.figure_programmes_strategiques(df), df))
         
-        with tab6:
-            if controls['show_technical']:
-                self.create_missile_database()
+        return [
+            ("🎯 TABLEAU DE BORD STRATÉGIQUE", self.html_metriques(df), figures_tableau),
+            ("🔬 ANALYSE TECHNIQUE AVANCÉE", "", [
+                figure('systemes_armes', lambda: self.figure_systemes_armes(refs['systemes_armes']), refs['systemes_armes']),
+                figure('modernisation', lambda: self.figure_modernisation(refs['modernisation']), refs['modernisation']),
+            ]),
+            ("🌍 CONTEXTE GÉOPOLITIQUE", html_section_statique('geopolitique'), [
+                figure('tensions_regionales', lambda: self.figure_tensions_regionales(refs['tensions']), refs['tensions']),
+                figure('cooperation', lambda: self.figure_cooperation(df), df),
+            ]),
+            ("📚 ANALYSE DOCTRINALE", html_section_statique('doctrine'), []),
+            ("⚠️ ÉVALUATION STRATÉGIQUE DES MENACES", html_section_statique('menaces'), [
+                figure('matrice_menaces', lambda: self.figure_matrice_menaces(refs['menaces']), refs['menaces']),
+                figure('capacites_reponse', lambda: self.figure_capacites_reponse(refs['reponse']), refs['reponse']),
+            ]),
+            ("🚀 BASE DE DONNÉES DES SYSTÈMES DE MISSILES", "", [
+                figure('systemes_missiles', lambda: self.figure_systemes_missiles(missile_df), missile_df),
+            ]),
+            ("⚓ REGISTRE DE LA FLOTTE NAVALE", "", [
+                figure('tonnage_flotte', lambda: self.figure_tonnage_flotte(tonnage_df), tonnage_df),
+            ]),
+            ("💎 SYNTHÈSE STRATÉGIQUE - RÉPUBLIQUE DE L'INDE", html_section_statique('synthese'), []),
+        ]
+    
+    def afficher_panneau_export(self, df, controls):
+        """Export du rapport de la sélection et du scénario courants, rendu en arrière-plan"""
+        with st.sidebar.expander("📄 EXPORT DU RAPPORT"):
+            png = st.checkbox("Figures PNG", value=False, disabled=not png_disponible(), key='export_png',
+                              help="Nécessite le paquet optionnel kaleido")
+            if st.button("Générer le rapport", key='export_lancer'):
+                titre = f"Analyse stratégique - {controls['selection']} - {controls['scenario']}"
+                st.session_state['export_rapport'] = ExportRapport(
+                    titre, self.sections_rapport(df, controls), obtenir_pool_export(), CSS_COMPACT, png
+                )
+            export = st.session_state.get('export_rapport')
+            if export is None:
+                return
+            if export.termine():
+                self.afficher_export_termine(export)
+            else:
+                self.suivre_export(export)
+    
+    @st.fragment(run_every=1)
+    def suivre_export(self, export):
+        """Progression de l'export, rafraîchie seule chaque seconde jusqu'à la fin du rendu"""
+        rendues, total = export.progression()
+        st.progress(rendues / max(total, 1), text=f"Rendu des figures : {rendues}/{total}")
+        if export.termine():
+            st.rerun()
+    
+    def afficher_export_termine(self, export):
+        """Téléchargements ; le fichier n'est assemblé qu'au clic, hors du rerun"""
+        for nom, message in export.erreurs().items():
+            st.warning(f"Figure {nom} non exportée : {message}")
+        nom_fichier = "rapport_defense_inde"
+        st.download_button("⬇️ Rapport HTML", export.html, file_name=f"{nom_fichier}.html",
+                           mime="text/html", on_click='ignore', key='export_html')
+        if export.png:
+            st.download_button("⬇️ Figures PNG (ZIP)", export.archive_png, file_name=f"{nom_fichier}_png.zip",
+                               mime="application/zip", on_click='ignore', key='export_png_zip')
+    
+    def run_advanced_dashboard(self):
+        """Exécute le dashboard avancé complet"""
+        # Sidebar avancé
+        controls = self.create_advanced_sidebar()
+        self.instrumentation = Instrumentation(controls['instrumentation'])
+        self.points_max_courbe = controls['points_max_courbe']
+        self.seuil_webgl = controls['seuil_webgl']
+        
+        with self.instrumentation.mesurer('rerun', 'rerun'):
+            # Header avancé
+            annee_debut, annee_fin, resolution = controls['horizon']
+            self.display_advanced_header(annee_debut, annee_fin)
+            
+            # Génération des données avancées (mémorisées entre les reruns et les sessions)
+            with self.instrumentation.mesurer('obtenir_donnees', 'donnees'):
+                df, config = self.obtenir_donnees(controls['selection'], controls['scenario'],
+                                                  annee_debut, annee_fin, resolution, controls['surcharges'])
+            self.afficher_statistiques_cache()
+            self.afficher_rapport_memoire(df, controls)
+            self.afficher_panneau_export(df, controls)
+            
+            # Navigation : seule la section visible est calculée et envoyée au navigateur
+            onglet = st.radio("Section", list(ONGLETS), horizontal=True,
+                              key="onglet_actif", label_visibility="collapsed")
+            self.rendre_section(onglet, df, config, controls)
+            self.afficher_latences_onglets()
+            self.afficher_memoire_sessions()
+        
+        if self.instrumentation.actif:
+            self.afficher_panneau_instrumentation()
+    
+    @st.fragment
+    def rendre_section(self, onglet, df, config, controls):
+        """Rend une section ; relancée seule (fragment) quand ses propres contrôles changent"""
+        debut = time.perf_counter()
+        getattr(self, ONGLETS[onglet])(df, config, controls)
+        latences = st.session_state.setdefault('latences_onglets', {})
+        latences[onglet] = (time.perf_counter() - debut) * 1000
+    
+    def afficher_panneau_instrumentation(self):
+        """Minutage du rerun dans le sidebar et export de la trace Chrome"""
+        numero = st.session_state['rerun_instrumente'] = st.session_state.get('rerun_instrumente', 0) + 1
+        with st.sidebar.expander("🔍 INSTRUMENTATION", expanded=True):
+            st.dataframe(self.instrumentation.tableau(), hide_index=True, use_container_width=True)
+            st.download_button("⬇️ Trace Chrome (JSON)", self.instrumentation.trace_chrome(),
+                               file_name=f"trace_rerun_{numero}.json", mime="application/json")
+    
+    def afficher_memoire_sessions(self):
+        """Mémoire propre à la session (session_state) et mémoire partagée par le processus"""
+        partages = [self.catalogues, self.references, obtenir_cache_donnees(), obtenir_cache_figures()]
+        with st.sidebar.expander("👥 MÉMOIRE PAR SESSION"):
+            # Parcours complet des objets : uniquement à la demande
+            if not st.toggle("Mesurer à chaque rerun", key='mesure_memoire'):
+                return
+            # Chaque clé est mesurée hors de ce qui est partagé entre sessions
+            lignes = [(cle, taille_profonde(st.session_state[cle], partages)) for cle in st.session_state]
+            session = pd.DataFrame(lignes, columns=['Clé', 'Octets']).sort_values('Octets', ascending=False)
+            st.dataframe(session, hide_index=True, use_container_width=True, height=200)
+            octets_session = int(session['Octets'].sum())
+            octets_partages = (taille_profonde(self.catalogues) + taille_profonde(self.references)
+                               + obtenir_cache_donnees().octets())
+            col1, col2 = st.columns(2)
+            col1.metric("Session", f"{octets_session / 1024:.1f} Ko")
+            col2.metric("Partagé", f"{octets_partages / 1024:.1f} Ko")
+            n_sessions = st.number_input("Sessions simultanées", min_value=1, value=100, step=50,
+                                         key='capacite_sessions')
+            st.caption(f"Estimation pour {n_sessions} sessions : "
+                       f"{(octets_partages + n_sessions * octets_session) / 1024 ** 2:.1f} Mo "
+                       f"(hors cache de figures, {len(obtenir_cache_figures())} figures)")
+    
+    def afficher_latences_onglets(self):
+        """Dernière latence de rendu mesurée par section"""
+        latences = st.session_state.get('latences_onglets', {})
+        with st.sidebar.expander("⏱️ LATENCE PAR SECTION"):
+            for onglet, duree_ms in latences.items():
+                st.caption(f"{onglet} : {duree_ms:.0f} ms")
+    
+    def onglet_tableau_de_bord(self, df, config, controls):
+        self.display_strategic_metrics(df, config)
+        self.create_comprehensive_analysis(df, config, controls)
+    
+    def onglet_analyse_technique(self, df, config, controls):
+        self.create_technical_analysis(df, config)
+    
+    def onglet_contexte_geopolitique(self, df, config, controls):
+        if controls['show_geopolitical']:
+            self.create_geopolitical_analysis(df, config)
+    
+    def onglet_doctrine(self, df, config, controls):
+        if controls['show_doctrinal']:
+            self.create_doctrinal_analysis(config)
+    
+    def onglet_menaces(self, df, config, controls):
+        if controls['threat_assessment']:
+            self.create_threat_assessment(df, config)
+    
+    def onglet_missiles(self, df, config, controls):
+        if controls['show_technical']:
+            self.create_missile_database()
+    
+    def onglet_flotte(self, df, config, controls):
+        if controls['show_technical']:
+            self.create_naval_fleet()
+    
+    def onglet_comparaison(self, df, config, controls):
+        self.create_comparison_analysis(controls)
+    
+    def onglet_sensibilite(self, df, config, controls):
+        self.create_sensitivity_analysis(controls)
+    
+    def onglet_synthese(self, df, config, controls):
+        self.create_strategic_synthesis(df, config, controls)
+    
+    @section_instrumentee
+    def create_sensitivity_analysis(self, controls):
+        """Influence de chaque paramètre du modèle : tornades un-à-la-fois, indices de Morris et de Sobol"""
+        st.markdown('<h3 class="section-header">🎚️ ANALYSE DE SENSIBILITÉ</h3>', 
+                   unsafe_allow_html=True)
         
-        with tab7:
-            self.create_strategic_synthesis(df, config, controls)
+        analyse = calculer_sensibilite(controls['selection'], controls['scenario'],
+                                       tuple(sorted(controls['surcharges'].items())), controls['horizon'])
+        annee_debut, annee_fin, _ = controls['horizon']
+        st.caption(f"Moyenne de chaque indicateur sur {annee_debut}-{annee_fin}, paramètres à ±{analyse.plage:.0%} "
+                   f"de leur valeur : {analyse.n_evaluations:,} vecteurs de paramètres évalués en lot.")
+        
+        # Une tornade par indicateur, paramètres sans effet omis
+        colonnes = st.columns(2)
+        for i, indicateur in enumerate(analyse.oat):
+            tornade_df = analyse.tableau(indicateur)
+            tornade_df = tornade_df[(tornade_df['Écart haut'] != 0) | (tornade_df['Écart bas'] != 0)]
+            with colonnes[i % 2]:
+                self.afficher_figure(f'tornade_{indicateur}',
+                                     lambda: self.figure_tornade(tornade_df, indicateur, analyse.plage),
+                                     tornade_df)
+        
+        indicateur = st.selectbox("Indices détaillés:", list(analyse.oat), key='sensibilite_indicateur',
+                                  format_func=lambda nom: nom.replace('_', ' '))
+        st.dataframe(analyse.tableau(indicateur), hide_index=True, use_container_width=True,
+                     column_config={colonne: st.column_config.NumberColumn(format="%.3f")
+                                    for colonne in ('Valeur', 'Écart bas', 'Écart haut', 'Morris μ*', 'Morris σ',
+                                                    'Sobol S1', 'Sobol ST')})
+    
+    def figure_tornade(self, tornade_df, indicateur, plage=PLAGE_SENSIBILITE):
+        """Écart de l'indicateur à sa référence, paramètre au bas puis au haut de sa plage"""
+        # Paramètre le plus influent en haut du graphique
+        tornade_df = tornade_df.iloc[::-1]
+        fig = go.Figure()
+        fig.add_trace(go.Bar(y=tornade_df['Paramètre'], x=tornade_df['Écart bas'], orientation='h',
+                             name=f"-{plage:.0%}", marker_color='#FF9933'))
+        fig.add_trace(go.Bar(y=tornade_df['Paramètre'], x=tornade_df['Écart haut'], orientation='h',
+                             name=f"+{plage:.0%}", marker_color='#138808'))
+        fig.update_layout(title=f"🌪️ {indicateur.replace('_', ' ')}", barmode='overlay',
+                          xaxis_title="Écart à la référence", height=350, template="plotly_white",
+                          legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+        return fig
     
+    @section_instrumentee
     def create_strategic_synthesis(self, df, config, controls):
         """Synthèse stratégique finale"""
-        st.markdown('<h3 class="section-header">💎 SYNTHÈSE STRATÉGIQUE - RÉPUBLIQUE DE L\'INDE</h3>', 
-                   unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            <div class="nuclear-card">
-                <h4>🏆 POINTS FORTS STRATÉGIQUES</h4>
-                <div style="margin-top: 1rem;">
-                    <div class="strategic-card" style="margin: 0.5rem 0;">
-                        <strong>☢️ Statut de Puissance Nucléaire</strong>
-                        <p>Triade nucléaire en développement avec doctrine de non-emploi en premier</p>
-                    </div>
-                    <div class="navy-card" style="margin: 0.5rem 0;">
-                        <strong>🌊 Puissance Navale Croissante</strong>
-                        <p>Deux porte-avions opérationnels et flotte en modernisation accélérée</p>
-                    </div>
-                    <div class="air-force-card" style="margin: 0.5rem 0;">
-                        <strong>✈️ Force Aérienne Moderne</strong>
-                        <p>Mix d'avions occidentaux et russes avec développement de capacités indigènes</p>
-                    </div>
-                    <div class="army-card" style="margin: 0.5rem 0;">
-                        <strong>🏔️ Expertise en Guerre de Montagne</strong>
-                        <p>Forces spécialisées dans le combat en haute altitude et conditions extrêmes</p>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class="strategic-card">
-                <h4>🎯 DÉFIS ET VULNÉRABILITÉS</h4>
-                <div style="margin-top: 1rem;">
-                    <div class="strategic-card" style="margin: 0.5rem 0;">
-                        <strong>💸 Dépendance aux Importations</strong>
-                        <p>70% des équipements militaires encore importés malgré Make in India</p>
-                    </div>
-                    <div class="strategic-card" style="margin: 0.5rem 0;">
-                        <strong>🔧 Retards Technologiques</strong>
-                        <p>Certains programmes indigènes connaissent des retards importants</p>
-                    </div>
-                    <div class="strategic-card" style="margin: 0.5rem 0;">
-                        <strong>🌐 Défis Logistiques</strong>
-                        <p>Approvisionnement des forces dans les régions frontalières reculées</p>
-                    </div>
-                    <div class="strategic-card" style="margin: 0.5rem 0;">
-                        <strong>⚡ Menaces Asymétriques</strong>
-                        <p>Terrorisme transfrontalier et guerre hybride avec le Pakistan</p>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Perspectives futures
-        st.markdown("""
-        <div class="metric-card">
-            <h4>🔮 PERSPECTIVES STRATÉGIQUES 2027-2035</h4>
-            <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-top: 1rem;">
-                <div>
-                    <h5>🚀 DOMAINE NUCLÉAIRE</h5>
-                    <p>• Triade nucléaire complète<br>• Missiles Agni-VI<br>• Sous-marins Arihant avancés<br>• Bombardiers stratégiques</p>
-                </div>
-                <div>
-                    <h5>🌊 PUISSANCE NAVALE</h5>
-                    <p>• 3ème porte-avions indigène<br>• 6 sous-marins nucléaires<br>• Destroyers de nouvelle génération<br>• Base aéronavale dans les Andaman</p>
-                </div>
-                <div>
-                    <h5>💻 TECHNOLOGIES AVANCÉES</h5>
-                    <p>• AMCA 5ème génération<br>• Drones de combat indigènes<br>• Guerre cyber avancée<br>• Systèmes hypersoniques</p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Recommandations finales
-        st.markdown("""
-        <div class="nuclear-card">
-            <h4>🎖️ RECOMMANDATIONS STRATÉGIQUES FINALES</h4>
-            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-top: 1rem;">
-                <div>
-                    <h5>🛡️ DÉFENSE ACTIVE</h5>
-                    <p>• Accélérer Make in India Défense<br>
-                    • Renforcer la triade nucléaire<br>
-                    • Développer les capacités cyber<br>
-                    • Moderniser les forces conventionnelles</p>
-                </div>
-                <div>
-                    <h5>🤝 COOPÉRATION STRATÉGIQUE</h5>
-                    <p>• Approfondir le partenariat QUAD<br>
-                    • Renforcer les relations avec la France<br>
-                    • Développer la coopération indo-pacifique<br>
-                    • Maintenir le partenariat avec la Russie</p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # En-tête, points forts, défis, perspectives et recommandations en un seul élément
+        RenduCartes.emettre('<h3 class="section-header">💎 SYNTHÈSE STRATÉGIQUE - RÉPUBLIQUE DE L\'INDE</h3>'
+                            + html_section_statique('synthese'))
+        self.afficher_projections(df, controls)
+    
+    def obtenir_prevision(self, df, controls):
+        """Modèles de prévision ajustés, mémorisés par sélection, scénario, horizon et surcharges"""
+        cle = ('prevision', controls['selection'], controls['scenario'], controls['horizon'],
+               tuple(sorted(controls['surcharges'].items())))
+        resolution = controls['horizon'][2]
+        return obtenir_cache_donnees().obtenir(cle, lambda: ModelePrevision(df, RESOLUTIONS[resolution]))
+    
+    def afficher_projections(self, df, controls):
+        """Projections chiffrées jusqu'à ANNEE_PROJECTION, avec intervalles à 95 %"""
+        _, annee_fin, resolution = controls['horizon']
+        st.markdown(f'<h3 class="section-header">🔮 PROJECTIONS {annee_fin + 1}-{ANNEE_PROJECTION}</h3>',
+                    unsafe_allow_html=True)
+        if annee_fin >= ANNEE_PROJECTION:
+            st.info(f"L'horizon affiché couvre déjà {ANNEE_PROJECTION} : aucune projection nécessaire.")
+            return
+        
+        prevision = self.obtenir_prevision(df, controls)
+        col1, col2 = st.columns([1, 3])
+        modele = col1.radio("Modèle:", list(MODELES_PREVISION), format_func=MODELES_PREVISION.get,
+                            key='modele_prevision')
+        indicateurs = col2.multiselect("Indicateurs:", prevision.colonnes, key='indicateurs_prevision',
+                                       default=[nom for nom in INDICATEURS_COMPARAISON if nom in prevision.colonnes])
+        if not indicateurs:
+            return
+        
+        # Projection depuis les paramètres mémorisés : aucun réajustement au changement de modèle
+        projection = prevision.frame(generer_axe_temporel(annee_fin + 1, ANNEE_PROJECTION, resolution), modele)
+        finales = projection[projection['Annee'] == projection['Annee'].iloc[-1]].set_index('Indicateur')
+        RenduCartes.emettre(RenduCartes.grille([
+            RenduCartes.metrique("metric-card", f"🔮 {nom.replace('_', ' ')} {ANNEE_PROJECTION}",
+                                 f"{finales.at[nom, 'Prevision']:,.1f}",
+                                 f"IC 95 % : {finales.at[nom, 'Bas']:,.1f} - {finales.at[nom, 'Haut']:,.1f}")
+            for nom in indicateurs
+        ], min(len(indicateurs), 4)))
+        
+        colonnes = st.columns(2)
+        for i, indicateur in enumerate(indicateurs):
+            serie_df = pd.concat([
+                pd.DataFrame({'Annee': df['Annee'].to_numpy(dtype=float), 'Observe': df[indicateur].to_numpy()}),
+                projection[projection['Indicateur'] == indicateur].drop(columns='Indicateur'),
+            ], ignore_index=True)
+            with colonnes[i % 2]:
+                self.afficher_figure(f'prevision_{indicateur}_{modele}',
+                                     lambda: self.figure_prevision(serie_df, indicateur, modele), serie_df)
+    
+    def figure_prevision(self, serie_df, indicateur, modele):
+        """Série observée, projection centrale et intervalle à 95 %"""
+        observe = serie_df[serie_df['Observe'].notna()]
+        futur = serie_df[serie_df['Prevision'].notna()]
+        fig = go.Figure()
+        fig.add_trace(self.trace_serie(observe['Annee'], observe['Observe'], mode='lines', name='Simulé',
+                                       line=dict(color='#138808', width=3)))
+        fig.add_trace(go.Scatter(x=futur['Annee'], y=futur['Haut'], mode='lines', line=dict(width=0),
+                                 showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=futur['Annee'], y=futur['Bas'], mode='lines', name='IC 95 %', line=dict(width=0),
+                                 fill='tonexty', fillcolor='rgba(255, 153, 51, 0.3)'))
+        fig.add_trace(go.Scatter(x=futur['Annee'], y=futur['Prevision'], mode='lines', name=MODELES_PREVISION[modele],
+                                 line=dict(color='#FF671F', width=3, dash='dash')))
+        fig.update_layout(title=f"🔮 {indicateur.replace('_', ' ')} → {ANNEE_PROJECTION}",
+                          height=400, template="plotly_white",
+                          legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+        return fig
 
 # Lancement du dashboard avancé
 if __name__ == "__main__":
+    configurer_page()
     dashboard = DefenseIndeDashboardAvance()
     dashboard.run_advanced_dashboard()
\ No newline at end of file
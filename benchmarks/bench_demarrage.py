@@ -0,0 +1,92 @@
+# bench_demarrage.py
+"""Benchmark du démarrage à froid : import du module et temps jusqu'au premier rendu.
+
+Chaque mesure est faite dans un processus Python neuf pour reproduire le
+démarrage d'un nouveau worker Streamlit.
+
+    python benchmarks/bench_demarrage.py --repetitions 5 --sortie demarrage.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import seul du module du dashboard
+SCRIPT_IMPORT = """
+import time
+debut = time.perf_counter()
+import Dashboard
+print(time.perf_counter() - debut)
+"""
+
+# Premier rendu complet de la page (sans serveur) via le harnais AppTest
+SCRIPT_PREMIER_RENDU = """
+import time
+debut = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("Dashboard.py", default_timeout=300)
+at.run()
+assert not at.exception, [e.value for e in at.exception]
+print(time.perf_counter() - debut)
+"""
+
+
+def mesurer(script, repetitions):
+    """Durées (s) du script exécuté dans `repetitions` processus neufs"""
+    durees = []
+    for _ in range(repetitions):
+        sortie = subprocess.run([sys.executable, "-c", script], cwd=RACINE,
+                                capture_output=True, text=True, check=True)
+        durees.append(float(sortie.stdout.strip().splitlines()[-1]))
+    return durees
+
+
+def modules_les_plus_lents(nombre=10):
+    """Modules au temps d'import cumulé le plus élevé (python -X importtime)"""
+    sortie = subprocess.run([sys.executable, "-X", "importtime", "-c", "import Dashboard"],
+                            cwd=RACINE, capture_output=True, text=True, check=True)
+    modules = []
+    for ligne in sortie.stderr.splitlines():
+        if not ligne.startswith("import time:") or "cumulative" in ligne:
+            continue
+        _, cumule, nom = ligne[len("import time:"):].split("|")
+        modules.append((nom.strip(), int(cumule) / 1e6))
+    modules.sort(key=lambda m: m[1], reverse=True)
+    return [{"module": nom, "cumule_s": round(duree, 4)} for nom, duree in modules[:nombre]]
+
+
+def resume(durees):
+    return {
+        "mediane_s": round(statistics.median(durees), 4),
+        "min_s": round(min(durees), 4),
+        "max_s": round(max(durees), 4),
+        "mesures_s": [round(d, 4) for d in durees],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--sortie", help="Fichier JSON de résultats (stdout par défaut)")
+    args = parser.parse_args()
+
+    resultats = {
+        "python": sys.version.split()[0],
+        "import_module": resume(mesurer(SCRIPT_IMPORT, args.repetitions)),
+        "premier_rendu": resume(mesurer(SCRIPT_PREMIER_RENDU, args.repetitions)),
+        "imports_les_plus_lents": modules_les_plus_lents(),
+    }
+
+    texte = json.dumps(resultats, indent=2, ensure_ascii=False)
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as fichier:
+            fichier.write(texte)
+    print(texte)
+
+
+if __name__ == "__main__":
+    main()
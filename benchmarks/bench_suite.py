@@ -0,0 +1,129 @@
+# bench_suite.py
+"""Suite de benchmarks : génération des données, noyaux simulate_* et rendu complet de la page.
+
+Les résultats (médianes en secondes) sont écrits en JSON ; comparés à une
+baseline, tout benchmark plus lent que le seuil autorisé fait échouer la suite :
+
+    python benchmarks/bench_suite.py --sortie benchmarks/baseline.json          # créer la baseline
+    python benchmarks/bench_suite.py --baseline benchmarks/baseline.json --seuil 0.25
+
+La baseline peut fixer des seuils propres à certains benchmarks :
+    "seuils": {"rendu/premier": 0.5}
+"""
+import argparse
+import inspect
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from moteur_inde import MoteurSimulationInde  # noqa: E402
+
+TAILLES_NOYAUX = {"28": 28, "1k": 1_000, "1M": 1_000_000}
+
+
+def chronometrer(fonction, repetitions):
+    """Médiane des durées (s) de `repetitions` appels"""
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - debut)
+    return statistics.median(durees)
+
+
+def bench_generation(moteur, repetitions):
+    """generate_advanced_data pour chaque branche et chaque programme"""
+    resultats = {}
+    for selection in moteur.branches_options + moteur.programmes_options:
+        resultats[f"generation/{selection}"] = chronometrer(
+            lambda: moteur.generate_advanced_data(selection), repetitions)
+    return resultats
+
+
+def bench_noyaux(moteur, repetitions):
+    """Chaque simulate_* sur 28, 1k et 1M points"""
+    config = moteur.get_advanced_config("Forces Armées Indiennes")
+    resultats = {}
+    for nom, methode in inspect.getmembers(moteur, inspect.ismethod):
+        if not nom.startswith("simulate_"):
+            continue
+        avec_config = "config" in inspect.signature(methode).parameters
+        for libelle, taille in TAILLES_NOYAUX.items():
+            annees = np.linspace(2000, 2027, taille)
+            appel = (lambda: methode(annees, config)) if avec_config else (lambda: methode(annees))
+            resultats[f"noyau/{nom}/{libelle}"] = chronometrer(appel, repetitions)
+    return resultats
+
+
+def bench_rendu(repetitions):
+    """run_advanced_dashboard complet via le harnais AppTest (premier rendu puis reruns)"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(RACINE, "Dashboard.py"), default_timeout=300)
+    premier = chronometrer(app.run, 1)
+    if app.exception:
+        raise RuntimeError([e.value for e in app.exception])
+    return {"rendu/premier": premier, "rendu/rerun": chronometrer(app.run, repetitions)}
+
+
+def comparer(resultats, baseline, seuil_defaut, plancher=0.0):
+    """Liste des régressions : (nom, baseline, mesure, seuil) ; écarts absolus < plancher (s) ignorés"""
+    seuils = baseline.get("seuils", {})
+    regressions = []
+    for nom, reference in baseline.get("resultats", {}).items():
+        if nom not in resultats:
+            continue
+        seuil = seuils.get(nom, seuil_defaut)
+        if resultats[nom] > reference * (1 + seuil) and resultats[nom] - reference >= plancher:
+            regressions.append((nom, reference, resultats[nom], seuil))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--sortie", help="Fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", help="Baseline JSON à comparer")
+    parser.add_argument("--seuil", type=float, default=0.25,
+                        help="Ralentissement relatif toléré (0.25 = +25 %%), hors seuils de la baseline")
+    parser.add_argument("--plancher-ms", type=float, default=1.0,
+                        help="Écart absolu minimal (ms) pour signaler une régression (bruit de mesure)")
+    parser.add_argument("--sans-rendu", action="store_true", help="Ignorer le rendu AppTest")
+    args = parser.parse_args()
+
+    moteur = MoteurSimulationInde()
+    resultats = {}
+    resultats.update(bench_generation(moteur, args.repetitions))
+    resultats.update(bench_noyaux(moteur, args.repetitions))
+    if not args.sans_rendu:
+        resultats.update(bench_rendu(args.repetitions))
+
+    rapport = {"python": sys.version.split()[0], "numpy": np.__version__,
+               "resultats": {nom: round(duree, 6) for nom, duree in resultats.items()}}
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(rapport, fichier, indent=2, ensure_ascii=False)
+
+    for nom, duree in rapport["resultats"].items():
+        print(f"{duree * 1000:10.3f} ms  {nom}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fichier:
+            regressions = comparer(resultats, json.load(fichier), args.seuil,
+                                   args.plancher_ms / 1000)
+        for nom, reference, mesure, seuil in regressions:
+            print(f"❌ RÉGRESSION {nom} : {reference * 1000:.3f} ms -> {mesure * 1000:.3f} ms (seuil +{seuil:.0%})")
+        if regressions:
+            sys.exit(1)
+        print("✔ Aucune régression par rapport à la baseline")
+
+
+if __name__ == "__main__":
+    main()
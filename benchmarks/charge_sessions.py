@@ -0,0 +1,221 @@
+# charge_sessions.py
+"""Test de charge : N sessions simultanées pilotées par le harnais AppTest, hors ligne.
+
+Chaque session simulée est une instance AppTest (état de session propre, caches
+st.cache_* partagés par le processus comme sur un serveur) qui enchaîne des
+interactions tirées au hasard dans la sidebar : mode d'analyse, branche ou
+programme, options, scénario, onglet. Pour chaque niveau de concurrence on mesure
+les latences de rerun (p50/p95/p99), le débit (reruns/s) et le pic de RSS :
+
+    python benchmarks/charge_sessions.py --niveaux 1 10 50 --interactions 5
+    python benchmarks/charge_sessions.py --sortie charge.json    # 1 à 500 sessions
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+NIVEAUX_DEFAUT = (1, 10, 50, 100, 250, 500)
+OPTIONS_SIDEBAR = ("show_geopolitical", "show_doctrinal", "show_technical", "threat_assessment")
+CENTILES = (50, 95, 99)
+# Version de Streamlit dont les internes remplacés par simuler_serveur ont été vérifiés
+STREAMLIT_VERIFIE = "1.65"
+
+
+def rss_courant():
+    """RSS actuel du processus (octets) ; pic depuis le démarrage hors Linux"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class EchantillonneurRSS:
+    """Relève le RSS à intervalle régulier dans un thread et garde le pic"""
+
+    def __init__(self, periode=0.05):
+        self.periode = periode
+        self.pic = rss_courant()
+        self._arret = threading.Event()
+        self._thread = threading.Thread(target=self._boucle, daemon=True)
+
+    def _boucle(self):
+        while not self._arret.wait(self.periode):
+            self.pic = max(self.pic, rss_courant())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._arret.set()
+        self._thread.join()
+        self.pic = max(self.pic, rss_courant())
+
+
+def simuler_serveur():
+    """État global partagé par toutes les sessions AppTest, comme dans un serveur Streamlit.
+
+    AppTest n'est pas prévu pour des runs simultanés : chaque run installe puis efface
+    le singleton Runtime, recompile le script (ast.parse n'est pas sûr entre threads
+    sous CPython 3.11) et rebascule l'option global.appTest. Un serveur n'a qu'un
+    Runtime et qu'un cache de bytecode pour toutes ses sessions : on les installe une
+    fois pour toutes et on rend inopérants les remplacements faits par chaque run.
+
+    Ces internes ne sont pas une API publique : RuntimeError explicite s'ils ont changé.
+    """
+    from unittest.mock import MagicMock
+
+    import streamlit
+    try:
+        from streamlit import config
+        from streamlit.runtime import Runtime
+        from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+        from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+        from streamlit.runtime.media_file_manager import MediaFileManager
+        from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+        from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+        from streamlit.testing.v1 import app_test, local_script_runner
+        manquants = [nom for objet, attribut, nom in (
+            (Runtime, "_instance", "Runtime._instance"),
+            (app_test, "Runtime", "streamlit.testing.v1.app_test.Runtime"),
+            (local_script_runner, "ScriptCache", "streamlit.testing.v1.local_script_runner.ScriptCache"),
+        ) if not hasattr(objet, attribut)]
+    except ImportError as erreur:
+        manquants = [erreur.name or str(erreur)]
+    if manquants:
+        raise RuntimeError(
+            f"Streamlit {streamlit.__version__} : internes introuvables ({', '.join(manquants)}). "
+            f"Le harnais de charge a été vérifié avec Streamlit {STREAMLIT_VERIFIE} ; "
+            f"installer cette version ou adapter simuler_serveur()."
+        )
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    # Les affectations de AppTest._run visent désormais cette sous-classe, pas le singleton
+    app_test.Runtime = type("RuntimeSession", (Runtime,), {})
+
+    cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: cache
+    config.set_option("global.appTest", True)
+
+
+def interaction_aleatoire(app, alea):
+    """Modifie un contrôle de la sidebar (ou l'onglet) au hasard ; libellé de l'action"""
+    action = alea.choice(("mode", "selection", "option", "scenario", "onglet"))
+    if action == "selection":
+        # La liste proposée dépend du mode d'analyse courant
+        cles = [w.key for w in app.sidebar.selectbox if w.key in ("selection_branche", "selection_programme")]
+        if not cles:
+            action = "mode"
+        else:
+            widget = app.selectbox(key=cles[0])
+            widget.set_value(alea.choice(widget.options))
+    if action == "mode":
+        widget = app.radio(key="type_analyse")
+        widget.set_value(alea.choice(widget.options))
+    elif action == "option":
+        widget = app.checkbox(key=alea.choice(OPTIONS_SIDEBAR))
+        widget.set_value(not widget.value)
+    elif action == "scenario":
+        widget = app.selectbox(key="scenario")
+        widget.set_value(alea.choice(widget.options))
+    elif action == "onglet":
+        widget = app.radio(key="onglet_actif")
+        widget.set_value(alea.choice(widget.options))
+    return action
+
+
+def session(numero, interactions, graine, pause):
+    """Une session simulée : premier rendu puis `interactions` reruns ; (premier, [reruns], erreurs)"""
+    from streamlit.testing.v1 import AppTest
+
+    alea = random.Random(graine * 100_003 + numero)
+    app = AppTest.from_file(os.path.join(RACINE, "Dashboard.py"), default_timeout=600)
+    debut = time.perf_counter()
+    app.run()
+    premier = time.perf_counter() - debut
+    reruns, erreurs = [], [str(e.value) for e in app.exception]
+    for _ in range(interactions):
+        if pause:
+            time.sleep(alea.uniform(0, pause))
+        action = interaction_aleatoire(app, alea)
+        debut = time.perf_counter()
+        app.run()
+        reruns.append(time.perf_counter() - debut)
+        erreurs.extend(f"{action}: {e.value}" for e in app.exception)
+    return premier, reruns, erreurs
+
+
+def mesurer_niveau(concurrence, interactions, graine, pause):
+    """Lance `concurrence` sessions simultanées et agrège leurs mesures"""
+    with EchantillonneurRSS() as rss, ThreadPoolExecutor(max_workers=concurrence) as executeur:
+        debut = time.perf_counter()
+        sessions = list(executeur.map(lambda n: session(n, interactions, graine, pause), range(concurrence)))
+        duree = time.perf_counter() - debut
+
+    premiers = np.array([premier for premier, _, _ in sessions])
+    reruns = np.array([d for _, durees, _ in sessions for d in durees])
+    erreurs = [e for _, _, liste in sessions for e in liste]
+    mesures = reruns if reruns.size else premiers
+    return {
+        "sessions": concurrence,
+        "reruns": int(premiers.size + reruns.size),
+        "duree_s": round(duree, 3),
+        "debit_reruns_s": round((premiers.size + reruns.size) / duree, 3),
+        "premier_rendu_p50_s": round(float(np.percentile(premiers, 50)), 4),
+        **{f"rerun_p{c}_s": round(float(np.percentile(mesures, c)), 4) for c in CENTILES},
+        "pic_rss_mo": round(rss.pic / 2**20, 1),
+        "erreurs": len(erreurs),
+        "exemples_erreurs": erreurs[:3],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--niveaux", type=int, nargs="+", default=list(NIVEAUX_DEFAUT),
+                        help="Nombres de sessions simultanées à tester")
+    parser.add_argument("--interactions", type=int, default=3, help="Reruns par session après le premier rendu")
+    parser.add_argument("--pause-ms", type=float, default=0.0,
+                        help="Temps de réflexion maximal (ms) entre deux interactions, tiré uniformément")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--sortie", help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    try:
+        simuler_serveur()
+    except RuntimeError as erreur:
+        sys.exit(f"charge_sessions : {erreur}")
+    resultats = []
+    print(f"{'sessions':>8} {'reruns/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'pic RSS':>9} erreurs")
+    for concurrence in args.niveaux:
+        mesure = mesurer_niveau(concurrence, args.interactions, args.graine, args.pause_ms / 1000)
+        resultats.append(mesure)
+        print(f"{mesure['sessions']:8d} {mesure['debit_reruns_s']:9.2f} "
+              + " ".join(f"{mesure[f'rerun_p{c}_s'] * 1000:6.0f}ms" for c in CENTILES)
+              + f" {mesure['pic_rss_mo']:7.0f}Mo {mesure['erreurs']}")
+
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as fichier:
+            json.dump({"python": sys.version.split()[0], "interactions": args.interactions,
+                       "niveaux": resultats}, fichier, indent=2, ensure_ascii=False)
+    if any(mesure["erreurs"] for mesure in resultats):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# export_rapport.py
+"""Export hors ligne d'un rapport : page HTML autonome et, en option, figures PNG.
+
+Le rendu des figures (fragment HTML, image PNG si kaleido est installé) est réparti
+sur un pool de threads : l'export avance en arrière-plan et se suit par `progression()`.
+"""
+import html
+import importlib.util
+import io
+import threading
+import zipfile
+
+def png_disponible():
+    """L'export PNG requiert le paquet optionnel kaleido"""
+    return importlib.util.find_spec('kaleido') is not None
+
+def rendre_figure(figure, png=False):
+    """Tâche de worker : (fragment HTML sans plotly.js, octets PNG ou None)"""
+    fragment = figure.to_html(full_html=False, include_plotlyjs=False)
+    image = figure.to_image(format='png', width=1200, height=figure.layout.height or 500) if png else None
+    return fragment, image
+
+class ExportRapport:
+    """Rapport en cours d'export : sections HTML fixes et figures rendues par le pool.
+    
+    `sections` est une liste de (titre, html, [(nom, figure), ...]) dans l'ordre d'affichage.
+    """
+    
+    def __init__(self, titre, sections, executeur, css='', png=False):
+        self.titre = titre
+        self.sections = sections
+        self.css = css
+        self.png = png
+        self._taches = {
+            nom: executeur.submit(rendre_figure, figure, png)
+            for _, _, figures in sections for nom, figure in figures
+        }
+        self._verrou = threading.Lock()
+        self._html = None
+    
+    def progression(self):
+        """(figures rendues, figures à rendre)"""
+        return sum(tache.done() for tache in self._taches.values()), len(self._taches)
+    
+    def termine(self):
+        return all(tache.done() for tache in self._taches.values())
+    
+    def erreurs(self):
+        """Figures dont le rendu a échoué : {nom: message}"""
+        return {nom: str(tache.exception()) for nom, tache in self._taches.items()
+                if tache.done() and tache.exception() is not None}
+    
+    def html(self):
+        """Page HTML autonome (plotly.js inclus une seule fois), assemblée au premier appel"""
+        with self._verrou:
+            if self._html is None:
+                from plotly.offline import get_plotlyjs
+                
+                morceaux = [
+                    '<!DOCTYPE html><html><head><meta charset="utf-8">',
+                    f'<title>{html.escape(self.titre)}</title>',
+                    f'<script type="text/javascript">{get_plotlyjs()}</script>',
+                    self.css, '</head><body>',
+                    f'<h1 class="main-header">{html.escape(self.titre)}</h1>',
+                ]
+                for titre, contenu, figures in self.sections:
+                    morceaux.append(f'<h3 class="section-header">{html.escape(titre)}</h3>{contenu}')
+                    for nom, _ in figures:
+                        tache = self._taches[nom]
+                        if tache.exception() is None:
+                            morceaux.append(tache.result()[0])
+                morceaux.append('</body></html>')
+                self._html = ''.join(morceaux).encode('utf-8')
+            return self._html
+    
+    def archive_png(self):
+        """Archive ZIP des figures PNG (une image par figure)"""
+        tampon = io.BytesIO()
+        with zipfile.ZipFile(tampon, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for nom, tache in self._taches.items():
+                if tache.exception() is None and tache.result()[1] is not None:
+                    archive.writestr(f"{nom}.png", tache.result()[1])
+        return tampon.getvalue()
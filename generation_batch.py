@@ -0,0 +1,80 @@
+# generation_batch.py
+"""Génération batch (sans Streamlit) de toutes les combinaisons sélection × scénario.
+
+Les sélections sont réparties sur un pool de processus ; chaque worker calcule
+le cube de tous les scénarios de sa sélection en une passe et écrit ses
+partitions dans un dataset Parquet partitionné par Selection puis Scenario :
+
+    python generation_batch.py --sortie donnees/simulations --workers 8
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from moteur_inde import (
+    ANNEE_DEBUT, ANNEE_FIN, CLE_PAS_PAR_AN, RESOLUTIONS, SCENARIOS, MoteurSimulationInde, appliquer_schema
+)
+
+COLONNES_PARTITION = ["Selection", "Scenario"]
+
+
+def selections(moteur):
+    """Toutes les sélections : branches puis programmes"""
+    return moteur.branches_options + moteur.programmes_options
+
+
+def generer_partitions(selection, racine, annee_debut, annee_fin, resolution):
+    """Génère tous les scénarios d'une sélection et écrit leurs partitions ; retourne le nombre de lignes"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    cube = MoteurSimulationInde().calculer_cube_scenarios([selection], annee_debut, annee_fin, resolution)
+    tables = []
+    for scenario in cube.scenarios:
+        df, _ = cube.frame(selection, scenario)
+        df.insert(0, "Scenario", scenario)
+        df.insert(0, "Selection", selection)
+        tables.append(pa.Table.from_pandas(appliquer_schema(df), preserve_index=False))
+    table = pa.concat_tables(tables)
+    # Résolution enregistrée dans chaque fichier : le dashboard ne sert que les requêtes de même pas
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           CLE_PAS_PAR_AN: str(RESOLUTIONS[resolution]).encode()})
+    # Chaque worker écrit ses propres partitions : aucun fichier n'est partagé. Noms stables :
+    # une régénération remplace les fichiers sous les mêmes chemins que ceux déjà listés
+    pq.write_to_dataset(table, racine, partition_cols=COLONNES_PARTITION,
+                        basename_template="part-{i}.parquet",
+                        existing_data_behavior="delete_matching")
+    return table.num_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sortie", default=os.path.join("donnees", "simulations"),
+                        help="Répertoire racine du dataset Parquet")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--debut", type=int, default=ANNEE_DEBUT)
+    parser.add_argument("--fin", type=int, default=ANNEE_FIN)
+    parser.add_argument("--resolution", choices=list(RESOLUTIONS), default="annuelle")
+    args = parser.parse_args()
+
+    taches = selections(MoteurSimulationInde())
+    debut = time.perf_counter()
+    lignes = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(generer_partitions, selection, args.sortie,
+                        args.debut, args.fin, args.resolution): selection
+            for selection in taches
+        }
+        for future in as_completed(futures):
+            lignes += future.result()
+            print(f"✔ {futures[future]} × {len(SCENARIOS)} scénarios")
+
+    duree = time.perf_counter() - debut
+    print(f"{len(taches) * len(SCENARIOS)} combinaisons, {lignes} lignes écrites dans {args.sortie} en {duree:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1303 @@
+# moteur_inde.py
+"""Moteur de simulation des indicateurs de défense de l'Inde.
+
+Module sans dépendance à Streamlit : utilisable par le dashboard comme par
+les traitements batch (voir generation_batch.py).
+"""
+import contextlib
+import copy
+import functools
+import multiprocessing
+import os
+import sys
+import types
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+import numpy as np
+import pandas as pd
+
+# Horizon temporel par défaut et pas de temps disponibles (périodes par année)
+ANNEE_DEBUT = 2000
+ANNEE_FIN = 2027
+RESOLUTIONS = {"annuelle": 1, "trimestrielle": 4, "mensuelle": 12}
+
+def generer_axe_temporel(annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN, resolution="annuelle"):
+    """Axe des années (entiers en annuel, années décimales en infra-annuel)"""
+    pas = RESOLUTIONS[resolution]
+    if pas == 1:
+        return np.arange(annee_debut, annee_fin + 1, dtype=np.int64)
+    return annee_debut + np.arange((annee_fin - annee_debut + 1) * pas) / pas
+
+# Scénarios géopolitiques proposés dans le panel de contrôle
+SCENARIOS = ["Statut Quo", "Tensions Chine", "Modernisation Accélérée", "Conflit Régional"]
+SCENARIO_REFERENCE = "Statut Quo"
+
+# Effet de chaque scénario à pleine intensité (facteur multiplicatif par indicateur).
+# L'effet démarre en ANNEE_BASCULE_SCENARIO et monte linéairement sur DUREE_MONTEE_SCENARIO années.
+MODIFICATEURS_SCENARIOS = {
+    "Statut Quo": {},
+    "Tensions Chine": {
+        'Budget_Defense_Mds': 1.15, 'Exercices_Militaires': 1.20, 'Readiness_Operative': 1.06,
+        'Capacite_Dissuasion': 1.03, 'Temps_Mobilisation_Jours': 0.85, 'Tests_Missiles': 1.30,
+        'Couverture_AD': 1.08, 'Stock_Ogives_Nucleaires': 1.10, 'Navires_Combat': 1.08
+    },
+    "Modernisation Accélérée": {
+        'Budget_Defense_Mds': 1.10, 'Developpement_Technologique': 1.12, 'Production_Armements': 1.15,
+        'Cyber_Capabilities': 1.10, 'Nouveaux_Systemes': 1.30, 'Taux_Modernisation': 1.20,
+        'Exportations_Armes': 1.25, 'Cyber_Defense_Niveau': 1.10
+    },
+    "Conflit Régional": {
+        'Budget_Defense_Mds': 1.30, 'Personnel_Milliers': 1.10, 'Exercices_Militaires': 0.80,
+        'Readiness_Operative': 1.10, 'Temps_Mobilisation_Jours': 0.70, 'Tests_Missiles': 1.50,
+        'Resilience_Logistique': 0.90, 'Production_Armements': 1.20, 'Attaques_Cyber_Reussies': 1.50
+    },
+}
+ANNEE_BASCULE_SCENARIO = 2024
+DUREE_MONTEE_SCENARIO = 3
+
+# Indicateurs exprimés en pourcentage : plafonnés à 100 après application d'un scénario
+COLONNES_POURCENTAGE = {
+    'PIB_Militaire_Pourcent', 'Readiness_Operative', 'Capacite_Dissuasion', 'Developpement_Technologique',
+    'Capacite_Artillerie', 'Couverture_AD', 'Resilience_Logistique', 'Cyber_Capabilities',
+    'Production_Armements', 'Capacite_Sous_Marine', 'Essais_Souterrains', 'Taux_Modernisation',
+    'Reseau_Commandement_Cyber', 'Cyber_Defense_Niveau'
+}
+
+# Valeurs par défaut des paramètres du modèle (surchargeables par la configuration d'une sélection)
+PARAMETRES_DEFAUT = {
+    'budget_base': 60.0, 'personnel_base': 1300, 'exercices_base': 80,
+    # Taux de croissance annuels
+    'croissance_budget': 0.065, 'croissance_personnel': 0.008, 'pente_readiness': 1.5,
+    # Multiplicateurs budgétaires des événements géopolitiques
+    'facteur_pakistan': 1.1, 'facteur_modernisation': 1.15, 'facteur_make_in_india': 1.2, 'facteur_chine': 1.25,
+    # Gains de préparation opérationnelle (points)
+    'bonus_reformes': 8, 'bonus_modernisation': 7, 'bonus_experience': 5,
+}
+
+# Monte Carlo : écart-type relatif de chaque paramètre perturbé, indicateurs échantillonnés
+INCERTITUDES_PARAMETRES = {
+    'croissance_budget': 0.15, 'croissance_personnel': 0.20, 'pente_readiness': 0.10,
+    'facteur_pakistan': 0.04, 'facteur_modernisation': 0.04, 'facteur_make_in_india': 0.05, 'facteur_chine': 0.05,
+    'bonus_reformes': 0.25, 'bonus_modernisation': 0.25, 'bonus_experience': 0.25,
+}
+INDICATEURS_MONTE_CARLO = {
+    'Budget_Defense_Mds': 'simulate_advanced_budget',
+    'Personnel_Milliers': 'simulate_advanced_personnel',
+    'Readiness_Operative': 'simulate_advanced_readiness',
+}
+# Tranches Monte Carlo soumises d'avance par worker : le parent ne garde que O(workers) histogrammes
+TRANCHES_EN_VOL_PAR_WORKER = 2
+
+# Analyse de sensibilité : plage relative explorée autour de chaque paramètre (±),
+# trajectoires de Morris (et niveaux de sa grille), taille des échantillons de Sobol
+PLAGE_SENSIBILITE = 0.2
+TRAJECTOIRES_MORRIS = 50
+NIVEAUX_MORRIS = 4
+TAILLE_SOBOL = 2048
+
+# Colonnes de base : indicateur -> (méthode de simulation, dépend de la configuration)
+COLONNES_BASE = {
+    'Budget_Defense_Mds': ('simulate_advanced_budget', True),
+    'Personnel_Milliers': ('simulate_advanced_personnel', True),
+    'PIB_Militaire_Pourcent': ('simulate_military_gdp_percentage', False),
+    'Exercices_Militaires': ('simulate_advanced_exercises', True),
+    'Readiness_Operative': ('simulate_advanced_readiness', True),
+    'Capacite_Dissuasion': ('simulate_advanced_deterrence', False),
+    'Temps_Mobilisation_Jours': ('simulate_advanced_mobilization', False),
+    'Tests_Missiles': ('simulate_missile_tests', False),
+    'Developpement_Technologique': ('simulate_tech_development', False),
+    'Capacite_Artillerie': ('simulate_artillery_capacity', False),
+    'Couverture_AD': ('simulate_air_defense_coverage', False),
+    'Resilience_Logistique': ('simulate_logistical_resilience', False),
+    'Cyber_Capabilities': ('simulate_cyber_capabilities', False),
+    'Production_Armements': ('simulate_weapon_production', False),
+}
+
+# Données spécifiques aux programmes : priorité -> {indicateur: méthode de simulation}
+BLOCS_PRIORITES = {
+    'nucleaire': {
+        'Stock_Ogives_Nucleaires': 'simulate_nuclear_arsenal_size',
+        'Portee_Max_Missiles_Km': 'simulate_missile_range_evolution',
+        'Capacite_Sous_Marine': 'simulate_submarine_capability',
+        'Essais_Souterrains': 'simulate_underground_tests',
+    },
+    'modernisation': {
+        'Nouveaux_Systemes': 'simulate_new_systems',
+        'Taux_Modernisation': 'simulate_modernization_rate',
+        'Exportations_Armes': 'simulate_weapon_exports',
+    },
+    'maritime': {
+        'Navires_Combat': 'simulate_naval_fleet',
+        'Portee_Projection_Nm': 'simulate_naval_range',
+        'Exercices_Combines': 'simulate_joint_exercises',
+    },
+    'cyber': {
+        'Attaques_Cyber_Reussies': 'simulate_cyber_attacks',
+        'Reseau_Commandement_Cyber': 'simulate_cyber_command',
+        'Cyber_Defense_Niveau': 'simulate_cyber_defense',
+    },
+}
+
+# Catalogues de référence par défaut (les sources de données du dashboard peuvent les remplacer)
+SYSTEMES_MISSILES = {
+    "Agni-V": {"type": "ICBM", "portee": 5000, "ogives": 3, "statut": "Opérationnel"},
+    "Agni-IV": {"type": "IRBM", "portee": 4000, "ogives": 1, "statut": "Opérationnel"},
+    "Agni-III": {"type": "IRBM", "portee": 3000, "ogives": 1, "statut": "Opérationnel"},
+    "Prithvi-II": {"type": "MRBM", "portee": 350, "ogives": "Conventionnelle/Nucléaire", "statut": "Opérationnel"},
+    "BrahMos": {"type": "Missile de Croisière", "portee": 450, "vitesse": "Mach 2.8", "statut": "Opérationnel"}
+}
+ACTIFS_NAVALS = {
+    "INS Vikramaditya": {"type": "Porte-avions", "deplacement": 45000, "avions": 36, "statut": "Opérationnel"},
+    "INS Vikrant": {"type": "Porte-avions", "deplacement": 40000, "avions": 30, "statut": "Opérationnel"},
+    "INS Kolkata": {"type": "Destroyer", "deplacement": 7500, "armement": "Brahmos", "statut": "Opérationnel"},
+    "INS Arihant": {"type": "Sous-marin Nucléaire", "deplacement": 6000, "missiles": "K-15", "statut": "Opérationnel"},
+    "INS Chakra": {"type": "Sous-marin Nucléaire", "deplacement": 8000, "torpilles": "Type 53", "statut": "Opérationnel"}
+}
+
+# Graphe de dépendances : paramètres de configuration lus par chaque indicateur.
+# Tous les indicateurs dépendent en outre de l'horizon et de leur facteur de scénario ;
+# ceux des blocs de programmes dépendent aussi des priorités de la sélection.
+DEPENDANCES_CONFIG = {
+    'Budget_Defense_Mds': ('budget_base', 'croissance_budget', 'facteur_pakistan',
+                           'facteur_modernisation', 'facteur_make_in_india', 'facteur_chine'),
+    'Personnel_Milliers': ('personnel_base', 'croissance_personnel'),
+    'Exercices_Militaires': ('exercices_base',),
+    'Readiness_Operative': ('pente_readiness', 'bonus_reformes', 'bonus_modernisation', 'bonus_experience'),
+}
+
+# Prévisions : année de fin des projections, grille (alpha, beta) du lissage de Holt explorée
+# pour chaque indicateur, quantile normal des intervalles (95 %)
+ANNEE_PROJECTION = 2035
+GRILLE_HOLT = tuple((alpha, beta) for alpha in (0.2, 0.4, 0.6, 0.8, 0.95) for beta in (0.05, 0.1, 0.2, 0.4))
+Z_INTERVALLE = 1.96
+
+# Indicateurs dépendant des paramètres du modèle : sorties de l'analyse de sensibilité
+INDICATEURS_SENSIBILITE = {colonne: COLONNES_BASE[colonne][0] for colonne in DEPENDANCES_CONFIG}
+
+# Schéma du DataFrame d'indicateurs : types compacts imposés à la construction.
+# Les années sont en int16 sur une grille annuelle, en float32 (années décimales) en infra-annuel.
+SCHEMA_INDICATEURS = {
+    'Selection': 'category',
+    'Scenario': 'category',
+    'Annee': np.int16,
+    # Format long (comparaison de sélections) : une ligne par sélection × pas de temps × indicateur
+    'Indicateur': 'category',
+    'Valeur': np.float32,
+    **{colonne: np.float32 for colonne in COLONNES_BASE},
+    **{colonne: np.float32 for bloc in BLOCS_PRIORITES.values() for colonne in bloc},
+}
+
+def typer_annees(annees):
+    """Axe des années au type du schéma"""
+    annees = np.asarray(annees)
+    if np.issubdtype(annees.dtype, np.integer):
+        return annees.astype(SCHEMA_INDICATEURS['Annee'])
+    return annees.astype(np.float32)
+
+def appliquer_schema(df):
+    """Convertit les colonnes au type déclaré ; une colonne absente du schéma est une erreur"""
+    inconnues = [colonne for colonne in df.columns if colonne not in SCHEMA_INDICATEURS]
+    if inconnues:
+        raise ValueError(f"Colonnes absentes de SCHEMA_INDICATEURS : {inconnues}")
+    types = {colonne: SCHEMA_INDICATEURS[colonne] for colonne in df.columns if colonne != 'Annee'}
+    df = df.astype(types)  # Copy-on-write : seules les colonnes converties sont copiées
+    if 'Annee' in df.columns:
+        df['Annee'] = typer_annees(df['Annee'].to_numpy())
+    return df
+
+def rapport_memoire(df):
+    """Empreinte mémoire par colonne (memory_usage(deep=True)), total en dernière ligne"""
+    octets = df.memory_usage(deep=True, index=True)
+    rapport = pd.DataFrame({
+        'Colonne': octets.index,
+        'Type': [str(df.index.dtype) if c == 'Index' else str(df[c].dtype) for c in octets.index],
+        'Octets': octets.to_numpy()
+    })
+    total = pd.DataFrame({'Colonne': ['TOTAL'], 'Type': [''], 'Octets': [int(octets.sum())]})
+    return pd.concat([rapport, total], ignore_index=True)
+
+def figer(valeur):
+    """Copie immuable : dictionnaires en MappingProxyType, listes en tuples (récursivement)"""
+    if isinstance(valeur, (dict, types.MappingProxyType)):
+        return types.MappingProxyType({cle: figer(v) for cle, v in valeur.items()})
+    if isinstance(valeur, (list, tuple)):
+        return tuple(figer(v) for v in valeur)
+    if isinstance(valeur, set):
+        return frozenset(valeur)
+    return valeur
+
+def degeler(valeur):
+    """Copie modifiable d'une valeur figée (dictionnaires et listes)"""
+    if isinstance(valeur, (dict, types.MappingProxyType)):
+        return {cle: degeler(v) for cle, v in valeur.items()}
+    if isinstance(valeur, tuple):
+        return [degeler(v) for v in valeur]
+    return valeur
+
+def _parcourir_taille(racines, vus):
+    """Octets des objets atteignables depuis `racines` et pas encore dans `vus` (complété au passage)"""
+    pile = list(racines)
+    total = 0
+    while pile:
+        o = pile.pop()
+        if id(o) in vus or isinstance(o, (types.ModuleType, type, types.FunctionType, types.MethodType)):
+            continue
+        vus.add(id(o))
+        if isinstance(o, pd.DataFrame):
+            total += int(o.memory_usage(deep=True, index=True).sum())
+        elif isinstance(o, np.ndarray):
+            total += sys.getsizeof(o) if o.base is not None else o.nbytes
+            if o.base is not None:
+                pile.append(o.base)
+        elif isinstance(o, (dict, types.MappingProxyType)):
+            total += sys.getsizeof(o)
+            pile.extend(o.keys())
+            pile.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            total += sys.getsizeof(o)
+            pile.extend(o)
+        else:
+            total += sys.getsizeof(o)
+            if hasattr(o, '__dict__'):
+                pile.append(vars(o))
+    return total
+
+def taille_profonde(objet, exclus=()):
+    """Octets occupés par un objet et tout ce qu'il référence, hors de ce qu'atteignent les objets `exclus`.
+    
+    Les tableaux numpy ne comptent que leur tampon propre (une vue renvoie à sa base) ;
+    les modules, classes et fonctions sont ignorés.
+    """
+    vus = set()
+    _parcourir_taille(exclus, vus)
+    return _parcourir_taille([objet], vus)
+
+def facteurs_scenarios(scenarios, annees):
+    """Facteurs multiplicatifs par indicateur, de forme (n_scenarios, n_temps)"""
+    rampe = np.clip((np.asarray(annees) - ANNEE_BASCULE_SCENARIO + 1) / DUREE_MONTEE_SCENARIO, 0, 1)
+    colonnes = {col for scenario in scenarios for col in MODIFICATEURS_SCENARIOS[scenario]}
+    facteurs = {}
+    for colonne in colonnes:
+        intensites = np.array([MODIFICATEURS_SCENARIOS[s].get(colonne, 1.0) for s in scenarios])
+        facteurs[colonne] = (1 + (intensites[:, None] - 1) * rampe[None, :]).astype(np.float32)
+    return facteurs
+
+class CubeScenarios:
+    """Indicateurs pré-calculés sur la grille sélection × scénario × temps (lecture seule)"""
+    
+    def __init__(self, selections, scenarios, annees, valeurs, presence, configs):
+        self.selections = list(selections)
+        self.scenarios = list(scenarios)
+        self.annees = annees
+        self.valeurs = valeurs        # indicateur -> ndarray (n_selections, n_scenarios, n_temps)
+        self.presence = presence      # indicateur de programme -> masque des sélections concernées
+        self.configs = configs
+    
+    def frame(self, selection, scenario):
+        """DataFrame (sans copie) d'une sélection et d'un scénario, avec sa configuration"""
+        i = self.selections.index(selection)
+        j = self.scenarios.index(scenario)
+        data = {'Annee': self.annees}
+        for colonne, cube in self.valeurs.items():
+            if colonne not in self.presence or self.presence[colonne][i]:
+                data[colonne] = cube[i, j]
+        return pd.DataFrame(data, copy=False), copy.deepcopy(self.configs[i])
+    
+    def format_long(self, scenario, indicateurs=None):
+        """DataFrame long (Selection, Annee, Indicateur, Valeur) de toutes les sélections d'un scénario.
+        
+        Les indicateurs de programme ne sont produits que pour les sélections concernées.
+        """
+        j = self.scenarios.index(scenario)
+        n_t = len(self.annees)
+        indicateurs = [c for c in (indicateurs or self.valeurs) if c in self.valeurs]
+        codes_selections, codes_indicateurs, valeurs = [], [], []
+        for k, colonne in enumerate(indicateurs):
+            lignes = np.flatnonzero(self.presence.get(colonne, np.ones(len(self.selections), dtype=bool)))
+            valeurs.append(self.valeurs[colonne][lignes, j].ravel())
+            codes_selections.append(np.repeat(lignes, n_t))
+            codes_indicateurs.append(np.full(len(lignes) * n_t, k))
+        valeurs = np.concatenate(valeurs) if valeurs else np.empty(0, dtype=np.float32)
+        codes_selections = np.concatenate(codes_selections) if codes_selections else np.empty(0, dtype=np.int64)
+        codes_indicateurs = np.concatenate(codes_indicateurs) if codes_indicateurs else np.empty(0, dtype=np.int64)
+        return appliquer_schema(pd.DataFrame({
+            'Selection': pd.Categorical.from_codes(codes_selections, self.selections),
+            'Annee': np.resize(self.annees, len(valeurs)),
+            'Indicateur': pd.Categorical.from_codes(codes_indicateurs, indicateurs),
+            'Valeur': valeurs,
+        }))
+    
+    def octets(self):
+        """Mémoire réellement occupée (les axes diffusés ne comptent qu'une fois)"""
+        total = self.annees.nbytes
+        for cube in self.valeurs.values():
+            total += cube.itemsize * int(np.prod([n for n, pas in zip(cube.shape, cube.strides) if pas]))
+        return total
+
+class PercentilesFlux:
+    """Percentiles par pas de temps, approchés par histogramme et alimentés tranche par tranche.
+    
+    La mémoire ne dépend que du nombre de classes et de pas de temps, pas du nombre
+    d'échantillons ; deux instances de mêmes bornes se fusionnent par addition.
+    """
+    
+    def __init__(self, bornes_min, bornes_max, n_classes=2000):
+        self.bornes_min = np.asarray(bornes_min, dtype=float)
+        self.largeur = np.maximum(np.asarray(bornes_max, dtype=float) - self.bornes_min, 1e-12) / n_classes
+        self.n_classes = n_classes
+        self.comptes = np.zeros((len(self.bornes_min), n_classes), dtype=np.int64)
+    
+    def ajouter(self, echantillons):
+        """Ajoute une tranche d'échantillons de forme (n, n_temps) ; hors bornes -> classes extrêmes"""
+        classes = ((echantillons - self.bornes_min) / self.largeur).astype(np.int64)
+        np.clip(classes, 0, self.n_classes - 1, out=classes)
+        classes += np.arange(len(self.bornes_min)) * self.n_classes
+        self.comptes += np.bincount(classes.ravel(), minlength=self.comptes.size).reshape(self.comptes.shape)
+        return self
+    
+    def fusionner(self, autre):
+        self.comptes += autre.comptes
+        return self
+    
+    def percentiles(self, quantiles):
+        """Tableau (len(quantiles), n_temps) des percentiles demandés (en %)"""
+        cumul = np.cumsum(self.comptes, axis=1)
+        total = cumul[:, -1:]
+        resultats = []
+        for q in quantiles:
+            cible = total * q / 100
+            classe = np.argmax(cumul >= cible, axis=1)
+            avant = np.take_along_axis(cumul, classe[:, None], axis=1)[:, 0] - self.comptes[np.arange(len(classe)), classe]
+            dans_classe = np.maximum(self.comptes[np.arange(len(classe)), classe], 1)
+            fraction = np.clip((cible[:, 0] - avant) / dans_classe, 0, 1)
+            resultats.append(self.bornes_min + (classe + fraction) * self.largeur)
+        return np.array(resultats)
+
+def tirer_parametres(generateur, taille, config=None):
+    """Tirages gaussiens des paramètres perturbés, en colonnes (taille, 1), centrés sur la configuration"""
+    config = config or {}
+    return {
+        cle: config.get(cle, PARAMETRES_DEFAUT[cle]) * (1 + ecart * generateur.standard_normal((taille, 1)))
+        for cle, ecart in INCERTITUDES_PARAMETRES.items()
+    }
+
+def echantillonner_monte_carlo(config, scenario, annees, taille, graine):
+    """Une tranche de `taille` trajectoires par indicateur (tableaux (taille, n_temps))"""
+    moteur = MoteurSimulationInde()  # Catalogues jamais consultés : pas construits
+    config_tirage = {**config, **tirer_parametres(np.random.default_rng(graine), taille, config)}
+    facteurs = facteurs_scenarios([scenario], annees)
+    echantillons = {}
+    for indicateur, methode in INDICATEURS_MONTE_CARLO.items():
+        valeurs = np.maximum(getattr(moteur, methode)(annees, config_tirage), 0)
+        if indicateur in facteurs:
+            valeurs = valeurs * facteurs[indicateur][0]
+            if indicateur in COLONNES_POURCENTAGE:
+                valeurs = np.minimum(valeurs, 100)
+        echantillons[indicateur] = valeurs
+    return echantillons
+
+def _histogrammes_tranche(config, scenario, annees, taille, graine, bornes, n_classes):
+    """Tâche de worker : histogrammes d'une tranche, seuls renvoyés au processus parent"""
+    echantillons = echantillonner_monte_carlo(config, scenario, annees, taille, graine)
+    return {
+        indicateur: PercentilesFlux(*bornes[indicateur], n_classes).ajouter(valeurs).comptes
+        for indicateur, valeurs in echantillons.items()
+    }
+
+# Démarrage des workers sans fork : un serveur multi-thread (Streamlit) ne doit pas être dupliqué
+METHODE_DEMARRAGE = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+def creer_pool_calcul(processus=None):
+    """Pool de processus des calculs Monte Carlo et de sensibilité, lancé par METHODE_DEMARRAGE"""
+    return ProcessPoolExecutor(max_workers=processus, mp_context=multiprocessing.get_context(METHODE_DEMARRAGE))
+
+def _pool(executeur, processus):
+    """Pool fourni (laissé ouvert à la sortie) ou pool local fermé à la sortie"""
+    return contextlib.nullcontext(executeur) if executeur is not None else creer_pool_calcul(processus)
+
+def evaluer_parametres(config, scenario, annees, noms, matrice):
+    """Tâche de worker : moyenne sur l'horizon de chaque indicateur sensible, pour chaque ligne de `matrice`.
+    
+    Chaque paramètre étudié devient une colonne (n, 1) : les n vecteurs de paramètres sont
+    évalués en une seule passe vectorisée sur la grille (n, n_temps).
+    """
+    moteur = MoteurSimulationInde()  # Catalogues jamais consultés : pas construits
+    config_lot = {**config, **{nom: matrice[:, [j]] for j, nom in enumerate(noms)}}
+    facteurs = facteurs_scenarios([scenario], annees)
+    sorties = {}
+    for indicateur, methode in INDICATEURS_SENSIBILITE.items():
+        valeurs = np.broadcast_to(np.maximum(getattr(moteur, methode)(annees, config_lot), 0),
+                                  (len(matrice), len(annees)))
+        if indicateur in facteurs:
+            valeurs = valeurs * facteurs[indicateur][0]
+            if indicateur in COLONNES_POURCENTAGE:
+                valeurs = np.minimum(valeurs, 100)
+        sorties[indicateur] = valeurs.mean(axis=1)
+    return sorties
+
+def plan_oat(bas, haut, reference):
+    """Plan un-à-la-fois (2k + 1, k) : la référence, puis chaque paramètre à sa borne basse, puis haute"""
+    k = len(reference)
+    plan = np.tile(reference, (2 * k + 1, 1))
+    plan[1 + np.arange(k), np.arange(k)] = bas
+    plan[1 + k + np.arange(k), np.arange(k)] = haut
+    return plan
+
+def plan_morris(bas, haut, trajectoires, niveaux, generateur):
+    """Trajectoires de Morris : (plan (r (k + 1), k), ordres (r, k), pas sur le cube unité).
+    
+    Chaque trajectoire part d'un point de la grille à `niveaux` niveaux et déplace les
+    paramètres un à un, dans un ordre aléatoire, d'un même pas.
+    """
+    k = len(bas)
+    pas = niveaux / (2 * (niveaux - 1))
+    depart = generateur.integers(0, niveaux // 2, size=(trajectoires, k)) / (niveaux - 1)
+    ordres = np.argsort(generateur.random((trajectoires, k)), axis=1)
+    increments = np.zeros((trajectoires, k, k))
+    np.put_along_axis(increments, ordres[:, :, None], pas, axis=2)
+    unite = depart[:, None, :] + np.concatenate([np.zeros((trajectoires, 1, k)),
+                                                 np.cumsum(increments, axis=1)], axis=1)
+    return (bas + unite * (haut - bas)).reshape(-1, k), ordres, pas
+
+def plan_sobol(bas, haut, taille, generateur):
+    """Plan de Saltelli (n (k + 2), k) : matrices A, B puis A_B^(i) (colonne i de A prise dans B)"""
+    k = len(bas)
+    a = bas + generateur.random((taille, k)) * (haut - bas)
+    b = bas + generateur.random((taille, k)) * (haut - bas)
+    ab = np.repeat(a[None, :, :], k, axis=0)
+    ab[np.arange(k), :, np.arange(k)] = b.T
+    return np.concatenate([a, b, ab.reshape(-1, k)])
+
+def effets_morris(sorties, ordres, pas):
+    """(mu*, sigma) des effets élémentaires par paramètre"""
+    trajectoires, k = ordres.shape
+    ecarts = np.diff(sorties.reshape(trajectoires, k + 1), axis=1) / pas
+    effets = np.empty_like(ecarts)
+    np.put_along_axis(effets, ordres, ecarts, axis=1)
+    return np.abs(effets).mean(axis=0), effets.std(axis=0)
+
+def indices_sobol(sorties, taille, k):
+    """Indices de premier ordre (Saltelli 2010) et totaux (Jansen) par paramètre"""
+    # Sorties centrées : l'estimateur de premier ordre est sinon dominé par le carré de la moyenne
+    sorties = sorties - sorties[:2 * taille].mean()
+    f_a, f_b = sorties[:taille], sorties[taille:2 * taille]
+    f_ab = sorties[2 * taille:].reshape(k, taille)
+    variance = np.var(np.concatenate([f_a, f_b]))
+    if variance == 0:
+        return np.zeros(k), np.zeros(k)
+    premier_ordre = np.mean(f_b * (f_ab - f_a), axis=1) / variance
+    total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / variance
+    return premier_ordre, total
+
+class AnalyseSensibilite:
+    """Sensibilité des indicateurs (moyenne sur l'horizon) aux paramètres d'une sélection.
+    
+    Pour chaque indicateur : `oat` (sortie au bas, sortie au haut de la plage), `morris`
+    (mu*, sigma) et `sobol` (S1, ST), chacun en tableaux alignés sur `parametres`.
+    """
+    
+    def __init__(self, parametres, valeurs, plage, reference, oat, morris, sobol, n_evaluations):
+        self.parametres = parametres
+        self.valeurs = valeurs
+        self.plage = plage
+        self.reference = reference
+        self.oat = oat
+        self.morris = morris
+        self.sobol = sobol
+        self.n_evaluations = n_evaluations
+    
+    def tableau(self, indicateur):
+        """Indices d'un indicateur par paramètre, du plus influent (un-à-la-fois) au moins influent"""
+        bas, haut = self.oat[indicateur]
+        df = pd.DataFrame({
+            'Paramètre': self.parametres,
+            'Valeur': self.valeurs,
+            'Écart bas': bas - self.reference[indicateur],
+            'Écart haut': haut - self.reference[indicateur],
+            'Morris μ*': self.morris[indicateur][0],
+            'Morris σ': self.morris[indicateur][1],
+            'Sobol S1': self.sobol[indicateur][0],
+            'Sobol ST': self.sobol[indicateur][1],
+        })
+        amplitude = (df['Écart haut'] - df['Écart bas']).abs()
+        return df.iloc[np.argsort(-amplitude.to_numpy(), kind='stable')].reset_index(drop=True)
+
+class ModelePrevision:
+    """Tendance linéaire et lissage de Holt ajustés à toutes les colonnes d'un DataFrame à la fois.
+    
+    La tendance est un seul moindres carrés pour toutes les colonnes ; le lissage de Holt ne
+    boucle que sur le temps, vectorisé sur (grille alpha × beta, colonnes). Seuls les paramètres
+    ajustés sont conservés : une projection n'est qu'une évaluation vectorisée.
+    """
+    
+    MODELES = ('holt', 'tendance')
+    
+    def __init__(self, df, pas_par_an=1):
+        self.colonnes = [colonne for colonne in df.columns if colonne != 'Annee']
+        self.pas_par_an = pas_par_an
+        annees = df['Annee'].to_numpy(dtype=float)
+        valeurs = df[self.colonnes].to_numpy(dtype=float)
+        self.derniere_annee = annees[-1]
+        n = len(annees)
+        
+        # Tendance : origine des temps à la dernière observation (projection bien conditionnée)
+        x = np.column_stack([np.ones(n), annees - self.derniere_annee])
+        self.coefficients = np.linalg.lstsq(x, valeurs, rcond=None)[0]
+        residus = valeurs - x @ self.coefficients
+        self.sigma_tendance = np.sqrt((residus ** 2).sum(axis=0) / max(n - 2, 1))
+        self.covariance_tendance = np.linalg.pinv(x.T @ x)
+        
+        # Holt : toutes les constantes de la grille et toutes les colonnes en parallèle
+        alpha, beta = (np.array(grille, dtype=float)[:, None] for grille in zip(*GRILLE_HOLT))
+        niveau = np.broadcast_to(valeurs[0], (len(GRILLE_HOLT), len(self.colonnes))).copy()
+        pente = np.broadcast_to(valeurs[min(1, n - 1)] - valeurs[0], niveau.shape).copy()
+        erreurs = np.zeros_like(niveau)
+        for observation in valeurs[1:]:
+            prediction = niveau + pente
+            erreurs += (observation - prediction) ** 2
+            nouveau_niveau = alpha * observation + (1 - alpha) * prediction
+            pente = beta * (nouveau_niveau - niveau) + (1 - beta) * pente
+            niveau = nouveau_niveau
+        meilleur = np.argmin(erreurs, axis=0)
+        colonnes = np.arange(len(self.colonnes))
+        self.alpha, self.beta = alpha[meilleur, 0], beta[meilleur, 0]
+        self.niveau, self.pente = niveau[meilleur, colonnes], pente[meilleur, colonnes]
+        self.sigma_holt = np.sqrt(erreurs[meilleur, colonnes] / max(n - 3, 1))
+    
+    def projeter(self, annees, modele='holt'):
+        """(centrale, bas, haut) aux années futures `annees`, tableaux (len(annees), n_colonnes)"""
+        annees = np.asarray(annees, dtype=float)
+        if modele == 'tendance':
+            x = np.column_stack([np.ones(len(annees)), annees - self.derniere_annee])
+            centrale = x @ self.coefficients
+            facteur = np.sqrt(1 + np.einsum('ij,jk,ik->i', x, self.covariance_tendance, x))[:, None]
+            ecart = Z_INTERVALLE * self.sigma_tendance * facteur
+        elif modele == 'holt':
+            horizons = np.rint((annees - self.derniere_annee) * self.pas_par_an)[:, None]
+            centrale = self.niveau + horizons * self.pente
+            # Variance à h pas : sigma² (1 + somme_{j<h} alpha² (1 + j beta)²)
+            j = np.arange(1, int(horizons.max(initial=1)))[:, None]
+            cumul = np.vstack([np.zeros((1, len(self.colonnes))),
+                               np.cumsum((self.alpha * (1 + j * self.beta)) ** 2, axis=0)])
+            ecart = Z_INTERVALLE * self.sigma_holt * np.sqrt(1 + cumul[horizons[:, 0].astype(int) - 1])
+        else:
+            raise ValueError(f"Modèle de prévision inconnu : {modele!r} (attendu : {', '.join(self.MODELES)})")
+        bas, haut = centrale - ecart, centrale + ecart
+        # Mêmes bornes que les séries simulées : indicateurs positifs, pourcentages plafonnés à 100
+        plafond = np.array([100 if colonne in COLONNES_POURCENTAGE else np.inf for colonne in self.colonnes])
+        return tuple(np.clip(serie, 0, plafond) for serie in (centrale, bas, haut))
+    
+    def frame(self, annees, modele='holt'):
+        """Projection au format long : Annee, Indicateur, Prevision, Bas, Haut"""
+        centrale, bas, haut = self.projeter(annees, modele)
+        n_t, n_c = centrale.shape
+        return pd.DataFrame({
+            'Annee': np.repeat(np.asarray(annees), n_c),
+            'Indicateur': pd.Categorical(np.tile(self.colonnes, n_t), categories=self.colonnes),
+            'Prevision': centrale.ravel(), 'Bas': bas.ravel(), 'Haut': haut.ravel(),
+        })
+
+class CalculIncremental:
+    """Génération incrémentale : seuls les indicateurs dont une entrée a changé sont recalculés.
+    
+    Chaque colonne produite est mémorisée avec la signature de ses entrées (horizon, paramètres
+    lus d'après DEPENDANCES_CONFIG, facteur de scénario) ; les autres sont réutilisées telles quelles.
+    """
+    
+    def __init__(self, moteur):
+        self.moteur = moteur
+        self._colonnes = {}        # indicateur -> (signature, ndarray en lecture seule)
+        self.recalculees = 0
+        self.reutilisees = 0
+        self.dernier_appel = (0, 0)
+    
+    def __len__(self):
+        return len(self._colonnes)
+    
+    def octets(self):
+        """Mémoire des colonnes mémorisées"""
+        return sum(valeurs.nbytes for _, valeurs in self._colonnes.values())
+    
+    def generer(self, selection, scenario=SCENARIO_REFERENCE, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN,
+                resolution="annuelle", surcharges=None):
+        """Même résultat que generate_advanced_data, en réutilisant les colonnes inchangées"""
+        config = self.moteur.get_advanced_config(selection)
+        config.update(surcharges or {})
+        horizon = (annee_debut, annee_fin, resolution)
+        annees = None
+        
+        colonnes = list(COLONNES_BASE)
+        for priorite, bloc in BLOCS_PRIORITES.items():
+            if priorite in config.get('priorites', []):
+                colonnes.extend(bloc)
+        
+        data = {}
+        recalculees = reutilisees = 0
+        for colonne in colonnes:
+            signature = (
+                horizon,
+                tuple(config.get(cle, PARAMETRES_DEFAUT[cle]) for cle in DEPENDANCES_CONFIG.get(colonne, ())),
+                MODIFICATEURS_SCENARIOS[scenario].get(colonne, 1.0)
+            )
+            memorise = self._colonnes.get(colonne)
+            if memorise is not None and memorise[0] == signature:
+                data[colonne] = memorise[1]
+                reutilisees += 1
+                continue
+            if annees is None:
+                annees = generer_axe_temporel(annee_debut, annee_fin, resolution)
+            valeurs = self.moteur.simuler_colonne(colonne, annees, config, scenario)
+            self._colonnes[colonne] = (signature, valeurs)
+            data[colonne] = valeurs
+            recalculees += 1
+        
+        if annees is None:
+            annees = generer_axe_temporel(annee_debut, annee_fin, resolution)
+        self.recalculees += recalculees
+        self.reutilisees += reutilisees
+        self.dernier_appel = (recalculees, reutilisees)
+        return pd.DataFrame({'Annee': typer_annees(annees), **data}, copy=False), config
+
+# Métadonnée Parquet des fichiers du dataset batch : nombre de pas de temps par année
+CLE_PAS_PAR_AN = b'pas_par_an'
+
+class DatasetSimulations:
+    """Grilles précalculées par generation_batch.py, lues dans un dataset Parquet partitionné.
+    
+    Les fichiers sont mappés en mémoire : les workers d'un même hôte partagent le cache de
+    pages du système. Seule la tranche demandée est matérialisée (filtre poussé jusqu'aux
+    partitions Selection/Scenario et aux statistiques des row groups pour Annee).
+    """
+    
+    def __init__(self, racine):
+        self.racine = racine
+        self._ouvrir()
+    
+    def _ouvrir(self):
+        """(Re)liste les fichiers du dataset ; appelé de nouveau après une régénération"""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.fs as fs
+        
+        racine = self.racine
+        systeme = fs.LocalFileSystem(use_mmap=True)
+        partitionnement = ds.partitioning(
+            pa.schema([('Selection', pa.string()), ('Scenario', pa.string())]), flavor='hive'
+        )
+        brut = ds.dataset(racine, filesystem=systeme, format='parquet', partitioning=partitionnement)
+        schemas = [fragment.physical_schema for fragment in brut.get_fragments()]
+        # Les sélections n'ont pas toutes les mêmes colonnes : schéma unifié sur tous les fichiers
+        schema = pa.unify_schemas(schemas + [partitionnement.schema])
+        self._dataset = ds.dataset(racine, filesystem=systeme, format='parquet',
+                                   partitioning=partitionnement, schema=schema)
+        # Pas par an écrit par generation_batch.py ; inconnu (None) si absent ou différent selon les fichiers
+        pas = {(s.metadata or {}).get(CLE_PAS_PAR_AN) for s in schemas}
+        self.pas_par_an = int(pas.pop()) if len(pas) == 1 and None not in pas else None
+    
+    def charger(self, selection, scenario, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN):
+        """DataFrame d'une sélection et d'un scénario sur [annee_debut, annee_fin] (vide si absent)"""
+        import pyarrow.dataset as ds
+        
+        filtre = ((ds.field('Selection') == selection) & (ds.field('Scenario') == scenario)
+                  & (ds.field('Annee') >= annee_debut) & (ds.field('Annee') < annee_fin + 1))
+        try:
+            table = self._dataset.to_table(filter=filtre)
+        except OSError:
+            # Fichiers remplacés par une régénération depuis l'ouverture : nouvelle liste, un seul essai
+            self._ouvrir()
+            table = self._dataset.to_table(filter=filtre)
+        table = table.drop_columns(['Selection', 'Scenario'])
+        # Colonnes de programmes absentes de cette sélection : entièrement nulles après unification
+        table = table.select([nom for nom, colonne in zip(table.column_names, table.columns)
+                              if colonne.null_count < len(colonne) or len(colonne) == 0])
+        df = table.to_pandas(split_blocks=True).sort_values('Annee', ignore_index=True)
+        return appliquer_schema(df)
+
+class CatalogueMissiles:
+    """Catalogue de systèmes de missiles en colonnes, trié par portée et indexé par type et statut.
+    
+    Un filtre de portée est une recherche dichotomique sur la colonne triée ; les filtres de type
+    et de statut lisent les positions des valeurs choisies dans les index inversés, restreintes
+    à cette tranche par dichotomie, puis les intersectent.
+    """
+    
+    COLONNES = ('Système', 'Type', 'Portée (km)', 'Ogives', 'Statut', 'Vitesse')
+    
+    def __init__(self, systemes):
+        noms = list(systemes)
+        portees = np.array([systemes[nom]['portee'] for nom in noms], dtype=np.int64)
+        ordre = np.argsort(portees, kind='stable')
+        specs = [systemes[noms[i]] for i in ordre]
+    
+        self.noms = np.array([noms[i] for i in ordre], dtype=object)
+        self.portees = portees[ordre]
+        self.ogives = np.array([str(s.get('ogives', 'N/A')) for s in specs], dtype=object)  # Nombre ou charge décrite
+        self.vitesses = np.array([s.get('vitesse', 'N/A') for s in specs], dtype=object)
+        self.types, self.codes_types = np.unique([s['type'] for s in specs], return_inverse=True)
+        self.statuts, self.codes_statuts = np.unique([s['statut'] for s in specs], return_inverse=True)
+        # Index inversés : valeur -> positions (croissantes, donc triées par portée)
+        self.index_types = {t: np.flatnonzero(self.codes_types == i) for i, t in enumerate(self.types)}
+        self.index_statuts = {s: np.flatnonzero(self.codes_statuts == i) for i, s in enumerate(self.statuts)}
+    
+    def __len__(self):
+        return len(self.noms)
+    
+    def figer(self):
+        """Colonnes et index en lecture seule ; renvoie le catalogue"""
+        for tableau in (self.noms, self.portees, self.ogives, self.vitesses, self.types, self.codes_types,
+                        self.statuts, self.codes_statuts, *self.index_types.values(), *self.index_statuts.values()):
+            tableau.flags.writeable = False
+        return self
+    
+    @staticmethod
+    def _positions_indexees(index, valeurs, debut, fin):
+        """Positions de [debut, fin) portant l'une des valeurs, lues dans un index inversé"""
+        morceaux = [
+            positions[np.searchsorted(positions, debut):np.searchsorted(positions, fin)]
+            for positions in (index.get(valeur) for valeur in set(valeurs)) if positions is not None
+        ]
+        return np.sort(np.concatenate(morceaux)) if morceaux else np.empty(0, dtype=np.int64)
+    
+    def filtrer(self, portee_min=None, portee_max=None, types=None, statuts=None):
+        """Positions (triées par portée) des systèmes satisfaisant tous les filtres donnés"""
+        debut = 0 if portee_min is None else np.searchsorted(self.portees, portee_min, side='left')
+        fin = len(self) if portee_max is None else np.searchsorted(self.portees, portee_max, side='right')
+        positions = np.arange(debut, max(fin, debut))
+        if types is not None:
+            positions = self._positions_indexees(self.index_types, types, debut, fin)
+        if statuts is not None:
+            positions = np.intersect1d(positions, self._positions_indexees(self.index_statuts, statuts, debut, fin),
+                                       assume_unique=True)
+        return positions
+    
+    def frame(self, positions=None):
+        """DataFrame des systèmes aux positions données (tout le catalogue par défaut)"""
+        if positions is None:
+            positions = slice(None)
+        colonnes = (self.noms, self.types[self.codes_types], self.portees, self.ogives,
+                    self.statuts[self.codes_statuts], self.vitesses)
+        return pd.DataFrame({nom: valeurs[positions] for nom, valeurs in zip(self.COLONNES, colonnes)})
+
+class RegistreFlotte:
+    """Registre de la flotte en colonnes, avec agrégats tenus à jour à chaque ajout de coque.
+    
+    Les colonnes croissent par doublement de capacité (ajout amorti en temps constant) ;
+    tonnage par type, groupe aérien embarqué et effectifs par statut se lisent sans parcours.
+    """
+    
+    TYPES_PORTE_AVIONS = {"Porte-avions"}
+    CLES_ARMEMENT = ('armement', 'missiles', 'torpilles')
+    
+    def __init__(self, actifs=None, capacite=64):
+        self.noms = np.empty(capacite, dtype=object)
+        self.types = np.empty(capacite, dtype=object)
+        self.deplacements = np.zeros(capacite, dtype=np.float64)
+        self.avions = np.zeros(capacite, dtype=np.int64)
+        self.armements = np.empty(capacite, dtype=object)
+        self.statuts = np.empty(capacite, dtype=object)
+        self.taille = 0
+        # Agrégats incrémentaux
+        self.tonnage_total = 0.0
+        self.tonnage_par_type = {}
+        self.coques_par_type = {}
+        self.coques_par_statut = {}
+        self.porte_avions = 0
+        self.avions_embarques = 0
+        self.fige = False
+        for nom, specs in (actifs or {}).items():
+            self.ajouter(nom, **specs)
+    
+    def __len__(self):
+        return self.taille
+    
+    def _agrandir(self):
+        for attribut in ('noms', 'types', 'deplacements', 'avions', 'armements', 'statuts'):
+            colonne = getattr(self, attribut)
+            nouvelle = np.empty(2 * len(colonne), dtype=colonne.dtype)
+            nouvelle[:self.taille] = colonne[:self.taille]
+            setattr(self, attribut, nouvelle)
+    
+    def ajouter(self, nom, type, deplacement, statut, avions=0, **autres):
+        """Ajoute une coque et met à jour les agrégats"""
+        if self.fige:
+            raise TypeError("Registre figé (partagé entre sessions) : ajout impossible")
+        if self.taille == len(self.noms):
+            self._agrandir()
+        i = self.taille
+        armement = next((autres[cle] for cle in self.CLES_ARMEMENT if cle in autres), 'N/A')
+        self.noms[i], self.types[i], self.armements[i], self.statuts[i] = nom, type, armement, statut
+        avions = int(avions)
+        self.deplacements[i] = deplacement
+        self.avions[i] = avions
+        self.taille += 1
+    
+        self.tonnage_total += deplacement
+        self.tonnage_par_type[type] = self.tonnage_par_type.get(type, 0.0) + deplacement
+        self.coques_par_type[type] = self.coques_par_type.get(type, 0) + 1
+        self.coques_par_statut[statut] = self.coques_par_statut.get(statut, 0) + 1
+        if type in self.TYPES_PORTE_AVIONS:
+            self.porte_avions += 1
+            self.avions_embarques += avions
+    
+    def figer(self):
+        """Interdit les ajouts et passe les colonnes en lecture seule ; renvoie le registre"""
+        self.fige = True
+        for attribut in ('noms', 'types', 'deplacements', 'avions', 'armements', 'statuts'):
+            getattr(self, attribut).flags.writeable = False
+        return self
+    
+    def agregats(self):
+        """Agrégats courants (coût indépendant du nombre de coques)"""
+        return {
+            'coques': self.taille,
+            'tonnage_total': self.tonnage_total,
+            'tonnage_par_type': dict(self.tonnage_par_type),
+            'coques_par_type': dict(self.coques_par_type),
+            'coques_par_statut': dict(self.coques_par_statut),
+            'porte_avions': self.porte_avions,
+            'avions_embarques': self.avions_embarques,
+        }
+    
+    def frame(self):
+        """DataFrame du registre (vues sur les colonnes remplies)"""
+        n = self.taille
+        return pd.DataFrame({
+            'Bâtiment': self.noms[:n], 'Type': self.types[:n], 'Déplacement (t)': self.deplacements[:n],
+            'Avions': self.avions[:n], 'Armement': self.armements[:n], 'Statut': self.statuts[:n],
+        })
+
+class CataloguesPartages:
+    """Catalogues de référence figés, partageables entre sessions sans risque de mutation croisée"""
+    
+    def __init__(self, branches_options, programmes_options, missile_systems, naval_assets):
+        self.branches_options = tuple(branches_options)
+        self.programmes_options = tuple(programmes_options)
+        self.missile_systems = figer(missile_systems)
+        self.naval_assets = figer(naval_assets)
+        self.catalogue_missiles = CatalogueMissiles(self.missile_systems).figer()
+        self.flotte = RegistreFlotte(self.naval_assets).figer()
+    
+    @classmethod
+    def depuis_moteur(cls, moteur):
+        """Catalogues issus des méthodes define_* d'un moteur"""
+        return cls(moteur.define_branches_options(), moteur.define_programmes_options(),
+                   moteur.define_missile_systems(), moteur.define_naval_assets())
+
+# Configurations avancées par sélection, figées : partagées par tout le processus
+CONFIGS_AVANCEES = figer({
+    "Forces Armées Indiennes": {
+        "type": "armee_totale",
+        "budget_base": 70.0,
+        "personnel_base": 1400,
+        "exercices_base": 120,
+        "priorites": ["nucleaire", "modernisation", "maritime", "cyber", "conventionnel"],
+        "doctrines": ["Dissuasion Crédible", "Défense Active", "Riposte Massive"],
+        "capacites_speciales": ["Forces Rapides", "Guerre Montagne", "Projection Maritime"]
+    },
+    "Forces Stratégiques": {
+        "type": "branche_strategique",
+        "personnel_base": 8,
+        "exercices_base": 15,
+        "priorites": ["triade_nucleaire", "missiles_balistiques", "sous_marins"],
+        "systemes_deployes": ["Agni-V", "Agni-IV", "Arihant", "Rafale"],
+        "commandement": "Commandement des Forces Stratégiques"
+    },
+    "Marine Indienne": {
+        "type": "branche_navale",
+        "personnel_base": 67,
+        "exercices_base": 40,
+        "priorites": ["porte_avions", "sous_marins", "lutte_anti_sous_marine", "projection"],
+        "flottes_principales": ["Flotte Orientale", "Flotte Occidentale", "Flotte du Sud"],
+        "navires_cles": ["Vikramaditya", "Vikrant", "Kolkata", "Arihant"]
+    },
+    "Programme Nucléaire Stratégique": {
+        "type": "programme_strategique",
+        "budget_base": 2.5,
+        "priorites": ["triade_nucleaire", "missiles_intercontinentaux", "sous_marins"],
+        "composantes": ["Forces Terrestres", "Forces Aériennes", "Forces Navales"],
+        "doctrine": "No First Use - Riposte Massive"
+    }
+})
+CONFIG_GENERIQUE = figer({
+    "type": "branche",
+    "personnel_base": 100,
+    "exercices_base": 25,
+    "priorites": ["defense_generique"]
+})
+
+class MoteurSimulationInde:
+    """Catalogues de référence et simulation des séries d'indicateurs"""
+    
+    def __init__(self, catalogues=None):
+        # Catalogues figés partagés entre instances (un seul exemplaire par processus) ; à défaut,
+        # construits au premier accès : les noyaux de simulation n'en ont pas besoin
+        if catalogues is not None:
+            self.catalogues = catalogues
+    
+    @functools.cached_property
+    def catalogues(self):
+        return CataloguesPartages.depuis_moteur(self)
+    
+    branches_options = property(lambda self: self.catalogues.branches_options)
+    programmes_options = property(lambda self: self.catalogues.programmes_options)
+    missile_systems = property(lambda self: self.catalogues.missile_systems)
+    naval_assets = property(lambda self: self.catalogues.naval_assets)
+    catalogue_missiles = property(lambda self: self.catalogues.catalogue_missiles)
+    flotte = property(lambda self: self.catalogues.flotte)
+    
+    def define_branches_options(self):
+        return [
+            "Forces Armées Indiennes", "Armée de Terre Indienne", "Marine Indienne", 
+            "Force Aérienne Indienne", "Forces Stratégiques", "Garde Côtière Indienne",
+            "Forces Spéciales", "Commandement des Forces Intégrées"
+        ]
+    
+    def define_programmes_options(self):
+        return [
+            "Programme Nucléaire Stratégique", "Modernisation des Forces", 
+            "Make in India - Défense", "Défense Aérienne Intégrée",
+            "Maritime Domain Awareness", "Cybersécurité", "Espace Militaire"
+        ]
+    
+    def define_missile_systems(self):
+        return copy.deepcopy(SYSTEMES_MISSILES)
+    
+    def define_naval_assets(self):
+        return copy.deepcopy(ACTIFS_NAVALS)
+    
+    def generate_advanced_data(self, selection, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN,
+                               resolution="annuelle", surcharges=None, scenario=SCENARIO_REFERENCE):
+        """Génère des données avancées et détaillées pour l'Inde"""
+        cube = self.calculer_cube_scenarios([selection], annee_debut, annee_fin, resolution,
+                                            surcharges, scenarios=[scenario])
+        return cube.frame(selection, scenario)
+    
+    def calculer_cube_scenarios(self, selections, annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN,
+                                resolution="annuelle", surcharges=None, scenarios=SCENARIOS):
+        """Tous les indicateurs sur la grille sélection × scénario × temps, en une passe vectorisée"""
+        annees = generer_axe_temporel(annee_debut, annee_fin, resolution)
+        
+        configs = []
+        for selection in selections:
+            config = self.get_advanced_config(selection)
+            config.update(surcharges or {})
+            configs.append(config)
+        
+        # Paramètres des sélections en colonne (n_selections, 1) : les noyaux diffusent sur le temps
+        config_vectorisee = {
+            cle: np.array([config.get(cle, defaut) for config in configs], dtype=float)[:, None]
+            for cle, defaut in PARAMETRES_DEFAUT.items()
+        }
+        forme = (len(selections), len(annees))
+        
+        # Indicateurs positifs : les tendances linéaires extrapolées loin de 2000 sont bornées à 0
+        series = {}
+        for colonne, (methode, avec_config) in COLONNES_BASE.items():
+            simuler = getattr(self, methode)
+            valeurs = np.maximum(simuler(annees, config_vectorisee) if avec_config else simuler(annees), 0)
+            series[colonne] = np.broadcast_to(valeurs.astype(SCHEMA_INDICATEURS[colonne]), forme)
+        
+        # Données spécifiques aux programmes, calculées une fois et masquées par sélection
+        presence = {}
+        for priorite, bloc in BLOCS_PRIORITES.items():
+            actives = np.array([priorite in config.get('priorites', []) for config in configs])
+            if not actives.any():
+                continue
+            for colonne, methode in bloc.items():
+                valeurs = np.maximum(getattr(self, methode)(annees), 0).astype(SCHEMA_INDICATEURS[colonne])
+                series[colonne] = np.broadcast_to(valeurs, forme)
+                presence[colonne] = actives
+        
+        facteurs = facteurs_scenarios(scenarios, annees)
+        forme_cube = (len(selections), len(scenarios), len(annees))
+        valeurs = {}
+        for colonne, serie in series.items():
+            if colonne in facteurs:
+                cube = serie[:, None, :] * facteurs[colonne][None, :, :]
+                if colonne in COLONNES_POURCENTAGE:
+                    np.minimum(cube, 100, out=cube)
+            else:
+                # Indicateur insensible aux scénarios : simple vue diffusée, sans copie
+                cube = np.broadcast_to(serie[:, None, :], forme_cube)
+            cube.flags.writeable = False
+            valeurs[colonne] = cube
+        
+        return CubeScenarios(selections, scenarios, typer_annees(annees), valeurs, presence, configs)
+    
+    def simuler_colonne(self, colonne, annees, config, scenario=SCENARIO_REFERENCE):
+        """Un indicateur pour une sélection et un scénario, au type du schéma (lecture seule)"""
+        if colonne in COLONNES_BASE:
+            methode, avec_config = COLONNES_BASE[colonne]
+            simuler = getattr(self, methode)
+            valeurs = simuler(annees, config) if avec_config else simuler(annees)
+        else:
+            methode = next(bloc[colonne] for bloc in BLOCS_PRIORITES.values() if colonne in bloc)
+            valeurs = getattr(self, methode)(annees)
+        valeurs = np.maximum(valeurs, 0)
+        facteurs = facteurs_scenarios([scenario], annees)
+        if colonne in facteurs:
+            valeurs = valeurs * facteurs[colonne][0]
+            if colonne in COLONNES_POURCENTAGE:
+                valeurs = np.minimum(valeurs, 100)
+        valeurs = np.asarray(valeurs).astype(SCHEMA_INDICATEURS[colonne])
+        valeurs.flags.writeable = False
+        return valeurs
+    
+    def monte_carlo(self, selection, scenario=SCENARIO_REFERENCE, n_tirages=100_000, taille_tranche=10_000,
+                    annee_debut=ANNEE_DEBUT, annee_fin=ANNEE_FIN, resolution="annuelle",
+                    quantiles=(5, 50, 95), processus=None, graine=0, n_classes=2000, surcharges=None,
+                    executeur=None):
+        """Bandes d'incertitude Monte Carlo : (annees, {indicateur: tableau (len(quantiles), n_temps)}).
+        
+        Les tirages sont produits par tranches de taille fixe sur `executeur` (à défaut, un pool
+        local) ; une tranche unique est calculée sur place. Chaque tranche est réduite en
+        histogrammes, ajoutés aux compteurs dès son retour ; au plus TRANCHES_EN_VOL_PAR_WORKER
+        tranches par worker sont en cours, ce qui borne la mémoire du parent.
+        """
+        annees = generer_axe_temporel(annee_debut, annee_fin, resolution)
+        config = self.get_advanced_config(selection)
+        config.update(surcharges or {})
+        graines = np.random.SeedSequence(graine).spawn(-(-n_tirages // taille_tranche) + 1)
+        
+        # Tranche pilote : fixe les bornes des histogrammes (avec marge) pour toutes les tranches
+        pilote = echantillonner_monte_carlo(config, scenario, annees, min(taille_tranche, 2000), graines[0])
+        bornes = {}
+        for indicateur, valeurs in pilote.items():
+            bas, haut = valeurs.min(axis=0), valeurs.max(axis=0)
+            marge = 0.25 * (haut - bas) + 1e-9
+            bornes[indicateur] = (bas - marge, haut + marge)
+        flux = {indicateur: PercentilesFlux(*bornes[indicateur], n_classes) for indicateur in bornes}
+        
+        def accumuler(histogrammes):
+            for indicateur, comptes in histogrammes.items():
+                flux[indicateur].comptes += comptes
+        
+        tailles = [min(taille_tranche, n_tirages - debut) for debut in range(0, n_tirages, taille_tranche)]
+        if len(tailles) == 1:
+            accumuler(_histogrammes_tranche(config, scenario, annees, tailles[0], graines[1], bornes, n_classes))
+        else:
+            en_vol_max = TRANCHES_EN_VOL_PAR_WORKER * (processus or os.cpu_count() or 1)
+            en_vol = set()
+            with _pool(executeur, processus) as pool:
+                for taille, graine_tranche in zip(tailles, graines[1:]):
+                    if len(en_vol) >= en_vol_max:
+                        terminees, en_vol = wait(en_vol, return_when=FIRST_COMPLETED)
+                        for future in terminees:
+                            accumuler(future.result())
+                    en_vol.add(pool.submit(_histogrammes_tranche, config, scenario, annees, taille,
+                                           graine_tranche, bornes, n_classes))
+                for future in as_completed(en_vol):
+                    accumuler(future.result())
+        
+        return annees, {indicateur: f.percentiles(quantiles) for indicateur, f in flux.items()}
+    
+    def analyse_sensibilite(self, selection, scenario=SCENARIO_REFERENCE, annee_debut=ANNEE_DEBUT,
+                            annee_fin=ANNEE_FIN, resolution="annuelle", surcharges=None,
+                            plage=PLAGE_SENSIBILITE, trajectoires=TRAJECTOIRES_MORRIS, taille_sobol=TAILLE_SOBOL,
+                            taille_tranche=8192, processus=None, graine=0, executeur=None):
+        """Analyse un-à-la-fois, Morris et Sobol des paramètres de PARAMETRES_DEFAUT.
+        
+        Les trois plans sont empilés en une seule matrice de vecteurs de paramètres, évaluée
+        par tranches vectorisées sur `executeur` (à défaut, un pool local).
+        """
+        annees = generer_axe_temporel(annee_debut, annee_fin, resolution)
+        config = self.get_advanced_config(selection)
+        config.update(surcharges or {})
+        noms = list(PARAMETRES_DEFAUT)
+        reference = np.array([float(config.get(cle, PARAMETRES_DEFAUT[cle])) for cle in noms])
+        bas, haut = reference * (1 - plage), reference * (1 + plage)
+        generateur = np.random.default_rng(graine)
+        
+        morris, ordres, pas = plan_morris(bas, haut, trajectoires, NIVEAUX_MORRIS, generateur)
+        plans = [plan_oat(bas, haut, reference), morris, plan_sobol(bas, haut, taille_sobol, generateur)]
+        matrice = np.concatenate(plans)
+        
+        tranches = [matrice[debut:debut + taille_tranche] for debut in range(0, len(matrice), taille_tranche)]
+        if len(tranches) == 1:
+            resultats = [evaluer_parametres(config, scenario, annees, noms, matrice)]
+        else:
+            with _pool(executeur, processus) as pool:
+                resultats = list(pool.map(evaluer_parametres, *zip(*[
+                    (config, scenario, annees, noms, tranche) for tranche in tranches
+                ])))
+        
+        k = len(noms)
+        fin_oat, fin_morris = 2 * k + 1, 2 * k + 1 + len(morris)
+        oat, effets, sobol, references = {}, {}, {}, {}
+        for indicateur in INDICATEURS_SENSIBILITE:
+            sorties = np.concatenate([resultat[indicateur] for resultat in resultats])
+            references[indicateur] = sorties[0]
+            oat[indicateur] = (sorties[1:k + 1], sorties[k + 1:fin_oat])
+            effets[indicateur] = effets_morris(sorties[fin_oat:fin_morris], ordres, pas)
+            sobol[indicateur] = indices_sobol(sorties[fin_morris:], taille_sobol, k)
+        return AnalyseSensibilite(noms, reference, plage, references, oat, effets, sobol, len(matrice))
+    
+    def get_advanced_config(self, selection):
+        """Configuration avancée avec plus de détails pour l'Inde (copie modifiable)"""
+        return degeler(self.config_partagee(selection))
+    
+    def config_partagee(self, selection):
+        """Configuration figée de la sélection, commune à toutes les instances"""
+        return CONFIGS_AVANCEES.get(selection, CONFIG_GENERIQUE)
+    
+    def simulate_advanced_budget(self, annees, config):
+        """Simulation avancée du budget avec variations géopolitiques"""
+        annees = np.asarray(annees)
+        parametre = lambda cle: config.get(cle, PARAMETRES_DEFAUT[cle])
+        base = parametre('budget_base') * (1 + parametre('croissance_budget') * (annees - 2000))
+        # Variations selon événements géopolitiques (premier cas vérifié l'emporte)
+        facteur = np.select(
+            [
+                (annees >= 2002) & (annees <= 2004),  # Tensions avec le Pakistan
+                (annees >= 2008) & (annees <= 2010),  # Modernisation accélérée
+                annees >= 2016,                       # Make in India
+                annees >= 2020,                       # Tensions avec la Chine
+            ],
+            [parametre('facteur_pakistan'), parametre('facteur_modernisation'),
+             parametre('facteur_make_in_india'), parametre('facteur_chine')],
+            default=1.0
+        )
+        return base * facteur
+    
+    def simulate_advanced_personnel(self, annees, config):
+        """Simulation avancée des effectifs"""
+        personnel_base = config.get('personnel_base', PARAMETRES_DEFAUT['personnel_base'])
+        croissance = config.get('croissance_personnel', PARAMETRES_DEFAUT['croissance_personnel'])
+        return personnel_base * (1 + croissance * (np.asarray(annees) - 2000))
+    
+    def simulate_military_gdp_percentage(self, annees):
+        """Pourcentage du PIB consacré à la défense"""
+        return 2.5 + 0.1 * (np.asarray(annees) - 2000)
+    
+    def simulate_advanced_exercises(self, annees, config):
+        """Exercices militaires avec saisonnalité"""
+        base = config.get('exercices_base', PARAMETRES_DEFAUT['exercices_base'])
+        delta = np.asarray(annees) - 2000
+        return base + 4 * delta + 8 * np.sin(2 * np.pi * delta / 4)
+    
+    def simulate_advanced_readiness(self, annees, config=None):
+        """Préparation opérationnelle avancée"""
+        annees = np.asarray(annees)
+        config = config or {}
+        parametre = lambda cle: config.get(cle, PARAMETRES_DEFAUT[cle])
+        base = 65 + parametre('pente_readiness') * (annees - 2000)
+        base = base + parametre('bonus_reformes') * (annees >= 2008)       # Réformes post-26/11
+        base = base + parametre('bonus_modernisation') * (annees >= 2014)  # Modernisation
+        base = base + parametre('bonus_experience') * (annees >= 2020)     # Expérience opérationnelle
+        return np.minimum(base, 90)
+    
+    def simulate_advanced_deterrence(self, annees):
+        """Capacité de dissuasion avancée"""
+        annees = np.asarray(annees)
+        base = np.select(
+            [annees < 1998, annees < 2003, annees < 2012, annees < 2018],
+            [0, 40, 60, 75],  # Pré-nucléaire, basique, balistique, triade en développement
+            default=85 + 1 * (annees - 2018)  # Triade opérationnelle
+        )
+        return np.minimum(base, 95)
+    
+    def simulate_advanced_mobilization(self, annees):
+        """Temps de mobilisation avancé"""
+        return np.maximum(45 - 1 * (np.asarray(annees) - 2000), 15)
+    
+    def simulate_missile_tests(self, annees):
+        """Tests de missiles"""
+        annees = np.asarray(annees)
+        return np.select(
+            [annees < 2006, annees < 2012],
+            [2, 4 + (annees - 2006)],
+            default=10 + 2 * (annees - 2012)
+        )
+    
+    def simulate_tech_development(self, annees):
+        """Développement technologique global"""
+        return np.minimum(50 + 2.5 * (np.asarray(annees) - 2000), 85)
+    
+    def simulate_artillery_capacity(self, annees):
+        """Capacité d'artillerie"""
+        return np.minimum(70 + 1.8 * (np.asarray(annees) - 2000), 90)
+    
+    def simulate_air_defense_coverage(self, annees):
+        """Couverture de défense anti-aérienne"""
+        return np.minimum(55 + 2.2 * (np.asarray(annees) - 2000), 88)
+    
+    def simulate_logistical_resilience(self, annees):
+        """Résilience logistique"""
+        return np.minimum(60 + 2 * (np.asarray(annees) - 2000), 87)
+    
+    def simulate_cyber_capabilities(self, annees):
+        """Capacités cybernétiques"""
+        return np.minimum(45 + 3 * (np.asarray(annees) - 2000), 82)
+    
+    def simulate_weapon_production(self, annees):
+        """Production d'armements (indice)"""
+        return np.minimum(55 + 2.8 * (np.asarray(annees) - 2000), 89)
+    
+    def simulate_nuclear_arsenal_size(self, annees):
+        """Évolution du stock d'ogives nucléaires"""
+        annees = np.asarray(annees)
+        stock = np.select(
+            [annees < 1998, annees < 2005, annees < 2015],
+            [0, 50 + 5 * (annees - 1998), 80 + 8 * (annees - 2005)],
+            default=150 + 10 * (annees - 2015)
+        )
+        return np.minimum(stock, 300)
+    
+    def simulate_missile_range_evolution(self, annees):
+        """Évolution de la portée maximale des missiles"""
+        annees = np.asarray(annees)
+        return np.select(
+            [annees < 2002, annees < 2007, annees < 2012, annees < 2018],
+            [
+                250,                            # Prithvi
+                700 + 200 * (annees - 2002),    # Agni-I/II
+                2000 + 500 * (annees - 2007),   # Agni-III
+                3500 + 500 * (annees - 2012),   # Agni-IV
+            ],
+            default=5000                        # Agni-V
+        )
+    
+    def simulate_submarine_capability(self, annees):
+        """Capacité sous-marine stratégique"""
+        annees = np.asarray(annees)
+        return np.where(annees >= 2009, np.minimum(20 + 4 * (annees - 2009), 85), 0)
+    
+    def simulate_underground_tests(self, annees):
+        """Essais souterrains et préparation"""
+        return np.minimum(60 + 2 * (np.asarray(annees) - 2000), 90)
+    
+    def simulate_new_systems(self, annees):
+        """Nouveaux systèmes déployés"""
+        return np.minimum(3 + 1.5 * (np.asarray(annees) - 2000), 40)
+    
+    def simulate_modernization_rate(self, annees):
+        """Taux de modernisation des équipements"""
+        return np.minimum(25 + 3.5 * (np.asarray(annees) - 2000), 80)
+    
+    def simulate_weapon_exports(self, annees):
+        """Exportations d'armes (milliards USD)"""
+        return np.minimum(0.1 + 0.3 * (np.asarray(annees) - 2000), 3)
+    
+    def simulate_naval_fleet(self, annees):
+        """Flotte navale de combat"""
+        return np.minimum(25 + 2 * (np.asarray(annees) - 2000), 70)
+    
+    def simulate_naval_range(self, annees):
+        """Portée de projection navale"""
+        return np.minimum(500 + 50 * (np.asarray(annees) - 2000), 2000)
+    
+    def simulate_joint_exercises(self, annees):
+        """Exercices combinés avec partenaires"""
+        return np.minimum(5 + 2 * (np.asarray(annees) - 2000), 35)
+    
+    def simulate_cyber_attacks(self, annees):
+        """Attaques cyber réussies (estimation)"""
+        return np.minimum(10 + 2 * (np.asarray(annees) - 2000), 60)
+    
+    def simulate_cyber_command(self, annees):
+        """Réseau de commandement cyber"""
+        return np.minimum(40 + 3 * (np.asarray(annees) - 2000), 85)
+    
+    def simulate_cyber_defense(self, annees):
+        """Capacités de cyber défense"""
+        return np.minimum(45 + 2.8 * (np.asarray(annees) - 2000), 83)
@@ -0,0 +1,189 @@
+# sources_donnees.py
+"""Sources des données de référence du dashboard (tables CSV, Parquet ou SQLite).
+
+Chaque backend lit une table par son nom ; `precharger` lance toutes les lectures
+en parallèle (asyncio, une lecture par thread). Les constantes ci-dessous sont le
+contenu par défaut et servent à construire la base SQLite embarquée :
+
+    python sources_donnees.py    # (re)crée donnees/reference.sqlite
+"""
+import asyncio
+import contextlib
+import os
+import queue
+import sqlite3
+import threading
+
+import pandas as pd
+
+from moteur_inde import ACTIFS_NAVALS, SYSTEMES_MISSILES
+
+# Tables de référence par défaut, en colonnes
+TENSIONS_REGIONALES = {
+    'Année': [1999, 2002, 2008, 2016, 2019, 2020, 2022],
+    'Niveau_Tension': [8, 7, 6, 5, 6, 8, 7],  # sur 10
+    'Conflit': ['Kargil', 'Parliament Attack', 'Mumbai', 'Uri', 'Pulwama', 'Galwan', 'LAC Skirmish']
+}
+SYSTEMES_ARMES = {
+    'Système': ['Rafale', 'Sukhoi Su-30MKI', 'Agni-V', 'INS Vikrant',
+               'BrahMos', 'Arjun MK-1A', 'Tejas MK-1A'],
+    'Portée (km)': [3700, 3000, 5000, 7500, 450, 500, 3000],
+    'Année Service': [2020, 2002, 2018, 2022, 2006, 2021, 2021],
+    'Statut': ['Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel', 'Opérationnel']
+}
+NIVEAUX_MODERNISATION = {
+    'Domaine': ['Forces Terrestres', 'Forces Stratégiques',
+              'Défense Aérienne', 'Marine', 'Force Aérienne'],
+    'Niveau 2000': [45, 30, 40, 35, 50],
+    'Niveau 2027': [80, 85, 82, 78, 85]
+}
+MATRICE_MENACES = {
+    'Type de Menace': ['Conflit Chine', 'Conflit Pakistan', 'Terrorisme Transfrontalier',
+                     'Guerre Cyber', 'Instabilité Maritime', 'Guerre de Montagne'],
+    'Probabilité': [0.6, 0.7, 0.8, 0.9, 0.5, 0.6],
+    'Impact': [0.8, 0.7, 0.6, 0.5, 0.6, 0.7],
+    'Niveau Préparation': [0.8, 0.9, 0.7, 0.6, 0.7, 0.8]
+}
+CAPACITES_REPONSE = {
+    'Scénario': ['Conflit Frontière Chine', 'Conflit Pakistan', 'Attaque Terroriste',
+               'Crise Maritime', 'Guerre Cyber'],
+    'Dissuasion': [0.8, 0.7, 0.3, 0.6, 0.4],
+    'Défense': [0.7, 0.8, 0.6, 0.7, 0.5],
+    'Riposte': [0.9, 0.9, 0.8, 0.8, 0.7]
+}
+
+def tabuler_catalogue(catalogue):
+    """Catalogue {nom: caractéristiques} -> DataFrame (une ligne par entrée, colonne 'nom')"""
+    return pd.DataFrame.from_dict(catalogue, orient='index').rename_axis('nom').reset_index()
+
+def catalogue_depuis_table(table):
+    """Inverse de tabuler_catalogue ; les cellules vides sont omises"""
+    return {
+        ligne.pop('nom'): {cle: valeur for cle, valeur in ligne.items() if pd.notna(valeur)}
+        for ligne in table.to_dict(orient='records')
+    }
+
+# Nom de table -> contenu par défaut
+TABLES_REFERENCE = {
+    'tensions': lambda: pd.DataFrame(TENSIONS_REGIONALES),
+    'systemes_armes': lambda: pd.DataFrame(SYSTEMES_ARMES),
+    'modernisation': lambda: pd.DataFrame(NIVEAUX_MODERNISATION),
+    'menaces': lambda: pd.DataFrame(MATRICE_MENACES),
+    'reponse': lambda: pd.DataFrame(CAPACITES_REPONSE),
+    'missiles': lambda: tabuler_catalogue(SYSTEMES_MISSILES),
+    'flotte': lambda: tabuler_catalogue(ACTIFS_NAVALS),
+}
+
+CHEMIN_SQLITE_EMBARQUE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'donnees', 'reference.sqlite')
+
+class SourceDonnees:
+    """Adaptateur de base : lecture synchrone d'une table, version asynchrone dans un thread"""
+    
+    def lire(self, table):
+        raise NotImplementedError
+    
+    async def lire_async(self, table):
+        return await asyncio.to_thread(self.lire, table)
+    
+    def fermer(self):
+        pass
+
+class SourceMemoire(SourceDonnees):
+    """Tables par défaut du module (aucun fichier requis)"""
+    
+    def lire(self, table):
+        return TABLES_REFERENCE[table]()
+
+class SourceCSV(SourceDonnees):
+    """Un fichier `<table>.csv` par table dans un répertoire"""
+    
+    def __init__(self, repertoire):
+        self.repertoire = repertoire
+    
+    def lire(self, table):
+        return pd.read_csv(os.path.join(self.repertoire, f"{table}.csv"))
+
+class SourceParquet(SourceDonnees):
+    """Un fichier `<table>.parquet` par table dans un répertoire"""
+    
+    def __init__(self, repertoire):
+        self.repertoire = repertoire
+    
+    def lire(self, table):
+        return pd.read_parquet(os.path.join(self.repertoire, f"{table}.parquet"))
+
+class SourceSQLite(SourceDonnees):
+    """Base SQLite en lecture seule, lue à travers un pool de connexions partagé entre threads"""
+    
+    def __init__(self, chemin, taille_pool=4):
+        self.chemin = chemin
+        self.taille_pool = taille_pool
+        self._libres = queue.LifoQueue()
+        self._ouvertes = []
+        self._verrou = threading.Lock()
+    
+    def _ouvrir(self):
+        return sqlite3.connect(f"file:{self.chemin}?mode=ro", uri=True, check_same_thread=False)
+    
+    @contextlib.contextmanager
+    def connexion(self):
+        """Emprunte une connexion au pool (ouverte à la demande, au plus `taille_pool`)"""
+        try:
+            connexion = self._libres.get_nowait()
+        except queue.Empty:
+            with self._verrou:
+                nouvelle = len(self._ouvertes) < self.taille_pool
+                if nouvelle:
+                    self._ouvertes.append(self._ouvrir())
+                    connexion = self._ouvertes[-1]
+            if not nouvelle:
+                connexion = self._libres.get()
+        try:
+            yield connexion
+        finally:
+            self._libres.put(connexion)
+    
+    def lire(self, table):
+        with self.connexion() as connexion:
+            return pd.read_sql_query(f'SELECT * FROM "{table}"', connexion)
+    
+    def fermer(self):
+        with self._verrou:
+            for connexion in self._ouvertes:
+                connexion.close()
+            self._ouvertes.clear()
+
+def ouvrir_source(specification=None):
+    """Source désignée par 'csv:<répertoire>', 'parquet:<répertoire>' ou 'sqlite:<fichier>'.
+    
+    Sans spécification : la base SQLite embarquée si elle existe, sinon les tables par défaut.
+    """
+    if not specification:
+        if os.path.exists(CHEMIN_SQLITE_EMBARQUE):
+            return SourceSQLite(CHEMIN_SQLITE_EMBARQUE)
+        return SourceMemoire()
+    backend, _, chemin = specification.partition(':')
+    backends = {'csv': SourceCSV, 'parquet': SourceParquet, 'sqlite': SourceSQLite}
+    if backend not in backends:
+        raise ValueError(f"Source de données inconnue : {specification!r} (attendu : {', '.join(backends)})")
+    return backends[backend](chemin)
+
+async def _precharger(source, tables):
+    tables_lues = await asyncio.gather(*(source.lire_async(table) for table in tables))
+    return dict(zip(tables, tables_lues))
+
+def precharger(source, tables=tuple(TABLES_REFERENCE)):
+    """Lit toutes les tables demandées en parallèle ; {table: DataFrame}"""
+    return asyncio.run(_precharger(source, list(tables)))
+
+def construire_sqlite(chemin=CHEMIN_SQLITE_EMBARQUE):
+    """(Re)crée la base SQLite à partir des tables par défaut"""
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    with contextlib.closing(sqlite3.connect(chemin)) as connexion:
+        for table, contenu in TABLES_REFERENCE.items():
+            contenu().to_sql(table, connexion, if_exists='replace', index=False)
+        connexion.commit()
+    return chemin
+
+if __name__ == "__main__":
+    print(f"Base de référence écrite : {construire_sqlite()}")
@@ -0,0 +1,121 @@
+# test_dashboard.py
+"""Tests des utilitaires du dashboard indépendants du rendu"""
+import os
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Dashboard import CacheDonnees, lttb  # noqa: E402
+from moteur_inde import ANNEE_DEBUT, ANNEE_FIN  # noqa: E402
+
+
+def test_lttb_serie_courte_conservee():
+    x = np.arange(50)
+    np.testing.assert_array_equal(lttb(x, np.sin(x), 50), x)
+    np.testing.assert_array_equal(lttb(x, np.sin(x), 2), x)
+
+
+def test_lttb_indices_ordonnes_avec_extremites():
+    x = np.arange(10_000) / 12
+    y = np.random.default_rng(0).normal(size=len(x)).cumsum()
+    indices = lttb(x, y, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_garde_les_pics():
+    """Un pic isolé domine l'aire des triangles de son seau : il est toujours retenu"""
+    x = np.arange(5_000, dtype=float)
+    y = np.zeros_like(x)
+    pics = [731, 2_500, 4_200]
+    y[pics] = [50.0, -80.0, 120.0]
+    assert set(pics) <= set(lttb(x, y, 100).tolist())
+
+
+def test_cache_donnees_hits_misses_et_lru():
+    cache = CacheDonnees(max_entrees=2)
+    appels = []
+
+    def calcul(valeur):
+        return lambda: appels.append(valeur) or valeur
+
+    assert cache.obtenir('a', calcul(1)) == 1
+    assert cache.obtenir('a', calcul(99)) == 1
+    cache.obtenir('b', calcul(2))
+    cache.obtenir('a', calcul(99))                 # 'a' redevient la plus récente
+    cache.obtenir('c', calcul(3))                  # évince 'b'
+    assert cache.obtenir('b', calcul(4)) == 4
+    assert appels == [1, 2, 3, 4]
+    statistiques = cache.statistiques()
+    assert (statistiques['hits'], statistiques['misses'], statistiques['evictions']) == (2, 4, 2)
+
+
+def test_cache_donnees_ttl_par_entree():
+    cache = CacheDonnees(ttl_secondes=3600)
+    cache.obtenir('court', lambda: 1, ttl_secondes=1e-9)
+    cache.obtenir('long', lambda: 1)
+    assert cache.obtenir('court', lambda: 2) == 2
+    assert cache.obtenir('long', lambda: 2) == 1
+
+
+def test_cache_donnees_copies_protegees():
+    """Modifier une valeur remise ne modifie pas l'entrée en cache"""
+    cache = CacheDonnees()
+    df = cache.obtenir('df', lambda: pd.DataFrame({'Annee': [2000, 2001], 'Valeur': [1.0, 2.0]}))
+    df.loc[0, 'Valeur'] = -1.0
+    df['Ajout'] = 0
+    relu = cache.obtenir('df', lambda: None)
+    assert relu.loc[0, 'Valeur'] == 1.0 and 'Ajout' not in relu.columns
+
+
+def test_cache_donnees_tables_figees_protegees():
+    """Dictionnaire figé de tables : les clés restent en lecture seule, les tables remises sont des copies"""
+    cache = CacheDonnees()
+    tables = cache.obtenir('tables', lambda: types.MappingProxyType({'t': pd.DataFrame({'x': [1, 2]})}))
+    assert isinstance(tables, types.MappingProxyType)
+    with pytest.raises(TypeError):
+        tables['u'] = pd.DataFrame()
+    tables['t'].loc[0, 'x'] = 5
+    tables['t']['y'] = 0
+    relu = cache.obtenir('tables', lambda: None)
+    assert relu['t'].loc[0, 'x'] == 1 and list(relu['t'].columns) == ['x']
+    assert relu is not tables and relu['t'] is not tables['t']
+    # Dictionnaires et listes : copies profondes
+    config = cache.obtenir('config', lambda: {'priorites': ['nucleaire']})
+    config['priorites'].append('cyber')
+    assert cache.obtenir('config', lambda: None) == {'priorites': ['nucleaire']}
+
+
+def test_source_affichee_est_celle_des_donnees(tmp_path, monkeypatch):
+    """Le panneau mémoire nomme le dataset seulement quand obtenir_donnees l'a réellement servi"""
+    pytest.importorskip("pyarrow")
+    from streamlit.testing.v1 import AppTest
+
+    import Dashboard
+    from generation_batch import generer_partitions
+
+    generer_partitions("Forces Armées Indiennes", str(tmp_path), ANNEE_DEBUT, ANNEE_FIN, "annuelle")
+    monkeypatch.setenv('DASHBOARD_INDE_DATASET', str(tmp_path))
+    Dashboard.obtenir_dataset.clear()
+
+    def source(app):
+        assert not app.exception
+        return next(c.value for c in app.sidebar.caption if c.value.startswith(("Source", "Cube", "Calcul")))
+
+    app = AppTest.from_file(Dashboard.__file__, default_timeout=120)
+    app.run()
+    assert source(app) == f"Source : dataset Parquet {tmp_path}"
+    # Résolution absente du dataset : calcul du cube à la volée
+    app.selectbox(key='resolution').set_value("trimestrielle").run()
+    assert source(app).startswith("Cube")
+    app.selectbox(key='resolution').set_value("annuelle").run()
+    # Horizon débordant le dataset : calcul du cube à la volée
+    app.slider(key='horizon').set_value((ANNEE_DEBUT - 10, ANNEE_FIN)).run()
+    assert source(app).startswith("Cube")
+    Dashboard.obtenir_dataset.clear()
@@ -0,0 +1,83 @@
+# test_export.py
+"""Export hors ligne du rapport : page HTML autonome assemblée à partir des figures rendues par le pool"""
+import io
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from plotly.offline import get_plotlyjs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export_rapport import ExportRapport, png_disponible  # noqa: E402
+
+
+class FigureCassee:
+    """Figure dont le rendu échoue dans le worker"""
+
+    def to_html(self, **options):
+        raise RuntimeError("rendu impossible")
+
+
+@pytest.fixture
+def donnees():
+    return pd.DataFrame({'Annee': range(2000, 2006), 'Budget': [60.0, 64.0, 70.0, 73.0, 77.0, 80.0],
+                         'Readiness': [65.0, 66.5, 68.0, 69.5, 71.0, 72.5]})
+
+
+def sections(donnees):
+    return [
+        ("Tableau de bord", "<p>Métriques</p>", [
+            (colonne, go.Figure(go.Scatter(x=donnees['Annee'].tolist(), y=donnees[colonne].tolist(), name=colonne)))
+            for colonne in ('Budget', 'Readiness')
+        ]),
+        ("Doctrine <No First Use>", "<p>Texte statique</p>", []),
+        ("Menaces", "", [('cassee', FigureCassee())]),
+    ]
+
+
+def exporter(donnees, png=False):
+    with ThreadPoolExecutor(max_workers=2) as executeur:
+        export = ExportRapport("Rapport & test", sections(donnees), executeur, css='<style></style>', png=png)
+    assert export.termine()
+    return export
+
+
+def test_export_html_sections_et_figures(donnees):
+    export = exporter(donnees)
+    assert export.progression() == (3, 3)
+    assert export.erreurs() == {'cassee': "rendu impossible"}
+    page = export.html().decode('utf-8')
+    assert page.startswith('<!DOCTYPE html>') and page.endswith('</body></html>')
+    assert '<title>Rapport &amp; test</title>' in page
+    # Sections dans l'ordre, titres échappés, y compris une section sans figure
+    positions = [page.index(f'<h3 class="section-header">{titre}</h3>')
+                 for titre in ("Tableau de bord", "Doctrine &lt;No First Use&gt;", "Menaces")]
+    assert positions == sorted(positions)
+    # Une division par figure rendue, plotly.js embarqué une seule fois
+    assert page.count('class="plotly-graph-div"') == 2
+    assert page.count(get_plotlyjs()) == 1
+    # Chaque trace exportée garde une valeur par ligne du tableau source
+    traces = re.findall(r'"x":\[([^\]]*)\],"y":\[([^\]]*)\]', page)
+    assert len(traces) == 2
+    for x, y in traces:
+        assert len(x.split(',')) == len(y.split(',')) == len(donnees)
+    # Assemblée une fois, puis servie telle quelle
+    assert export.html() is export.html()
+
+
+def test_archive_png_vide_sans_png(donnees):
+    archive = zipfile.ZipFile(io.BytesIO(exporter(donnees).archive_png()))
+    assert archive.namelist() == []
+
+
+@pytest.mark.skipif(not png_disponible(), reason="kaleido non installé")
+def test_archive_png_une_image_par_figure(donnees):
+    archive = zipfile.ZipFile(io.BytesIO(exporter(donnees, png=True).archive_png()))
+    assert sorted(archive.namelist()) == ['Budget.png', 'Readiness.png']
+    assert all(archive.read(nom).startswith(b'\x89PNG') for nom in archive.namelist())
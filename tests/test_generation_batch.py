@@ -0,0 +1,58 @@
+# test_generation_batch.py
+"""Aller-retour du dataset Parquet : écriture par generation_batch, lecture par DatasetSimulations"""
+import os
+import sys
+from urllib.parse import unquote
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("pyarrow")
+
+from generation_batch import generer_partitions  # noqa: E402
+from moteur_inde import SCENARIOS, DatasetSimulations, MoteurSimulationInde, appliquer_schema  # noqa: E402
+
+BRANCHE = "Marine Indienne"
+PROGRAMME = "Programme Nucléaire Stratégique"
+DEBUT, FIN = 2000, 2012
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    racine = str(tmp_path_factory.mktemp("simulations"))
+    for selection in (BRANCHE, PROGRAMME):
+        generer_partitions(selection, racine, DEBUT, FIN, "trimestrielle")
+    return DatasetSimulations(racine)
+
+
+@pytest.mark.parametrize("selection", [BRANCHE, PROGRAMME])
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_aller_retour_identique_a_la_generation(dataset, selection, scenario):
+    """Colonnes (celles de la sélection seulement), types et valeurs relus à l'identique"""
+    attendu, _ = MoteurSimulationInde().generate_advanced_data(selection, DEBUT, FIN, "trimestrielle",
+                                                                 scenario=scenario)
+    pd.testing.assert_frame_equal(dataset.charger(selection, scenario, DEBUT, FIN), appliquer_schema(attendu))
+
+
+def test_resolution_enregistree(dataset):
+    assert dataset.pas_par_an == 4
+
+
+def test_partitions_elaguees(dataset):
+    """Le filtre Selection/Scenario ne retient qu'un seul fichier sur les huit écrits"""
+    import pyarrow.dataset as ds
+
+    assert len(list(dataset._dataset.get_fragments())) == 2 * len(SCENARIOS)
+    filtre = (ds.field('Selection') == PROGRAMME) & (ds.field('Scenario') == SCENARIOS[1])
+    fragments = list(dataset._dataset.get_fragments(filter=filtre))
+    assert len(fragments) == 1 and f"Selection={PROGRAMME}" in unquote(fragments[0].path)
+
+
+def test_horizon_hors_dataset(dataset):
+    """Horizon débordant ou absent : lignes manquantes, que le dashboard détecte pour calculer à la volée"""
+    debordant = dataset.charger(BRANCHE, SCENARIOS[0], DEBUT - 5, FIN + 5)
+    assert len(debordant) == (FIN - DEBUT + 1) * 4 and debordant['Annee'].iloc[0] == DEBUT
+    assert dataset.charger(BRANCHE, SCENARIOS[0], FIN + 10, FIN + 20).empty
+    assert dataset.charger("Sélection inconnue", SCENARIOS[0], DEBUT, FIN).empty
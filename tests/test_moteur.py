@@ -0,0 +1,502 @@
+# test_moteur.py
+"""Tests des noyaux numériques du moteur (sans Streamlit)"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from moteur_inde import (  # noqa: E402
+    ACTIFS_NAVALS, ANNEE_BASCULE_SCENARIO, ANNEE_DEBUT, ANNEE_FIN, COLONNES_POURCENTAGE, CONFIGS_AVANCEES,
+    DUREE_MONTEE_SCENARIO, MODIFICATEURS_SCENARIOS, SCENARIOS, SCENARIO_REFERENCE, CalculIncremental,
+    CatalogueMissiles, ModelePrevision, MoteurSimulationInde, PercentilesFlux, RegistreFlotte, degeler,
+    echantillonner_monte_carlo, effets_morris, figer, generer_axe_temporel, indices_sobol, plan_morris, plan_oat,
+    plan_sobol, taille_profonde
+)
+
+
+# Modèle linéaire de référence : y = somme c_i x_i, x_i uniforme sur [bas_i, haut_i]
+COEFFICIENTS = np.array([4.0, -2.0, 1.0, 0.0])
+BAS = np.array([0.0, 1.0, -1.0, 2.0])
+HAUT = np.array([1.0, 3.0, 2.0, 5.0])
+
+
+def modele_lineaire(plan):
+    return plan @ COEFFICIENTS
+
+
+def indices_lineaires():
+    """S1 = ST = part de variance c_i² (haut_i - bas_i)² / 12 de chaque paramètre"""
+    variances = COEFFICIENTS ** 2 * (HAUT - BAS) ** 2 / 12
+    return variances / variances.sum()
+
+
+def test_monte_carlo_centre_sur_les_surcharges():
+    """La médiane Monte Carlo suit la trajectoire déterministe d'une configuration surchargée"""
+    moteur = MoteurSimulationInde()
+    surcharges = {'croissance_budget': 0.09, 'croissance_personnel': 0.015}
+    df, _ = moteur.generate_advanced_data("Forces Armées Indiennes", surcharges=surcharges)
+    _, bandes = moteur.monte_carlo("Forces Armées Indiennes", n_tirages=20_000, surcharges=surcharges)
+    for indicateur in ('Budget_Defense_Mds', 'Personnel_Milliers'):
+        p5, p50, p95 = bandes[indicateur]
+        deterministe = df[indicateur].to_numpy()
+        assert np.all((p5 <= deterministe * 1.001) & (deterministe <= p95 * 1.001))
+        np.testing.assert_allclose(p50, deterministe, rtol=0.03)
+
+
+def test_plan_oat_deplace_un_parametre_a_la_fois():
+    reference = (BAS + HAUT) / 2
+    plan = plan_oat(BAS, HAUT, reference)
+    k = len(reference)
+    assert plan.shape == (2 * k + 1, k)
+    np.testing.assert_array_equal(plan[0], reference)
+    np.testing.assert_array_equal(np.diag(plan[1:k + 1]), BAS)
+    np.testing.assert_array_equal(np.diag(plan[k + 1:]), HAUT)
+    assert np.all((plan[1:k + 1] != reference).sum(axis=1) == 1)
+
+
+def test_morris_retrouve_les_effets_d_un_modele_lineaire():
+    """Effets élémentaires d'un modèle linéaire : constants, égaux à c_i (haut_i - bas_i)"""
+    plan, ordres, pas = plan_morris(BAS, HAUT, 30, 4, np.random.default_rng(1))
+    mu_etoile, sigma = effets_morris(modele_lineaire(plan), ordres, pas)
+    np.testing.assert_allclose(mu_etoile, np.abs(COEFFICIENTS) * (HAUT - BAS))
+    np.testing.assert_allclose(sigma, 0, atol=1e-9)
+
+
+def test_sobol_retrouve_les_indices_d_un_modele_lineaire():
+    """Saltelli (S1) et Jansen (ST) : les deux valent la part de variance de chaque paramètre"""
+    taille = 2 ** 15
+    plan = plan_sobol(BAS, HAUT, taille, np.random.default_rng(2))
+    premier_ordre, total = indices_sobol(modele_lineaire(plan), taille, len(BAS))
+    attendus = indices_lineaires()
+    np.testing.assert_allclose(premier_ordre, attendus, atol=0.03)
+    np.testing.assert_allclose(total, attendus, atol=0.03)
+    assert premier_ordre[-1] == 0 and total[-1] == 0
+
+
+def test_sobol_sortie_constante():
+    taille = 64
+    plan = plan_sobol(BAS, HAUT, taille, np.random.default_rng(3))
+    premier_ordre, total = indices_sobol(np.ones(len(plan)), taille, len(BAS))
+    np.testing.assert_array_equal(premier_ordre, 0)
+    np.testing.assert_array_equal(total, 0)
+
+
+def test_percentiles_flux_approche_les_percentiles_exacts():
+    """Tranche par tranche ou fusionnés, les percentiles tombent à une classe près des valeurs exactes"""
+    generateur = np.random.default_rng(4)
+    echantillons = generateur.normal([0.0, 10.0, 100.0], [1.0, 2.0, 30.0], size=(40_000, 3))
+    bornes_min, bornes_max = np.array([-6.0, -2.0, -80.0]), np.array([6.0, 22.0, 280.0])
+    quantiles = (5, 50, 95)
+
+    flux = PercentilesFlux(bornes_min, bornes_max, 1000)
+    for tranche in np.array_split(echantillons, 7):
+        flux.ajouter(tranche)
+    exacts = np.percentile(echantillons, quantiles, axis=0)
+    np.testing.assert_allclose(flux.percentiles(quantiles), exacts, atol=2 * flux.largeur.max())
+
+    moities = [PercentilesFlux(bornes_min, bornes_max, 1000).ajouter(m) for m in np.array_split(echantillons, 2)]
+    np.testing.assert_array_equal(moities[0].fusionner(moities[1]).comptes, flux.comptes)
+
+
+def test_percentiles_flux_hors_bornes_dans_les_classes_extremes():
+    flux = PercentilesFlux([0.0], [1.0], 10).ajouter(np.array([[-5.0], [0.5], [7.0]]))
+    assert flux.comptes[0, 0] == 1 and flux.comptes[0, -1] == 1 and flux.comptes.sum() == 3
+
+
+def serie_lineaire(colonne, debut, pente, annees=np.arange(2000, 2028)):
+    return pd.DataFrame({'Annee': annees, colonne: debut + pente * (annees - annees[0])})
+
+
+def test_prevision_prolonge_une_tendance_exacte():
+    df = serie_lineaire('Budget_Defense_Mds', 20.0, 3.0)
+    modele = ModelePrevision(df)
+    futures = np.arange(2028, 2036)
+    attendu = 20.0 + 3.0 * (futures - 2000)
+    for nom in ModelePrevision.MODELES:
+        centrale, bas, haut = modele.projeter(futures, nom)
+        np.testing.assert_allclose(centrale[:, 0], attendu, rtol=1e-9)
+        np.testing.assert_allclose(haut[:, 0] - bas[:, 0], 0, atol=1e-6)
+
+    long_df = modele.frame(futures)
+    assert list(long_df.columns) == ['Annee', 'Indicateur', 'Prevision', 'Bas', 'Haut']
+    assert len(long_df) == len(futures)
+
+
+def test_prevision_bornee_pour_les_pourcentages():
+    modele = ModelePrevision(serie_lineaire('Readiness_Operative', 60.0, 1.5))
+    centrale, bas, haut = modele.projeter(np.arange(2028, 2100), 'tendance')
+    assert centrale.max() == 100 and haut.max() == 100 and bas.min() >= 0
+
+
+def test_prevision_modele_inconnu():
+    with pytest.raises(ValueError):
+        ModelePrevision(serie_lineaire('Budget_Defense_Mds', 1.0, 1.0)).projeter([2030], 'arima')
+
+
+def test_calcul_incremental_identique_et_ne_recalcule_que_les_dependants():
+    moteur = MoteurSimulationInde()
+    calcul = CalculIncremental(moteur)
+    selection = "Forces Armées Indiennes"
+    for surcharges in ({}, {'croissance_budget': 0.09}):
+        df, _ = calcul.generer(selection, surcharges=surcharges)
+        attendu, _ = moteur.generate_advanced_data(selection, surcharges=surcharges)
+        pd.testing.assert_frame_equal(df, attendu)
+    # Seul le budget lit croissance_budget
+    assert calcul.dernier_appel == (1, len(df.columns) - 2)
+    assert len(calcul) == len(df.columns) - 1 and calcul.octets() > 0
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_tirages_monte_carlo_pourcentages_plafonnes(scenario):
+    """Comme le cube, les tirages d'un indicateur en pourcentage ne dépassent pas 100 sous scénario"""
+    annees = generer_axe_temporel(2000, 2060)
+    echantillons = echantillonner_monte_carlo(CONFIGS_AVANCEES["Forces Armées Indiennes"], scenario, annees, 500, 0)
+    for indicateur, valeurs in echantillons.items():
+        assert valeurs.min() >= 0
+        if indicateur in COLONNES_POURCENTAGE:
+            assert valeurs.max() <= 100
+
+
+def catalogue_aleatoire(n=400, graine=5):
+    """Catalogue synthétique à portées répétées, pour exercer dichotomie et index inversés"""
+    alea = np.random.default_rng(graine)
+    return {
+        f"Système-{i}": {
+            'type': str(alea.choice(['ICBM', 'IRBM', 'MRBM', 'SRBM', 'Croisière'])),
+            'portee': int(alea.choice([150, 300, 350, 700, 1500, 3000, 5000])),
+            'ogives': int(alea.integers(1, 4)),
+            'statut': str(alea.choice(['Opérationnel', 'En développement', 'Retiré'])),
+        }
+        for i in range(n)
+    }
+
+
+@pytest.mark.parametrize("portee_min, portee_max, types, statuts", [
+    (None, None, None, None),
+    (300, 1500, None, None),
+    (301, 349, None, None),
+    (None, None, ['ICBM', 'Croisière'], None),
+    (None, 700, None, ['Retiré']),
+    (350, 5000, ['IRBM', 'SRBM'], ['Opérationnel', 'En développement']),
+    (None, None, ['Hypersonique'], None),
+    (None, None, [], None),
+    (6000, None, None, None),
+])
+def test_catalogue_missiles_filtrer_comme_un_masque_pandas(portee_min, portee_max, types, statuts):
+    """Dichotomie sur la portée et index inversés donnent les lignes d'un filtre pandas brut"""
+    catalogue = CatalogueMissiles(catalogue_aleatoire()).figer()
+    tableau = catalogue.frame()
+    masque = pd.Series(True, index=tableau.index)
+    if portee_min is not None:
+        masque &= tableau['Portée (km)'] >= portee_min
+    if portee_max is not None:
+        masque &= tableau['Portée (km)'] <= portee_max
+    if types is not None:
+        masque &= tableau['Type'].isin(types)
+    if statuts is not None:
+        masque &= tableau['Statut'].isin(statuts)
+    positions = catalogue.filtrer(portee_min, portee_max, types, statuts)
+    np.testing.assert_array_equal(positions, np.flatnonzero(masque.to_numpy()))
+    assert np.all(np.diff(tableau['Portée (km)'].to_numpy()[positions]) >= 0)
+
+
+def test_catalogue_missiles_vide():
+    catalogue = CatalogueMissiles({}).figer()
+    assert len(catalogue) == 0
+    assert len(catalogue.filtrer(0, 1000, ['ICBM'], ['Opérationnel'])) == 0
+    assert list(catalogue.frame().columns) == list(CatalogueMissiles.COLONNES)
+
+
+def test_registre_flotte_agregats_apres_agrandissement():
+    """Agrégats incrémentaux identiques à un groupby, sur un registre passé par plusieurs doublements"""
+    alea = np.random.default_rng(6)
+    registre = RegistreFlotte(ACTIFS_NAVALS, capacite=4)
+    for i in range(61):
+        type_ = str(alea.choice(['Porte-avions', 'Destroyer', 'Frégate', 'Sous-marin Nucléaire']))
+        registre.ajouter(f"INS Test-{i}", type_, float(alea.integers(1_000, 45_000)),
+                         str(alea.choice(['Opérationnel', 'En construction'])),
+                         avions=int(alea.integers(10, 40)) if type_ == 'Porte-avions' else 0)
+    assert len(registre) == len(ACTIFS_NAVALS) + 61 and len(registre.noms) == 128
+
+    tableau = registre.frame()
+    agregats = registre.agregats()
+    porte_avions = tableau[tableau['Type'] == 'Porte-avions']
+    assert agregats['coques'] == len(tableau)
+    assert agregats['tonnage_total'] == pytest.approx(tableau['Déplacement (t)'].sum())
+    assert agregats['tonnage_par_type'] == pytest.approx(tableau.groupby('Type')['Déplacement (t)'].sum().to_dict())
+    assert agregats['coques_par_type'] == tableau.groupby('Type').size().to_dict()
+    assert agregats['coques_par_statut'] == tableau.groupby('Statut').size().to_dict()
+    assert agregats['porte_avions'] == len(porte_avions)
+    assert agregats['avions_embarques'] == porte_avions['Avions'].sum()
+    assert tableau['Bâtiment'].iloc[0] == next(iter(ACTIFS_NAVALS))
+
+
+def test_registre_flotte_fige():
+    registre = RegistreFlotte(ACTIFS_NAVALS).figer()
+    with pytest.raises(TypeError):
+        registre.ajouter("INS Test", "Frégate", 3_000, "Opérationnel")
+    with pytest.raises(ValueError):
+        registre.deplacements[0] = 0
+
+
+SELECTIONS_CUBE = ["Forces Armées Indiennes", "Marine Indienne", "Programme Nucléaire Stratégique"]
+
+
+@pytest.fixture(scope="module")
+def cube():
+    return MoteurSimulationInde().calculer_cube_scenarios(SELECTIONS_CUBE, 2015, 2035, "trimestrielle")
+
+
+@pytest.mark.parametrize("selection", SELECTIONS_CUBE)
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_cube_tranche_identique_a_une_generation_seule(cube, selection, scenario):
+    """Une tranche du cube batché égale la génération isolée de la sélection et du scénario"""
+    attendu, config = MoteurSimulationInde().generate_advanced_data(selection, 2015, 2035, "trimestrielle",
+                                                                     scenario=scenario)
+    tranche, config_tranche = cube.frame(selection, scenario)
+    pd.testing.assert_frame_equal(tranche, attendu)
+    assert config_tranche == config
+
+
+def test_cube_facteurs_de_scenario(cube):
+    """Chaque scénario est la référence multipliée par sa rampe (plafonnée à 100 pour les pourcentages)"""
+    annees = np.asarray(cube.annees, dtype=float)
+    rampe = np.clip((annees - ANNEE_BASCULE_SCENARIO + 1) / DUREE_MONTEE_SCENARIO, 0, 1)
+    j_reference = cube.scenarios.index(SCENARIO_REFERENCE)
+    for j, scenario in enumerate(cube.scenarios):
+        for colonne, valeurs in cube.valeurs.items():
+            intensite = MODIFICATEURS_SCENARIOS[scenario].get(colonne, 1.0)
+            attendu = valeurs[:, j_reference] * (1 + (intensite - 1) * rampe)
+            if colonne in COLONNES_POURCENTAGE:
+                attendu = np.minimum(attendu, 100)
+            np.testing.assert_allclose(valeurs[:, j], attendu, rtol=1e-5, err_msg=f"{scenario} / {colonne}")
+            # La rampe part de l'année précédant la bascule : avant, tous les scénarios coïncident
+            avant = annees <= ANNEE_BASCULE_SCENARIO - 1
+            np.testing.assert_array_equal(valeurs[:, j, avant], valeurs[:, j_reference, avant])
+
+
+def test_cube_lecture_seule_et_vues_diffusees(cube):
+    """Toutes les grilles sont en lecture seule ; un indicateur insensible aux scénarios n'est qu'une vue"""
+    sensibles = {colonne for modificateurs in MODIFICATEURS_SCENARIOS.values() for colonne in modificateurs}
+    for colonne, valeurs in cube.valeurs.items():
+        assert not valeurs.flags.writeable
+        with pytest.raises(ValueError):
+            valeurs[0, 0, 0] = 0
+        if colonne not in sensibles:
+            assert valeurs.strides[1] == 0
+    assert 'PIB_Militaire_Pourcent' not in sensibles
+    # Mémoire réelle : les axes diffusés ne sont pas comptés
+    assert cube.octets() < sum(valeurs.size * valeurs.itemsize for valeurs in cube.valeurs.values())
+
+
+def test_format_long_sans_les_colonnes_absentes_d_une_selection(cube):
+    """Format long de la comparaison : une ligne par (sélection, pas, indicateur) que la sélection possède"""
+    scenario = SCENARIOS[1]
+    long_df = cube.format_long(scenario)
+    assert list(long_df.columns) == ['Selection', 'Annee', 'Indicateur', 'Valeur']
+    for selection in SELECTIONS_CUBE:
+        attendu, _ = cube.frame(selection, scenario)
+        lignes = long_df[long_df['Selection'] == selection]
+        assert set(lignes['Indicateur'].astype(str)) == set(attendu.columns) - {'Annee'}
+        assert len(lignes) == (len(attendu.columns) - 1) * len(attendu)
+        large = lignes.pivot(index='Annee', columns='Indicateur', values='Valeur')
+        for colonne in large.columns.astype(str):
+            valeurs = large[colonne].to_numpy()
+            np.testing.assert_array_equal(valeurs, attendu[colonne].to_numpy(dtype=valeurs.dtype))
+    # Les colonnes de programme n'existent que pour la sélection qui a ces priorités
+    ogives = long_df[long_df['Indicateur'] == 'Stock_Ogives_Nucleaires']
+    assert set(ogives['Selection'].astype(str)) == {"Forces Armées Indiennes"}
+
+    restreint = cube.format_long(scenario, ['Budget_Defense_Mds', 'Indicateur inconnu'])
+    assert list(restreint['Indicateur'].cat.categories) == ['Budget_Defense_Mds']
+    assert len(restreint) == len(SELECTIONS_CUBE) * len(cube.annees)
+
+
+# Implémentations en boucle d'origine (une année à la fois), référence des noyaux vectorisés
+def budget_boucle(annee, config):
+    base = config.get('budget_base', 60.0) * (1 + 0.065 * (annee - 2000))
+    if 2002 <= annee <= 2004:
+        base *= 1.1
+    elif 2008 <= annee <= 2010:
+        base *= 1.15
+    elif annee >= 2016:
+        base *= 1.2
+    elif annee >= 2020:
+        base *= 1.25
+    return base
+
+
+def readiness_boucle(annee):
+    base = 65 + 1.5 * (annee - 2000)
+    if annee >= 2008:
+        base += 8
+    if annee >= 2014:
+        base += 7
+    if annee >= 2020:
+        base += 5
+    return min(base, 90)
+
+
+def dissuasion_boucle(annee):
+    if annee < 1998:
+        base = 0
+    elif annee < 2003:
+        base = 40
+    elif annee < 2012:
+        base = 60
+    elif annee < 2018:
+        base = 75
+    else:
+        base = 85 + 1 * (annee - 2018)
+    return min(base, 95)
+
+
+def essais_missiles_boucle(annee):
+    if annee < 2006:
+        return 2
+    elif annee < 2012:
+        return 4 + (annee - 2006)
+    return 10 + 2 * (annee - 2012)
+
+
+def ogives_boucle(annee):
+    if annee < 1998:
+        stock = 0
+    elif annee < 2005:
+        stock = 50 + 5 * (annee - 1998)
+    elif annee < 2015:
+        stock = 80 + 8 * (annee - 2005)
+    else:
+        stock = 150 + 10 * (annee - 2015)
+    return min(stock, 300)
+
+
+def portee_boucle(annee):
+    if annee < 2002:
+        return 250
+    elif annee < 2007:
+        return 700 + 200 * (annee - 2002)
+    elif annee < 2012:
+        return 2000 + 500 * (annee - 2007)
+    elif annee < 2018:
+        return 3500 + 500 * (annee - 2012)
+    return 5000
+
+
+def lineaire_boucle(depart, pente, plafond):
+    return lambda annee: min(depart + pente * (annee - 2000), plafond)
+
+
+COLONNES_BOUCLE = {
+    'Budget_Defense_Mds': budget_boucle,
+    'Personnel_Milliers': lambda annee, config: config.get('personnel_base', 1300) * (1 + 0.008 * (annee - 2000)),
+    'PIB_Militaire_Pourcent': lambda annee: 2.5 + 0.1 * (annee - 2000),
+    'Exercices_Militaires': lambda annee, config: (config.get('exercices_base', 80) + 4 * (annee - 2000)
+                                                   + 8 * np.sin(2 * np.pi * (annee - 2000) / 4)),
+    'Readiness_Operative': readiness_boucle,
+    'Capacite_Dissuasion': dissuasion_boucle,
+    'Temps_Mobilisation_Jours': lambda annee: max(45 - 1 * (annee - 2000), 15),
+    'Tests_Missiles': essais_missiles_boucle,
+    'Developpement_Technologique': lineaire_boucle(50, 2.5, 85),
+    'Capacite_Artillerie': lineaire_boucle(70, 1.8, 90),
+    'Couverture_AD': lineaire_boucle(55, 2.2, 88),
+    'Resilience_Logistique': lineaire_boucle(60, 2, 87),
+    'Cyber_Capabilities': lineaire_boucle(45, 3, 82),
+    'Production_Armements': lineaire_boucle(55, 2.8, 89),
+    'Stock_Ogives_Nucleaires': ogives_boucle,
+    'Portee_Max_Missiles_Km': portee_boucle,
+    'Essais_Souterrains': lineaire_boucle(60, 2, 90),
+    'Nouveaux_Systemes': lineaire_boucle(3, 1.5, 40),
+    'Taux_Modernisation': lineaire_boucle(25, 3.5, 80),
+    'Exportations_Armes': lineaire_boucle(0.1, 0.3, 3),
+    'Navires_Combat': lineaire_boucle(25, 2, 70),
+    'Portee_Projection_Nm': lineaire_boucle(500, 50, 2000),
+    'Exercices_Combines': lineaire_boucle(5, 2, 35),
+    'Attaques_Cyber_Reussies': lineaire_boucle(10, 2, 60),
+    'Reseau_Commandement_Cyber': lineaire_boucle(40, 3, 85),
+    'Cyber_Defense_Niveau': lineaire_boucle(45, 2.8, 83),
+}
+
+
+def sous_marine_boucle(annees):
+    """Version d'origine : les zéros d'avant 2009 sont ajoutés en fin de liste, pas en tête"""
+    return [min(20 + 4 * (annee - 2009), 85) for annee in annees if annee >= 2009] + [0] * (2009 - min(annees))
+
+
+@pytest.mark.parametrize("selection", [*CONFIGS_AVANCEES, "Armée de Terre"])
+def test_noyaux_vectorises_identiques_aux_boucles(selection):
+    """Sur l'horizon d'origine, chaque indicateur égale sa version en boucle, sauf Capacite_Sous_Marine"""
+    annees = list(range(ANNEE_DEBUT, ANNEE_FIN + 1))
+    df, config = MoteurSimulationInde().generate_advanced_data(selection)
+    assert df['Annee'].tolist() == annees
+    for colonne, boucle in COLONNES_BOUCLE.items():
+        if colonne not in df:
+            continue
+        avec_config = boucle.__code__.co_argcount == 2
+        attendu = [boucle(annee, config) if avec_config else boucle(annee) for annee in annees]
+        np.testing.assert_allclose(df[colonne], attendu, rtol=1e-6, err_msg=f"{selection} / {colonne}")
+    assert ('Capacite_Sous_Marine' in df) == ('nucleaire' in config['priorites'])
+
+
+def test_capacite_sous_marine_alignee_sur_les_annees():
+    """Seule divergence voulue : l'origine décalait la série de 2009 - min(annees) pas vers le passé"""
+    annees = list(range(ANNEE_DEBUT, ANNEE_FIN + 1))
+    vectorise = MoteurSimulationInde().simulate_submarine_capability(annees)
+    origine = np.array(sous_marine_boucle(annees))
+    decalage = 2009 - ANNEE_DEBUT
+    assert vectorise.shape == origine.shape
+    # Zéros avant 2009 et 20 points en 2009, là où l'origine plaçait 20 en 2000 et les zéros en fin de série
+    np.testing.assert_array_equal(vectorise[:decalage], 0)
+    assert vectorise[annees.index(2009)] == 20 and origine[0] == 20
+    np.testing.assert_array_equal(origine[-decalage:], 0)
+    np.testing.assert_array_equal(vectorise[decalage:], origine[:-decalage])
+    df, _ = MoteurSimulationInde().generate_advanced_data("Forces Armées Indiennes")
+    np.testing.assert_array_equal(df['Capacite_Sous_Marine'], vectorise.astype(np.float32))
+
+
+def test_tables_figees_refusent_les_ecritures():
+    """Configurations et catalogues partagés : dictionnaires en MappingProxyType, listes en tuples"""
+    moteur = MoteurSimulationInde()
+    config = CONFIGS_AVANCEES["Forces Armées Indiennes"]
+    with pytest.raises(TypeError):
+        config['budget_base'] = 0.0
+    with pytest.raises(AttributeError):
+        config['priorites'].append("spatial")
+    missiles = moteur.missile_systems
+    with pytest.raises(TypeError):
+        missiles['Agni-V']['portee'] = 0
+    with pytest.raises(TypeError):
+        del missiles['Agni-V']
+    assert isinstance(figer({'ensemble': {1, 2}})['ensemble'], frozenset)
+    # La copie de travail se modifie librement, sans atteindre la configuration partagée
+    modifiable = moteur.get_advanced_config("Forces Armées Indiennes")
+    modifiable['budget_base'] = 0.0
+    modifiable['priorites'].append("spatial")
+    assert config['budget_base'] == 70.0 and "spatial" not in config['priorites']
+
+
+def test_degeler_inverse_figer():
+    original = {'a': [1, {'b': [2, 3]}], 'c': (4, 5), 'd': 'texte'}
+    fige = figer(original)
+    copie = degeler(fige)
+    assert copie == {'a': [1, {'b': [2, 3]}], 'c': [4, 5], 'd': 'texte'}
+    copie['a'][1]['b'].append(9)
+    assert fige['a'][1]['b'] == (2, 3)
+    assert degeler(figer(copie)) == copie
+
+
+def test_taille_profonde_sans_double_compte():
+    """Une vue ne compte que son en-tête ; ce qu'atteignent les objets exclus n'est pas compté"""
+    tableau = np.zeros(100_000)
+    assert taille_profonde(tableau) == tableau.nbytes
+    assert taille_profonde({'a': tableau, 'b': tableau[::2]}) < 1.1 * tableau.nbytes
+    assert taille_profonde({'a': tableau}, exclus=[tableau]) < 1_000
+    df = pd.DataFrame({'x': np.arange(1_000)})
+    assert taille_profonde(df) == df.memory_usage(deep=True, index=True).sum()
+    catalogues = MoteurSimulationInde().catalogues
+    # Deux moteurs partageant les catalogues : le second ne coûte rien de plus
+    assert taille_profonde(MoteurSimulationInde(catalogues), exclus=[catalogues]) < 1_000